@@ -0,0 +1,135 @@
+from __future__ import annotations
+from typing import Any, Iterator
+from contextlib import contextmanager
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # NumPy is optional
+    np = None  # type: ignore
+
+BACKENDS = ("auto", "python", "numpy")
+
+# "auto" routes to NumPy only for operands with at least this quantity of elements,
+# on smaller ones the call overhead of NumPy is bigger than the pure Python loop
+AUTO_MIN_SIZE = 64
+
+_current = "auto"
+
+
+def numpy_available() -> bool:
+    """check, that NumPy is installed
+
+    returns:
+        True if NumPy can be used, else False
+    """
+    return np is not None
+
+
+def _check(name: str) -> None:
+    """validation of the backend name
+
+    args:
+        name (str): "auto", "python" or "numpy"
+    raises:
+        ValueError: if the backend is unknown
+        ImportError: if "numpy" is requested, but it isn't installed
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {BACKENDS}")
+    if name == "numpy" and np is None:
+        raise ImportError("The numpy backend requires NumPy to be installed")
+
+
+def set_backend(name: str) -> None:
+    """sets the global backend for task1 linear algebra
+
+    args:
+        name (str): "auto" (NumPy if installed, else pure Python), "python" or "numpy"
+    """
+    global _current
+    _check(name)
+    _current = name
+
+
+def get_backend() -> str:
+    """the global backend name
+
+    returns:
+        str: "auto", "python" or "numpy"
+    """
+    return _current
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[None]:
+    """context manager, that temporarily changes the global backend
+
+    args:
+        name (str): "auto", "python" or "numpy"
+    """
+    previous = get_backend()
+    set_backend(name)
+    try:
+        yield
+    finally:
+        set_backend(previous)
+
+
+def resolve(backend: str | None, size: int) -> str:
+    """chooses the backend for one call
+
+    args:
+        backend (str | None): backend of the call, None - the global one
+        size (int): quantity of elements of the operands
+    returns:
+        str: "python" or "numpy"
+    """
+    name = _current if backend is None else backend
+    _check(name)
+    if name == "auto":
+        return "numpy" if np is not None and size >= AUTO_MIN_SIZE else "python"
+    return name
+
+
+def np_dot(left: memoryview, right: memoryview) -> float:
+    """scalar product by NumPy (BLAS)"""
+    return float(np.dot(np.asarray(left), np.asarray(right)))
+
+
+def np_norm(data: memoryview) -> float:
+    """euclidean norm by NumPy (BLAS)"""
+    return float(np.linalg.norm(np.asarray(data)))
+
+
+def np_add(left: memoryview, right: memoryview) -> Any:
+    """elementwise addition of flat buffers by NumPy"""
+    return np.asarray(left) + np.asarray(right)
+
+
+def np_transpose(data: memoryview, rows: int, cols: int) -> Any:
+    """transposition of a flat row-major buffer by NumPy (result is C-contiguous)"""
+    return np.ascontiguousarray(np.asarray(data).reshape(rows, cols).T)
+
+
+def np_matmul(
+    left: memoryview, right: memoryview, rows: int, inner: int, cols: int
+) -> Any:
+    """matrix multiplication of flat row-major buffers by NumPy (BLAS)"""
+    return np.asarray(left).reshape(rows, inner) @ np.asarray(right).reshape(
+        inner, cols
+    )
+
+
+def np_matmul_transposed(
+    left: memoryview, right_t: memoryview, rows: int, inner: int, cols: int
+) -> Any:
+    """multiplication by the transposed right matrix (left * right_t^T) by NumPy (BLAS)"""
+    return (
+        np.asarray(left).reshape(rows, inner)
+        @ np.asarray(right_t).reshape(cols, inner).T
+    )
+
+
+def np_norms(data: memoryview, dim: int) -> Any:
+    """euclidean norms of the rows of a flat buffer (N x dim) by NumPy"""
+    return np.linalg.norm(np.asarray(data).reshape(-1, dim), axis=1)
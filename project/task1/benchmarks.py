@@ -0,0 +1,241 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterator, Sequence
+import json
+import pathlib
+import platform
+import random
+import time
+import tracemalloc
+from project.task1 import backend
+from project.task1.matrices import Matrix
+from project.task1.vectors import Vector
+
+# sizes of the cases: length of the vectors, side of the square matrices
+SIZES: dict[str, tuple[int, ...]] = {
+    "vector": (100, 10_000, 100_000),
+    "matrix": (16, 64, 128),
+}
+THRESHOLD = (
+    0.2  # a case is a regression, if it is more than 20% slower than the baseline
+)
+MIN_TIME = 0.2  # seconds of calls of one round of the timing
+
+# case name -> (kind of the size, setup: size -> the measured call)
+CASES: dict[str, tuple[str, Callable[[int], Callable[[], Any]]]] = {}
+
+
+def case(name: str, kind: str) -> Callable:
+    """registers a benchmark case
+
+    args:
+        name (str): name of the case
+        kind (str): "vector" or "matrix", the sizes of SIZES are used
+    returns:
+        Callable: decorator of the setup function (size -> the measured call)
+    """
+
+    def register(setup: Callable[[int], Callable[[], Any]]) -> Callable:
+        CASES[name] = (kind, setup)
+        return setup
+
+    return register
+
+
+def _values(count: int, seed: int) -> list[float]:
+    rnd = random.Random(seed)
+    return [rnd.uniform(-1, 1) for _ in range(count)]
+
+
+def _rows(n: int, seed: int) -> list[list[float]]:
+    values = _values(n * n, seed)
+    return [values[i * n : (i + 1) * n] for i in range(n)]
+
+
+@case("vector.mul", "vector")
+def _vector_mul(n: int) -> Callable[[], Any]:
+    a, b = Vector(_values(n, 1)), Vector(_values(n, 2))
+    return lambda: a * b
+
+
+@case("vector.norm", "vector")
+def _vector_norm(n: int) -> Callable[[], Any]:
+    a = Vector(_values(n, 1))
+    return lambda: a.norm()
+
+
+@case("vector.angle", "vector")
+def _vector_angle(n: int) -> Callable[[], Any]:
+    a, b = Vector(_values(n, 1)), Vector(_values(n, 2))
+    return lambda: a.angle(b)
+
+
+@case("vector.init", "vector")
+def _vector_init(n: int) -> Callable[[], Any]:
+    values = _values(n, 1)
+    return lambda: Vector(values)
+
+
+@case("matrix.add", "matrix")
+def _matrix_add(n: int) -> Callable[[], Any]:
+    a, b = Matrix(_rows(n, 1)), Matrix(_rows(n, 2))
+    return lambda: a + b
+
+
+@case("matrix.mul", "matrix")
+def _matrix_mul(n: int) -> Callable[[], Any]:
+    a, b = Matrix(_rows(n, 1)), Matrix(_rows(n, 2))
+    return lambda: a * b
+
+
+@case("matrix.transp", "matrix")
+def _matrix_transp(n: int) -> Callable[[], Any]:
+    a = Matrix(_rows(n, 1))
+    return lambda: a.transp().materialize()
+
+
+@case("matrix.init", "matrix")
+def _matrix_init(n: int) -> Callable[[], Any]:
+    rows = _rows(n, 1)
+    return lambda: Matrix(rows)
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> dict[str, float]:
+    """measures one call: speed (the best of the rounds), peak memory and allocations
+
+    args:
+        func (Callable[[], Any]): the measured call
+        repeat (int): quantity of timing rounds, every round lasts at least MIN_TIME
+    returns:
+        dict[str, float]: "ops_per_sec", "peak_bytes" - peak of the memory
+            allocated by one call, "allocations" - memory blocks, which are
+            allocated by one call and are still alive after it (the result...)
+    """
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= MIN_TIME:
+                break
+        best = max(best, calls / elapsed)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    own = [tracemalloc.Filter(False, tracemalloc.__file__)]  # the snapshots themselves
+    stats = after.filter_traces(own).compare_to(before.filter_traces(own), "filename")
+    allocations = sum(max(stat.count_diff, 0) for stat in stats)
+    return {"ops_per_sec": best, "peak_bytes": peak, "allocations": allocations}
+
+
+def default_backends() -> tuple[str, ...]:
+    """the backends of the cases: the pure Python kernels are always measured,
+    NumPy - when it is installed
+
+    returns:
+        tuple[str, ...]: "python" and "numpy" (if available)
+    """
+    return ("python", "numpy") if backend.numpy_available() else ("python",)
+
+
+def run(
+    sizes: dict[str, Sequence[int]] | None = None,
+    names: Sequence[str] | None = None,
+    repeat: int = 3,
+    backends: Sequence[str] | None = None,
+) -> Iterator[tuple[str, dict[str, float]]]:
+    """runs the cases for every size and backend (the global backend is pinned
+    during the setup and the measurement of a case)
+
+    args:
+        sizes (dict[str, Sequence[int]] | None): sizes of every kind, None - SIZES
+        names (Sequence[str] | None): names of the cases, None - all
+        repeat (int): quantity of timing rounds
+        backends (Sequence[str] | None): "python", "numpy", None - default_backends()
+    returns:
+        Iterator[tuple[str, dict[str, float]]]: "name[size]@backend" and the measurement
+    """
+    chosen: dict[str, Sequence[int]] = dict(SIZES if sizes is None else sizes)
+    for name in CASES if names is None else names:
+        kind, setup = CASES[name]
+        for size in chosen[kind]:
+            for pinned in default_backends() if backends is None else backends:
+                with backend.use_backend(pinned):
+                    result = measure(setup(size), repeat)
+                yield f"{name}[{size}]@{pinned}", result
+
+
+def report(results: dict[str, dict[str, float]]) -> dict[str, Any]:
+    """the JSON document of the results with the description of the machine
+    and of the backends (the global one and the availability of NumPy)
+
+    args:
+        results (dict[str, dict[str, float]]): measurements by names
+    returns:
+        dict[str, Any]: the document
+    """
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "backend": backend.get_backend(),
+        "numpy": backend.numpy_available(),
+        "results": results,
+    }
+
+
+def save(document: dict[str, Any], path: Any) -> None:
+    """saves the results (or the baseline) as JSON
+
+    args:
+        document (dict[str, Any]): the document of report()
+        path (str | os.PathLike): the file
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=True))
+
+
+def load(path: Any) -> dict[str, Any]:
+    """loads the saved results (or the baseline)
+
+    args:
+        path (str | os.PathLike): the file
+    returns:
+        dict[str, Any]: the document of report()
+    """
+    return dict(json.loads(pathlib.Path(path).read_text()))
+
+
+def compare(
+    document: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = THRESHOLD,
+) -> list[tuple[str, float, float]]:
+    """the cases, which are slower than the baseline by more than the threshold
+    (cases, which aren't in the baseline, are skipped)
+
+    args:
+        document (dict[str, Any]): the current results
+        baseline (dict[str, Any]): the baseline results
+        threshold (float): allowed relative slowdown (0.2 - 20%)
+    returns:
+        list[tuple[str, float, float]]: the name, baseline ops/sec and current ops/sec
+    """
+    regressions = []
+    for name, current in document["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        if current["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append((name, base["ops_per_sec"], current["ops_per_sec"]))
+    return regressions
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from typing import Any, cast
+from array import array
+import operator
+
+BLOCK_SIZE = 64  # tile side, 64 * 64 doubles (32 KB) fit into L1/L2 cache
+
+
+def as_buffer(values: Any) -> memoryview:
+    """wraps values into a flat memoryview of doubles ('d' format)
+
+    objects, that already export a one-dimensional buffer of doubles
+    (array.array('d'), memoryview, NumPy float64 array) are shared without copying,
+    everything else is copied into a new array.array('d')
+
+    args:
+        values (Any): any sequence of numbers or an object with the buffer protocol
+    returns:
+        memoryview: one-dimensional view of doubles
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return memoryview(array("d", values))
+
+    if view.format == "d" and view.ndim == 1:
+        return view
+    if view.format == "d" and view.c_contiguous:
+        # flatten C-contiguous n-dim buffers
+        return cast(memoryview, view.cast("B").cast("d"))
+    return memoryview(array("d", view.tolist()))
+
+
+def copy_buffer(view: memoryview) -> array:
+    """copies a (possibly strided) view of doubles into a new packed array
+
+    args:
+        view (memoryview): one-dimensional view of doubles
+    returns:
+        array: contiguous copy of the view
+    """
+    out = array("d")
+    if view.c_contiguous:
+        out.frombytes(view.cast("B"))
+    else:
+        out.frombytes(view.tobytes())
+    return out
+
+
+def zeros(size: int) -> array:
+    """a packed buffer of zeros
+
+    args:
+        size (int): quantity of elements
+    returns:
+        array: array('d') filled by zeros
+    """
+    return array("d", [0.0]) * size
+
+
+def transpose(data: memoryview, rows: int, cols: int) -> array:
+    """transposition of a flat row-major buffer
+
+    args:
+        data (memoryview): flat row-major buffer of doubles (rows x cols)
+        rows (int): quantity of rows
+        cols (int): quantity of columns
+    returns:
+        array: flat row-major buffer of the transposed matrix (cols x rows)
+    """
+    out = array("d")
+    for j in range(cols):
+        out.extend(copy_buffer(data[j::cols]))  # j-th column
+    return out
+
+
+def matmul(
+    left: memoryview,
+    right: memoryview,
+    rows: int,
+    inner: int,
+    cols: int,
+    block: int = BLOCK_SIZE,
+) -> array:
+    """cache-blocked matrix multiplication of flat row-major buffers
+
+    the right operand is transposed once, so both operands are read row by row
+    (contiguous memory), then the product is computed by matmul_transposed
+
+    args:
+        left (memoryview): flat buffer of the left matrix (rows x inner)
+        right (memoryview): flat buffer of the right matrix (inner x cols)
+        rows (int): rows of the left matrix
+        inner (int): columns of the left matrix (rows of the right matrix)
+        cols (int): columns of the right matrix
+        block (int): tile side
+    returns:
+        array: flat row-major buffer of the product (rows x cols)
+    """
+    out = zeros(rows * cols)
+    right_t = memoryview(transpose(right, inner, cols))
+    matmul_transposed(left, right_t, memoryview(out), rows, inner, cols, block)
+    return out
+
+
+def matmul_transposed(
+    left: memoryview,
+    right_t: memoryview,
+    out: memoryview,
+    rows: int,
+    inner: int,
+    cols: int,
+    block: int = BLOCK_SIZE,
+) -> None:
+    """cache-blocked multiplication by the already transposed right matrix
+
+    the product is computed by tiles: a tile of 'block' columns of the right matrix
+    is unpacked once and reused for every row of the left matrix,
+    every dot product is accumulated by sum(map(...)) without per-cell temporary lists
+
+    args:
+        left (memoryview): flat buffer of the left matrix (rows x inner)
+        right_t (memoryview): flat buffer of the transposed right matrix (cols x inner)
+        out (memoryview): flat buffer for the product (rows x cols), it is overwritten
+        rows (int): rows of the left matrix
+        inner (int): columns of the left matrix (rows of the right matrix)
+        cols (int): columns of the right matrix
+        block (int): tile side
+    """
+    if block <= 0:
+        raise ValueError("The block size must be positive")
+
+    mul = operator.mul
+    for k0 in range(0, cols, block):
+        k1 = min(k0 + block, cols)
+        col_tile = [
+            right_t[k * inner : (k + 1) * inner].tolist() for k in range(k0, k1)
+        ]
+        for i in range(rows):
+            row = left[i * inner : (i + 1) * inner].tolist()
+            base = i * cols + k0
+            for k, col in enumerate(col_tile):
+                out[base + k] = sum(map(mul, row, col))
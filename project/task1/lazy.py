@@ -0,0 +1,216 @@
+from __future__ import annotations
+from array import array
+from project.task1.matrices import Matrix, chain_plan, chain_product
+from project.task1.vectors import Vector
+
+
+class LazyMatrix:
+    """
+    The node of a lazy matrix expression: +, * and transp don't compute anything,
+    they build a tree, which is evaluated by .evaluate(), access by the index or ==.
+
+    The evaluator:
+        - fuses sums of any quantity of operands into one loop over the data,
+        - turns transpositions into swaps of strides (no copying),
+          (A + B)^T and (A * B)^T are pushed down to the leaves,
+        - multiplies chains of products in the optimal order (chain_plan).
+    """
+
+    def __init__(
+        self,
+        matrix: Matrix | None = None,
+        op: str = "leaf",
+        args: tuple[LazyMatrix, ...] = (),
+    ):
+        """constructor - a leaf over a matrix or an operation node
+
+        args:
+            matrix (Matrix | None): value of the leaf
+            op (str): "leaf", "add", "mul" or "transp"
+            args (tuple[LazyMatrix, ...]): operands of the operation
+        """
+        self.op = op
+        self.args = args
+        self._value: Matrix | None = matrix
+
+        if op == "leaf":
+            if matrix is None:
+                raise ValueError("The leaf must have a matrix")
+            self.shape = matrix.shape
+        elif op == "add":
+            if args[0].shape != args[1].shape:
+                raise ValueError("Matrices must be the same dimension")
+            self.shape = args[0].shape
+        elif op == "mul":
+            if args[0].shape[1] != args[1].shape[0]:
+                raise ValueError("Dimension error, must be n*k and k*m")
+            self.shape = (args[0].shape[0], args[1].shape[1])
+        elif op == "transp":
+            self.shape = (args[0].shape[1], args[0].shape[0])
+        else:
+            raise ValueError(f"Unknown operation {op!r}")
+
+    def __len__(self) -> int:
+        """length function (without evaluation)
+
+        returns:
+            int: quantity of rows
+        """
+        return self.shape[0]
+
+    def __add__(self, matrix: LazyMatrix | Matrix) -> LazyMatrix:
+        """lazy addition
+
+        args:
+            matrix (LazyMatrix | Matrix): another operand
+        returns:
+            LazyMatrix: the node of the addition
+        """
+        if not isinstance(matrix, (LazyMatrix, Matrix)):
+            return NotImplemented
+        return LazyMatrix(op="add", args=(self, _node(matrix)))
+
+    def __radd__(self, matrix: Matrix) -> LazyMatrix:
+        """lazy addition, when the left operand is a Matrix"""
+        if not isinstance(matrix, Matrix):
+            return NotImplemented
+        return LazyMatrix(op="add", args=(_node(matrix), self))
+
+    def __mul__(self, matrix: LazyMatrix | Matrix) -> LazyMatrix:
+        """lazy multiplication
+
+        args:
+            matrix (LazyMatrix | Matrix): another operand
+        returns:
+            LazyMatrix: the node of the multiplication
+        """
+        if not isinstance(matrix, (LazyMatrix, Matrix)):
+            return NotImplemented
+        return LazyMatrix(op="mul", args=(self, _node(matrix)))
+
+    def __rmul__(self, matrix: Matrix) -> LazyMatrix:
+        """lazy multiplication, when the left operand is a Matrix"""
+        if not isinstance(matrix, Matrix):
+            return NotImplemented
+        return LazyMatrix(op="mul", args=(_node(matrix), self))
+
+    def transp(self) -> LazyMatrix:
+        """lazy transposition
+
+        returns:
+            LazyMatrix: the node of the transposition
+        """
+        return LazyMatrix(op="transp", args=(self,))
+
+    def evaluate(self) -> Matrix:
+        """evaluation of the expression (the result is cached in the node)
+
+        returns:
+            Matrix: value of the expression
+        """
+        if self._value is None:
+            self._value = _evaluate(self, False)
+        return self._value
+
+    def __getitem__(self, key: int) -> Vector:
+        """The operator for get vector from the evaluated matrix by the index (key)
+
+        args:
+            key (int): key for vector
+        returns:
+            Vector: vector, which is in the matrix by the key
+        """
+        return self.evaluate()[key]
+
+    def __str__(self) -> str:
+        """The overload for the print function (evaluates the expression)
+
+        returns:
+            str: The str-matrix
+        """
+        return str(self.evaluate())
+
+    def __eq__(self, other: object) -> bool:
+        """The overload for the == or != (evaluates the expressions)
+
+        returns:
+            bool: True if equal, else False
+        """
+        if isinstance(other, LazyMatrix):
+            other = other.evaluate()
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.evaluate() == other
+
+
+def _node(matrix: LazyMatrix | Matrix) -> LazyMatrix:
+    """wraps a matrix into a leaf"""
+    return matrix if isinstance(matrix, LazyMatrix) else LazyMatrix(matrix)
+
+
+def _terms(node: LazyMatrix, transposed: bool) -> list[tuple[LazyMatrix, bool]]:
+    """operands of a sum tree (nested additions and transpositions are opened)"""
+    if node.op == "transp":
+        return _terms(node.args[0], not transposed)
+    if node.op == "add" and node._value is None:
+        return _terms(node.args[0], transposed) + _terms(node.args[1], transposed)
+    return [(node, transposed)]
+
+
+def _factors(node: LazyMatrix, transposed: bool) -> list[tuple[LazyMatrix, bool]]:
+    """factors of a product tree, (A * B)^T = B^T * A^T"""
+    if node.op == "transp":
+        return _factors(node.args[0], not transposed)
+    if node.op == "mul" and node._value is None:
+        left = _factors(node.args[0], transposed)
+        right = _factors(node.args[1], transposed)
+        return right + left if transposed else left + right
+    return [(node, transposed)]
+
+
+def _sum(*values: float) -> float:
+    """sum of the elements of all operands in one position"""
+    return sum(values)
+
+
+def _evaluate(node: LazyMatrix, transposed: bool) -> Matrix:
+    """evaluation of the node (or of its transposition) without intermediate copies
+
+    args:
+        node (LazyMatrix): the node
+        transposed (bool): evaluate the transposed node
+    returns:
+        Matrix: the value, maybe a view with swapped strides
+    """
+    if node._value is not None:
+        return node._value._transposed_view() if transposed else node._value
+
+    if node.op == "transp":
+        return _evaluate(node.args[0], not transposed)
+
+    if node.op == "add":
+        operands = [_evaluate(term, t) for term, t in _terms(node, transposed)]
+        if all(m._flat_transposed() is not None for m in operands):
+            # all operands are transposed views: sum the storages, transpose the sum
+            flats = [m._transposed_view()._flat() for m in operands]
+            rows, cols = operands[0].shape
+            data = array("d", map(_sum, *flats))
+            return Matrix._wrap(data, (cols, rows))._transposed_view()
+        flats = [m._flat() for m in operands]
+        return Matrix._wrap(array("d", map(_sum, *flats)), operands[0].shape)
+
+    factors = [_evaluate(factor, t) for factor, t in _factors(node, transposed)]
+    dims = tuple(m.shape[0] for m in factors) + (factors[-1].shape[1],)
+    _, split = chain_plan(dims)
+    return chain_product(factors, split)
+
+
+def lazy(matrix: Matrix) -> LazyMatrix:
+    """starts a lazy expression
+
+    args:
+        matrix (Matrix): the matrix
+    returns:
+        LazyMatrix: leaf of the expression tree
+    """
+    return LazyMatrix(matrix)
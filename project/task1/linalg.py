@@ -0,0 +1,317 @@
+from __future__ import annotations
+from typing import Any, Callable
+from array import array
+import math
+import operator
+from project.task1 import kernels
+from project.task1.kernels import copy_buffer
+from project.task1.matrices import Matrix
+from project.task1.vectors import Vector
+
+
+class LUFactorization:
+    """
+    LU factorization with partial pivoting: P * A = L * U.
+
+    'lu' is one flat row-major buffer (n x n): U is on and above the diagonal,
+    L (with the unit diagonal, which isn't stored) is below it,
+    'perm' - the row of A, which is i-th in P * A.
+    """
+
+    def __init__(self, matrix: Matrix):
+        """constructor - factorization of a square matrix (O(n^3))
+
+        args:
+            matrix (Matrix): the square matrix
+        """
+        n = _square(matrix)
+        lu = copy_buffer(matrix._flat())
+        perm = array("q", range(n))
+        sign = 1.0
+        singular = False
+        sub = operator.sub
+
+        for k in range(n):
+            pivot_row = max(range(k, n), key=lambda i: abs(lu[i * n + k]))
+            if pivot_row != k:
+                top = slice(k * n, (k + 1) * n)
+                bottom = slice(pivot_row * n, (pivot_row + 1) * n)
+                lu[top], lu[bottom] = lu[bottom], lu[top]
+                perm[k], perm[pivot_row] = perm[pivot_row], perm[k]
+                sign = -sign
+            pivot = lu[k * n + k]
+            if pivot == 0:
+                singular = True
+                continue
+            tail = lu[k * n + k + 1 : (k + 1) * n]  # the rest of the pivot row
+            for i in range(k + 1, n):
+                factor = lu[i * n + k] / pivot
+                if factor == 0:
+                    continue
+                lu[i * n + k] = factor
+                row = slice(i * n + k + 1, (i + 1) * n)
+                lu[row] = array("d", map(sub, lu[row], map(factor.__mul__, tail)))
+
+        self.size = n
+        self.lu = lu
+        self.perm = perm
+        self.sign = sign
+        self.singular = singular
+
+    @property
+    def lower(self) -> Matrix:
+        """L: the lower triangular matrix with the unit diagonal
+
+        returns:
+            Matrix: L
+        """
+        n = self.size
+        out = kernels.zeros(n * n)
+        for i in range(n):
+            out[i * n : i * n + i] = self.lu[i * n : i * n + i]
+            out[i * n + i] = 1.0
+        return Matrix._wrap(out, (n, n))
+
+    @property
+    def upper(self) -> Matrix:
+        """U: the upper triangular matrix
+
+        returns:
+            Matrix: U
+        """
+        n = self.size
+        out = kernels.zeros(n * n)
+        for i in range(n):
+            out[i * n + i : (i + 1) * n] = self.lu[i * n + i : (i + 1) * n]
+        return Matrix._wrap(out, (n, n))
+
+    def det(self) -> float:
+        """determinant: the product of the diagonal of U with the sign of P (O(n))
+
+        returns:
+            float: the determinant
+        """
+        if self.singular:
+            return 0.0
+        return self.sign * math.prod(self.lu[:: self.size + 1])
+
+    def solve(self, b: Vector) -> Vector:
+        """solution of A * x = b by two triangular substitutions (O(n^2))
+
+        args:
+            b (Vector): the right side
+        returns:
+            Vector: x
+        """
+        if self.singular:
+            raise ValueError("The matrix is singular")
+        if len(b) != self.size:
+            raise ValueError("Dimension error, b must have n elements")
+        permuted = array("d", (b[p] for p in self.perm))
+        y = _forward(self.lu, permuted, self.size, unit_diagonal=True)
+        return Vector(_back(self.lu, y, self.size))
+
+
+class CholeskyFactorization:
+    """
+    Cholesky factorization of a symmetric positive definite matrix: A = L * L^T.
+
+    'lower' is L in one flat row-major buffer (n x n),
+    only the lower triangle of A is read.
+    """
+
+    def __init__(self, matrix: Matrix):
+        """constructor - factorization of a square matrix (O(n^3 / 3))
+
+        args:
+            matrix (Matrix): the symmetric positive definite matrix
+        """
+        n = _square(matrix)
+        a = matrix._flat()
+        lower = kernels.zeros(n * n)
+        mul = operator.mul
+
+        for j in range(n):
+            row_j = lower[j * n : j * n + j]
+            diagonal = a[j * n + j] - sum(map(mul, row_j, row_j))
+            if diagonal <= 0:
+                raise ValueError("The matrix isn't positive definite")
+            root = math.sqrt(diagonal)
+            lower[j * n + j] = root
+            for i in range(j + 1, n):
+                row_i = lower[i * n : i * n + j]
+                lower[i * n + j] = (a[i * n + j] - sum(map(mul, row_i, row_j))) / root
+
+        self.size = n
+        self.lower = lower
+        self._upper = kernels.transpose(memoryview(lower), n, n)  # L^T
+
+    def det(self) -> float:
+        """determinant: the squared product of the diagonal of L (O(n))
+
+        returns:
+            float: the determinant
+        """
+        return math.prod(self.lower[:: self.size + 1]) ** 2
+
+    def solve(self, b: Vector) -> Vector:
+        """solution of A * x = b by L * y = b and L^T * x = y (O(n^2))
+
+        args:
+            b (Vector): the right side
+        returns:
+            Vector: x
+        """
+        if len(b) != self.size:
+            raise ValueError("Dimension error, b must have n elements")
+        y = _forward(self.lower, copy_buffer(b.value), self.size)
+        return Vector(_back(self._upper, y, self.size))
+
+
+def _square(matrix: Matrix) -> int:
+    """side of a square matrix"""
+    rows, cols = matrix.shape
+    if rows != cols:
+        raise ValueError("The matrix must be square")
+    return rows
+
+
+def _forward(lower: Any, b: array, n: int, unit_diagonal: bool = False) -> array:
+    """forward substitution on a flat lower triangular buffer (O(n^2))"""
+    mul = operator.mul
+    y = array("d", b)
+    for i in range(n):
+        value = y[i] - sum(map(mul, lower[i * n : i * n + i], y[:i]))
+        y[i] = value if unit_diagonal else value / lower[i * n + i]
+    return y
+
+
+def _back(upper: Any, y: array, n: int) -> array:
+    """back substitution on a flat upper triangular buffer (O(n^2))"""
+    mul = operator.mul
+    x = array("d", y)
+    for i in range(n - 1, -1, -1):
+        rest = sum(map(mul, upper[i * n + i + 1 : (i + 1) * n], x[i + 1 :]))
+        x[i] = (x[i] - rest) / upper[i * n + i]
+    return x
+
+
+def forward_substitution(
+    lower: Matrix, b: Vector, unit_diagonal: bool = False
+) -> Vector:
+    """solution of L * y = b for the lower triangular L (O(n^2))
+
+    args:
+        lower (Matrix): the lower triangular matrix (the upper triangle isn't read)
+        b (Vector): the right side
+        unit_diagonal (bool): the diagonal of L is ones (it isn't read)
+    returns:
+        Vector: y
+    """
+    n = _square(lower)
+    if len(b) != n:
+        raise ValueError("Dimension error, b must have n elements")
+    return Vector(_forward(lower._flat(), copy_buffer(b.value), n, unit_diagonal))
+
+
+def back_substitution(upper: Matrix, y: Vector) -> Vector:
+    """solution of U * x = y for the upper triangular U (O(n^2))
+
+    args:
+        upper (Matrix): the upper triangular matrix (the lower triangle isn't read)
+        y (Vector): the right side
+    returns:
+        Vector: x
+    """
+    n = _square(upper)
+    if len(y) != n:
+        raise ValueError("Dimension error, b must have n elements")
+    return Vector(_back(upper._flat(), copy_buffer(y.value), n))
+
+
+def _cached(matrix: Matrix, kind: str, factorize: Callable[[Matrix], Any]) -> Any:
+    """the factorization, which is cached on the matrix: it's reused while
+    the values of the matrix are the same (an O(n^2) comparison with the snapshot)"""
+    flat = matrix._flat()
+    cached = matrix._factorizations.get(kind)
+    if cached is not None and cached[0] == flat:
+        return cached[1]
+    factorization = factorize(matrix)
+    matrix._factorizations[kind] = (copy_buffer(flat), factorization)
+    return factorization
+
+
+def lu(matrix: Matrix) -> LUFactorization:
+    """LU factorization with partial pivoting (cached on the matrix)
+
+    args:
+        matrix (Matrix): the square matrix
+    returns:
+        LUFactorization: P * A = L * U
+    """
+    return _cached(matrix, "lu", LUFactorization)
+
+
+def cholesky(matrix: Matrix) -> CholeskyFactorization:
+    """Cholesky factorization (cached on the matrix)
+
+    args:
+        matrix (Matrix): the symmetric positive definite matrix
+    returns:
+        CholeskyFactorization: A = L * L^T
+    """
+    return _cached(matrix, "cholesky", CholeskyFactorization)
+
+
+def solve(matrix: Matrix, b: Vector | Matrix, method: str = "lu") -> Any:
+    """solution of A * x = b, the factorization of A is computed once
+    and cached on A, so next solves with the same A cost O(n^2)
+
+    args:
+        matrix (Matrix): the square matrix A
+        b (Vector | Matrix): the right side or the right sides (columns of the matrix)
+        method (str): "lu" - any nonsingular A, "cholesky" - symmetric positive definite A
+    returns:
+        Vector | Matrix: x (the matrix of solutions for the matrix b)
+    """
+    if method == "lu":
+        factorization: Any = lu(matrix)
+    elif method == "cholesky":
+        factorization = cholesky(matrix)
+    else:
+        raise ValueError(f"Unknown method {method!r}, expected 'lu' or 'cholesky'")
+
+    if isinstance(b, Vector):
+        return factorization.solve(b)
+    rows, cols = b.shape
+    if rows != matrix.shape[0]:
+        raise ValueError("Dimension error, b must have n rows")
+    out = Matrix._wrap(kernels.zeros(rows * cols), (rows, cols))
+    for j in range(cols):
+        out[:, j].value[:] = factorization.solve(b[:, j]).value
+    return out
+
+
+def inverse(matrix: Matrix) -> Matrix:
+    """the inverse matrix (A * X = I by the cached LU factorization)
+
+    args:
+        matrix (Matrix): the nonsingular square matrix
+    returns:
+        Matrix: A^-1
+    """
+    n = _square(matrix)
+    identity = kernels.zeros(n * n)
+    identity[:: n + 1] = array("d", [1.0]) * n
+    return solve(matrix, Matrix._wrap(identity, (n, n)))
+
+
+def det(matrix: Matrix) -> float:
+    """determinant by the cached LU factorization
+
+    args:
+        matrix (Matrix): the square matrix
+    returns:
+        float: the determinant
+    """
+    return lu(matrix).det()
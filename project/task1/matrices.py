@@ -1,46 +1,284 @@
 from __future__ import annotations
-from typing import Sequence
-from typing import cast
+from typing import Any, Iterable, Sequence, TYPE_CHECKING
+from functools import lru_cache
+from array import array
+import operator
 from project.task1.vectors import Vector
+from project.task1 import kernels
+from project.task1.kernels import as_buffer, copy_buffer
+from project.task1 import backend as backends
+from project.task1 import parallel
+from project.task1 import strassen
+
+if TYPE_CHECKING:
+    from project.task1.lazy import LazyMatrix
+
+CHAIN_PLANS_CACHE = 128  # quantity of cached plans of chain products
+ALGORITHMS = ("auto", "classical", "strassen")  # of the pure Python multiplication
 
 
 class Matrix:
     """
     The matrix class has the following methods:
     addition, multiplication, and transpose.
+
+    Values are stored in one flat row-major buffer of doubles ('_data')
+    with 'shape' (rows, columns), 'strides' (in elements) and the offset of the first element,
+    rows are returned as Vector views over this buffer.
+
+    Transposition, row / column slices and submatrices (matrix[i0:i1, j0:j1]) are views,
+    which share the storage and only change the metadata, materialize() packs them.
     """
 
     def __init__(self, matrix: Sequence[Sequence[int | float]] | Sequence[Vector]):
-        """constructor - save input value as a 'value' of matrix
+        """constructor - pack input rows into one flat buffer
 
         args:
             matrix (Sequence[Sequence[int | float]): input matrix values
         """
-        if not matrix:
+        data, shape = _pack_rows(matrix)
+        self._init_storage(memoryview(data), shape)
+
+    def _init_storage(
+        self,
+        data: memoryview,
+        shape: tuple[int, int],
+        strides: tuple[int, int] | None = None,
+        offset: int = 0,
+    ) -> None:
+        """saves the storage metadata
+
+        args:
+            data (memoryview): flat buffer of doubles
+            shape (tuple[int, int]): rows and columns
+            strides (tuple[int, int] | None): steps (in elements) between rows and columns,
+                row-major by default
+            offset (int): index of the first element in the buffer
+        """
+        self._data = data
+        self.shape = shape
+        self.strides = strides if strides is not None else (shape[1], 1)
+        self._offset = offset
+        # factorizations of project.task1.linalg with snapshots of the values
+        self._factorizations: dict[str, tuple[array, Any]] = {}
+
+    @classmethod
+    def _wrap(
+        cls,
+        data: memoryview | array,
+        shape: tuple[int, int],
+        strides: tuple[int, int] | None = None,
+        offset: int = 0,
+    ) -> Matrix:
+        """creates a matrix over an existing buffer without copying and validation
+
+        args:
+            data (memoryview | array): flat buffer of doubles
+            shape (tuple[int, int]): rows and columns
+            strides (tuple[int, int] | None): steps between rows and columns
+            offset (int): index of the first element in the buffer
+        returns:
+            Matrix: the matrix, which shares the buffer
+        """
+        result = cls.__new__(cls)
+        result._init_storage(as_buffer(data), shape, strides, offset)
+        return result
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Iterable[int | float] | Vector], cols: int | None = None
+    ) -> Matrix:
+        """creates a matrix from a stream of rows (a generator, a pipeline, a CSV reader...):
+        every row is appended into the packed buffer, when it arrives,
+        so the rows are never held all at once
+
+        args:
+            rows (Iterable[Iterable[int | float] | Vector]): the rows
+            cols (int | None): expected length of the rows, None - the first row's
+        returns:
+            Matrix: the matrix of the rows
+        """
+        data, shape = _pack_rows(rows, cols)
+        return cls._wrap(data, shape)
+
+    @classmethod
+    def from_buffer(cls, buffer: Any, shape: tuple[int, int]) -> Matrix:
+        """creates a matrix over a buffer of doubles in row-major order without copying
+        (array.array('d'), memoryview, C-contiguous NumPy float64 array...)
+
+        args:
+            buffer (Any): object with the buffer protocol or a flat sequence of numbers
+            shape (tuple[int, int]): rows and columns
+        returns:
+            Matrix: the matrix, which shares the buffer
+        """
+        rows, cols = shape
+        data = as_buffer(buffer)
+        if rows <= 0 or cols <= 0 or len(data) != rows * cols:
             raise ValueError("The incorrect dimension of the matrix")
+        return cls._wrap(data, (rows, cols))
 
-        if isinstance(matrix[0], Vector):
-            self.value = list(
-                cast(Sequence[Vector], matrix)
-            )  # already is vectors, but sequence, i converted it to a list
-        else:
-            self.value = [
-                Vector(row) for row in cast(Sequence[Sequence[int | float]], matrix)
-            ]
+    @classmethod
+    def memmap(cls, path: Any, mode: str = "r", shape: Any = None) -> Matrix:
+        """the matrix over a memory-mapped file of the binary format
+        (project.task1.storage): elements are paged in lazily, when they are accessed
 
-        for i in range(1, len(self)):
-            if len(self[i]) != len(self[i - 1]):
-                raise ValueError("The incorrect dimension of the matrix")
+        args:
+            path (str | os.PathLike): the file
+            mode (str): "r" - read-only, "r+" - the changes are written into the file,
+                "w+" - create (or overwrite) the file with zeros of the shape
+            shape (tuple[int, int] | None): the shape for the "w+" mode
+        returns:
+            Matrix: the matrix, which storage is the file
+        """
+        from project.task1 import storage
 
-    def __getitem__(self, key: int) -> Vector:
-        """The operator for get vector from the matrix by the index (key)
+        return storage.memmap(path, mode, shape)
+
+    @classmethod
+    def from_file(cls, path: Any) -> Matrix:
+        """the read-only matrix over a memory-mapped file of the binary format
 
         args:
-            key (int): key for vector
+            path (str | os.PathLike): the file
+        returns:
+            Matrix: the matrix, which storage is the file
+        """
+        return cls.memmap(path, "r")
+
+    def to_bytes(self) -> bytes:
+        """serialization into the binary format (project.task1.storage):
+        a fixed header and raw little-endian doubles in the row-major order
+
         returns:
-            Vector: vector, which is in this matrix by the key
+            bytes: the serialized matrix
         """
-        return self.value[key]
+        from project.task1 import storage
+
+        return storage.dumps(self._flat(), self.shape)
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> Matrix:
+        """deserialization from the binary format without copying:
+        the matrix shares the buffer (read-only for bytes)
+
+        args:
+            data (bytes | bytearray | memoryview): the serialized matrix
+        returns:
+            Matrix: the matrix over the data
+        """
+        from project.task1 import storage
+
+        shape, values = storage.loads(data)
+        if len(shape) != 2:
+            raise ValueError("The data contains a vector, not a matrix")
+        return cls._wrap(values, (shape[0], shape[1]))
+
+    def save(self, path: Any) -> None:
+        """writes the matrix into a file of the binary format
+
+        args:
+            path (str | os.PathLike): the file
+        """
+        from project.task1 import storage
+
+        storage.dump(path, self._flat(), self.shape)
+
+    @classmethod
+    def load(cls, path: Any) -> Matrix:
+        """reads the matrix from a file of the binary format by one read
+        (Matrix.from_file maps the file instead of reading it)
+
+        args:
+            path (str | os.PathLike): the file
+        returns:
+            Matrix: the matrix with the writable storage
+        """
+        from project.task1 import storage
+
+        shape, values = storage.load(path)
+        if len(shape) != 2:
+            raise ValueError("The file contains a vector, not a matrix")
+        return cls._wrap(values, (shape[0], shape[1]))
+
+    def _flat(self) -> memoryview:
+        """the matrix values in the row-major order as one contiguous buffer
+        (the storage itself if it is already packed, else a copy)
+
+        returns:
+            memoryview: flat buffer of doubles
+        """
+        rows, cols = self.shape
+        if self.strides == (cols, 1):
+            return self._data[self._offset : self._offset + rows * cols]
+        flat_t = self._flat_transposed()
+        if flat_t is not None:
+            return memoryview(kernels.transpose(flat_t, cols, rows))
+        data = array("d")
+        for i in range(rows):
+            data.extend(copy_buffer(self[i].value))
+        return memoryview(data)
+
+    def _flat_transposed(self) -> memoryview | None:
+        """the matrix values in the column-major order without copying,
+        if the matrix is a transposed view of a packed buffer
+
+        returns:
+            memoryview | None: flat buffer of the transposed matrix or None
+        """
+        rows, cols = self.shape
+        if self.strides == (1, rows):
+            return self._data[self._offset : self._offset + rows * cols]
+        return None
+
+    def _transposed_view(self) -> Matrix:
+        """the transposed matrix, which shares the storage (the strides are swapped)
+
+        returns:
+            Matrix: transposed view
+        """
+        rows, cols = self.shape
+        row_step, col_step = self.strides
+        return Matrix._wrap(
+            self._data, (cols, rows), (col_step, row_step), self._offset
+        )
+
+    @property
+    def value(self) -> list[Vector]:
+        """the rows of the matrix (views over the storage)
+
+        returns:
+            list[Vector]: list of rows
+        """
+        return [self[i] for i in range(len(self))]
+
+    def __getitem__(self, key: Any) -> Any:
+        """The operator for get vector from the matrix by the index (key),
+        slices and pairs of indices / slices return views, not copies:
+        matrix[i] - row, matrix[i0:i1] - rows, matrix[:, j] - column,
+        matrix[i0:i1, j0:j1] - submatrix, matrix[i, j] - element
+
+        args:
+            key (int | slice | tuple[int | slice, int | slice]): key for vector
+        returns:
+            Vector | Matrix | float: the row or the column (Vector),
+                the submatrix (Matrix) or the element (float)
+        """
+        rows_key, cols_key = key if isinstance(key, tuple) else (key, slice(None))
+        rows, cols = self.shape
+        row_step, col_step = self.strides
+        i0, row_count, i_step = _index(rows_key, rows)
+        j0, col_count, j_step = _index(cols_key, cols)
+        start = self._offset + i0 * row_step + j0 * col_step
+
+        if isinstance(rows_key, slice):
+            if isinstance(cols_key, slice):
+                strides = (row_step * i_step, col_step * j_step)
+                return Matrix._wrap(self._data, (row_count, col_count), strides, start)
+            return Vector(_strided(self._data, start, row_count, row_step * i_step))
+        if isinstance(cols_key, slice):
+            return Vector(_strided(self._data, start, col_count, col_step * j_step))
+        return self._data[start]
 
     def __len__(self) -> int:
         """length function
@@ -48,7 +286,7 @@ class Matrix:
         returns:
             int: len of the matrix-type Python object
         """
-        return len(self.value)
+        return self.shape[0]
 
     def __add__(self, matrix: Matrix) -> Matrix:
         """Implementation of the matrix addition
@@ -58,11 +296,132 @@ class Matrix:
         returns:
             Matrix: the result of adding two matrices
         """
+        if not isinstance(matrix, Matrix):
+            return NotImplemented
+        return self.add(matrix)
+
+    def add(
+        self,
+        matrix: Matrix,
+        backend: str | None = None,
+        out: Matrix | None = None,
+    ) -> Matrix:
+        """The matrix addition with the choice of the backend
 
-        if len(matrix) != len(self) or len(self[0]) != len(matrix[0]):
+        args:
+            matrix (Matrix): another matrix for addition with this
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+            out (Matrix | None): matrix for the result (None - a new matrix)
+        returns:
+            Matrix: the result of adding two matrices
+        """
+        if self.shape != matrix.shape:
             raise ValueError("Matrices must be the same dimension")
+        if out is not None and out.shape != self.shape:
+            raise ValueError("Dimension error, out must have the shape of the result")
+
+        left, right = self._flat(), matrix._flat()
+        if backends.resolve(backend, len(left)) == "numpy":
+            result = Matrix._wrap(backends.np_add(left, right), self.shape)
+            return result if out is None else out._assign(result._flat())
+        if out is None:
+            return Matrix._wrap(array("d", map(operator.add, left, right)), self.shape)
+
+        # out is written row by row, so operands over its storage are copied first
+        if out._shares(self):
+            left = memoryview(copy_buffer(left))
+        if out._shares(matrix):
+            right = memoryview(copy_buffer(right))
 
-        return Matrix([matrix[i] + self[i] for i in range(len(self))])
+        cols = self.shape[1]
+        for i in range(len(self)):  # one row of temporary memory
+            row = slice(i * cols, (i + 1) * cols)
+            out[i].value[:] = array("d", map(operator.add, left[row], right[row]))
+        return out
+
+    def _shares(self, other: Matrix) -> bool:
+        """check, that two matrices are views of the same storage
+
+        args:
+            other (Matrix): another matrix
+        returns:
+            bool: True if the storage is the same object
+        """
+        return self._data.obj is other._data.obj
+
+    def _assign(self, data: memoryview) -> Matrix:
+        """copies values in the row-major order into the storage of this matrix
+
+        args:
+            data (memoryview): flat buffer of doubles with rows * cols values
+        returns:
+            Matrix: this matrix
+        """
+        rows, cols = self.shape
+        if self.strides == (cols, 1):
+            self._flat()[:] = data
+        else:
+            for i in range(rows):
+                self[i].value[:] = data[i * cols : (i + 1) * cols]
+        return self
+
+    def add_scaled(self, alpha: float, matrix: Matrix) -> Matrix:
+        """in-place self += alpha * matrix (axpy) without new matrices
+
+        args:
+            alpha (float): the scale of the another matrix
+            matrix (Matrix): another matrix
+        returns:
+            Matrix: this matrix
+        """
+        if self.shape != matrix.shape:
+            raise ValueError("Matrices must be the same dimension")
+
+        cols = self.shape[1]
+        other = matrix._flat()
+        if self._shares(matrix):  # the rows of self overwrite the values of matrix
+            other = memoryview(copy_buffer(other))
+        for i in range(len(self)):
+            self[i].add_scaled(alpha, Vector(other[i * cols : (i + 1) * cols]))
+        return self
+
+    def __iadd__(self, matrix: Matrix) -> Matrix:
+        """in-place addition (+=), the storage is reused
+
+        args:
+            matrix (Matrix): another matrix for addition with this
+        returns:
+            Matrix: this matrix
+        """
+        if not isinstance(matrix, Matrix):
+            return NotImplemented
+        return self.add_scaled(1, matrix)
+
+    def __isub__(self, matrix: Matrix) -> Matrix:
+        """in-place subtraction (-=), the storage is reused
+
+        args:
+            matrix (Matrix): another matrix for subtraction from this
+        returns:
+            Matrix: this matrix
+        """
+        if not isinstance(matrix, Matrix):
+            return NotImplemented
+        return self.add_scaled(-1, matrix)
+
+    def __imul__(self, alpha: float) -> Matrix:  # type: ignore[misc]
+        """in-place multiplication by a scalar (*=), the storage is reused
+
+        args:
+            alpha (float): the scalar
+        returns:
+            Matrix: this matrix
+        """
+        if not isinstance(alpha, (int, float)):
+            return NotImplemented
+        for i in range(len(self)):
+            self[i].__imul__(alpha)
+        return self
 
     def __str__(self) -> str:
         """The overload for the print function
@@ -72,18 +431,62 @@ class Matrix:
         """
         return "[" + "\n".join(str(vec) for vec in self.value) + "]"
 
+    def tolist(self) -> list[list[float]]:
+        """the matrix values as nested Python lists
+
+        returns:
+            list[list[float]]: copy of the values
+        """
+        return [self[i].tolist() for i in range(len(self))]
+
+    def copy(self) -> Matrix:
+        """a matrix with its own packed copy of the storage
+
+        returns:
+            Matrix: copy of this matrix
+        """
+        return Matrix._wrap(copy_buffer(self._flat()), self.shape)
+
+    @property
+    def is_packed(self) -> bool:
+        """check, that the values are contiguous in the row-major order
+        (a new matrix or a slice of rows), not a transposed or a strided view
+
+        returns:
+            bool: True if packed, else False
+        """
+        return self.strides == (self.shape[1], 1)
+
+    def materialize(self, backend: str | None = None) -> Matrix:
+        """packs a view into its own contiguous row-major storage
+        (it's the only operation on views, that copies the values)
+
+        args:
+            backend (str | None): "auto", "python", "numpy" or None (the global backend),
+                the backend of the transposition of a transposed view
+        returns:
+            Matrix: this matrix, if it is already packed, else the packed copy
+        """
+        if self.is_packed:
+            return self
+        rows, cols = self.shape
+        flat_t = self._flat_transposed()
+        if flat_t is not None and backends.resolve(backend, len(flat_t)) == "numpy":
+            return Matrix._wrap(backends.np_transpose(flat_t, cols, rows), self.shape)
+        return Matrix._wrap(self._flat(), self.shape)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """pickle support (memoryview itself can't be pickled)"""
+        return (self.__class__.from_buffer, (copy_buffer(self._flat()), self.shape))
+
     def transp(self) -> Matrix:
-        """Matrix transposition
+        """Matrix transposition in O(1): the view with swapped strides,
+        which shares the storage (materialize() packs it)
 
         returns:
             A matrix with columns replaced by rows
         """
-        return Matrix(
-            [
-                Vector([self[i][j] for i in range(len(self))])
-                for j in range(len(self[0]))
-            ]
-        )
+        return self._transposed_view()
 
     def __mul__(self, matrix: Matrix) -> Matrix:
         """The matrix multiplication
@@ -93,20 +496,105 @@ class Matrix:
         returns:
             Matrix: the result of multiplying two matrices
         """
-        if len(self[0]) != len(matrix):
+        if not isinstance(matrix, Matrix):
+            return NotImplemented
+        return self.matmul(matrix)
+
+    def matmul(
+        self,
+        matrix: Matrix,
+        block: int = kernels.BLOCK_SIZE,
+        backend: str | None = None,
+        workers: int | None = None,
+        out: Matrix | None = None,
+        algorithm: str = "auto",
+    ) -> Matrix:
+        """The matrix multiplication by the cache-blocked kernel
+        (the right matrix is transposed once, the product is computed by tiles,
+        big products can be split by rows between worker processes),
+        by the Strassen-Winograd recursion (big square products) or by NumPy (BLAS)
+
+        args:
+            matrix (Matrix): another matrix for multiplication with current
+            block (int): tile side of the pure Python kernel
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+            workers (int | None): worker processes for the pure Python kernel,
+                None - from the parallel() block (serial by default),
+                products below the parallel threshold are always serial,
+                more than one worker is used instead of the routing of the "auto"
+                backend to NumPy (an explicit "numpy" backend is still NumPy)
+            out (Matrix | None): matrix for the result (None - a new matrix),
+                it must not share the storage with the operands
+            algorithm (str): algorithm of the serial pure Python multiplication:
+                "classical" - the blocked kernel, "strassen" - the recursion
+                (square matrices only), "auto" - the recursion for square matrices
+                of at least the crossover side (strassen.set_crossover),
+                an explicit "strassen" is used instead of the routing of the "auto"
+                backend to NumPy (an explicit "numpy" backend is still NumPy)
+        returns:
+            Matrix: the result of multiplying two matrices
+        """
+        if self.shape[1] != matrix.shape[0]:
             raise ValueError("Dimension error, must be n*k and k*m")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Unknown algorithm {algorithm!r}, expected one of {ALGORITHMS}"
+            )
 
-        return Matrix(
-            [
-                Vector(
-                    [
-                        sum([self[i][j] * matrix[j][k] for j in range(len(self[0]))])
-                        for k in range(len(matrix[0]))
-                    ]
+        rows, inner = self.shape
+        cols = matrix.shape[1]
+        if out is not None:
+            if out.shape != (rows, cols):
+                raise ValueError(
+                    "Dimension error, out must have the shape of the result"
                 )
-                for i in range(len(self))
-            ]
-        )  # ok, i can't write it "in one line"
+            if out._shares(self) or out._shares(matrix):
+                raise ValueError("out must not share the storage with the operands")
+        left = self._flat()
+        size = rows * inner * cols
+        count = parallel.choose_workers(workers, size)
+        right_t = matrix._flat_transposed()
+        chosen = backends.resolve(backend, size)
+        explicit = algorithm == "strassen" or (count > 1 and rows > 1)
+        if explicit and (backend or backends.get_backend()) == "auto":
+            chosen = "python"  # the explicit pure Python options win over "auto"
+        if chosen == "numpy":
+            data = backends.np_matmul(left, matrix._flat(), rows, inner, cols)
+        elif count > 1 and rows > 1:
+            data = parallel.matmul(
+                left, matrix._flat(), rows, inner, cols, count, block
+            )
+        elif algorithm == "strassen" or (
+            algorithm == "auto" and strassen.use_strassen(rows, inner, cols)
+        ):
+            if not rows == inner == cols:
+                raise ValueError("The Strassen multiplication needs square matrices")
+            data = strassen.matmul(left, matrix._flat(), rows, block=block)
+        else:
+            if right_t is None:  # a transposed view already stores B^T
+                right_t = memoryview(kernels.transpose(matrix._flat(), inner, cols))
+            if out is not None and out.strides == (cols, 1):  # write straight into out
+                target = out._flat()
+            else:
+                target = memoryview(kernels.zeros(rows * cols))
+            kernels.matmul_transposed(left, right_t, target, rows, inner, cols, block)
+            if out is not None and out.strides == (cols, 1):
+                return out
+            data = target
+        if out is not None:
+            return out._assign(as_buffer(data))
+        return Matrix._wrap(data, (rows, cols))
+
+    def lazy(self) -> LazyMatrix:
+        """opt-in lazy mode: operations with the result build an expression tree,
+        which is evaluated only by .evaluate(), access by the index or ==
+
+        returns:
+            LazyMatrix: leaf of the expression tree
+        """
+        from project.task1.lazy import LazyMatrix
+
+        return LazyMatrix(self)
 
     def __eq__(self, other: object) -> bool:
         """The overload for the == or !=
@@ -116,4 +604,183 @@ class Matrix:
         """
         if not isinstance(other, Matrix):
             return NotImplemented
-        return self.value == other.value
+        return self.shape == other.shape and self._flat() == other._flat()
+
+
+def _pack_rows(
+    rows: Iterable[Iterable[int | float] | Vector], cols: int | None = None
+) -> tuple[array, tuple[int, int]]:
+    """packs rows into one flat buffer, the length of every row is checked,
+    when it arrives, the capacity of the buffer is doubled, when it is full
+
+    args:
+        rows (Iterable[Iterable[int | float] | Vector]): the rows
+        cols (int | None): expected length of the rows, None - the first row's
+    returns:
+        tuple[array, tuple[int, int]]: the packed buffer and the shape
+    """
+    data = array("d")
+    size = 0
+    for count, row in enumerate(rows):
+        values = copy_buffer(row.value) if isinstance(row, Vector) else array("d", row)
+        if cols is None:
+            cols = len(values)
+        if len(values) != cols or cols == 0:
+            raise ValueError(
+                f"The incorrect dimension of the matrix: row {count} has "
+                f"{len(values)} elements, expected {cols}"
+            )
+        if size + cols > len(data):
+            data.extend(kernels.zeros(max(len(data), cols)))
+        data[size : size + cols] = values
+        size += cols
+    if size == 0 or cols is None:
+        raise ValueError("The incorrect dimension of the matrix")
+    del data[size:]  # the unused capacity
+    return data, (size // cols, cols)
+
+
+def _strided(data: memoryview, start: int, count: int, step: int) -> memoryview:
+    """view of 'count' elements of the buffer from 'start' with 'step' (maybe negative)"""
+    stop: int | None = start + count * step
+    if stop is not None and stop < 0:  # a negative stop would wrap around
+        stop = None
+    return data[start:stop:step]
+
+
+def _index(key: int | slice, size: int) -> tuple[int, int, int]:
+    """start, quantity of elements and step of an index or a slice of an axis
+
+    args:
+        key (int | slice): index or slice
+        size (int): length of the axis
+    returns:
+        tuple[int, int, int]: start, quantity and step
+    """
+    if isinstance(key, slice):
+        start, stop, step = key.indices(size)
+        count = len(range(start, stop, step))
+        if count == 0:
+            raise ValueError("The incorrect dimension of the matrix")
+        return start, count, step
+    if key < 0:
+        key += size
+    if not 0 <= key < size:
+        raise IndexError("matrix index out of range")
+    return key, 1, 1
+
+
+def chain_order(dims: Sequence[int]) -> tuple[list[list[int]], list[list[int]]]:
+    """the optimal parenthesization of the product of the matrices
+    (dims[0] x dims[1]) * (dims[1] x dims[2]) * ... by the dynamic programming
+
+    args:
+        dims (Sequence[int]): dimensions of the chain, n matrices - n + 1 numbers
+    returns:
+        tuple[list[list[int]], list[list[int]]]: cost[i][j] - minimal quantity
+            of scalar multiplications for the product of matrices i..j,
+            split[i][j] - k of the last multiplication (i..k) * (k+1..j)
+    """
+    n = len(dims) - 1
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length - 1
+            cost[i][j] = -1
+            for k in range(i, j):
+                current = (
+                    cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                )
+                if cost[i][j] < 0 or current < cost[i][j]:
+                    cost[i][j], split[i][j] = current, k
+    return cost, split
+
+
+@lru_cache(maxsize=CHAIN_PLANS_CACHE)
+def chain_plan(dims: tuple[int, ...]) -> tuple[int, list[list[int]]]:
+    """the cached plan of a chain product (plans are reused for the same shapes)
+
+    args:
+        dims (tuple[int, ...]): dimensions of the chain, n matrices - n + 1 numbers
+    returns:
+        tuple[int, list[list[int]]]: minimal quantity of scalar multiplications
+            and the split table of chain_order
+    """
+    cost, split = chain_order(dims)
+    return cost[0][-1], split
+
+
+def chain_product(
+    matrices: Sequence[Matrix],
+    split: list[list[int]],
+    i: int = 0,
+    j: int = -1,
+    flops: list[int] | None = None,
+) -> Matrix:
+    """the product of matrices i..j in the order of the split table
+
+    args:
+        matrices (Sequence[Matrix]): the chain
+        split (list[list[int]]): the split table of chain_order
+        i (int): first matrix
+        j (int): last matrix (-1 - the last in the chain)
+        flops (list[int] | None): one-element counter of performed scalar multiplications
+    returns:
+        Matrix: the product
+    """
+    if j < 0:
+        j += len(matrices)
+    if i == j:
+        return matrices[i]
+    k = split[i][j]
+    left = chain_product(matrices, split, i, k, flops)
+    right = chain_product(matrices, split, k + 1, j, flops)
+    if flops is not None:
+        flops[0] += left.shape[0] * left.shape[1] * right.shape[1]
+    return left.matmul(right)
+
+
+def _chain_order_str(split: list[list[int]], i: int, j: int) -> str:
+    """the parenthesization as a string, for example ((M0 M1) M2)"""
+    if i == j:
+        return f"M{i}"
+    k = split[i][j]
+    return f"({_chain_order_str(split, i, k)} {_chain_order_str(split, k + 1, j)})"
+
+
+def matmul_chain(*matrices: Matrix, report: bool = False) -> Any:
+    """the product of a chain of matrices in the optimal order
+    (the order is found by the dynamic programming and cached by the shapes)
+
+    args:
+        *matrices (Matrix): the chain
+        report (bool): return also the report about the flops
+    returns:
+        Matrix: the product, or (Matrix, dict) if report:
+            "order" - the parenthesization, "estimated_flops" - planned scalar
+            multiplications, "actual_flops" - performed ones,
+            "left_to_right_flops" - scalar multiplications of the order A * B * C...
+    """
+    if not matrices:
+        raise ValueError("The chain must contain at least one matrix")
+    for left, right in zip(matrices, matrices[1:]):
+        if left.shape[1] != right.shape[0]:
+            raise ValueError("Dimension error, must be n*k and k*m")
+
+    dims = tuple(m.shape[0] for m in matrices) + (matrices[-1].shape[1],)
+    estimated, split = chain_plan(dims)
+    flops = [0]
+    result = chain_product(matrices, split, flops=flops)
+    if not report:
+        return result
+
+    left_to_right = sum(
+        dims[0] * dims[k] * dims[k + 1] for k in range(1, len(matrices))
+    )
+    return result, {
+        "order": _chain_order_str(split, 0, len(matrices) - 1),
+        "estimated_flops": estimated,
+        "actual_flops": flops[0],
+        "left_to_right_flops": left_to_right,
+    }
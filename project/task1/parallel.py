@@ -0,0 +1,177 @@
+from __future__ import annotations
+from typing import Iterator, cast
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from project.task1 import kernels
+
+# products with fewer multiplications (rows * inner * cols) are computed serially,
+# the start of worker processes and the copying into shared memory aren't worth it
+PARALLEL_THRESHOLD = 64**3
+
+_workers = 1
+_threshold = PARALLEL_THRESHOLD
+_executor: Executor | None = None
+
+
+@contextmanager
+def parallel(
+    workers: int, threshold: int = PARALLEL_THRESHOLD
+) -> Iterator[ProcessPoolExecutor]:
+    """context manager, that enables the parallel matrix multiplication
+    (one pool of worker processes is reused by all products inside the block)
+
+    args:
+        workers (int): quantity of worker processes
+        threshold (int): products with fewer multiplications are computed serially
+    returns:
+        ProcessPoolExecutor: the pool of the block
+    """
+    global _workers, _threshold, _executor
+    if workers <= 0:
+        raise ValueError("The quantity of workers must be positive")
+
+    previous = (_workers, _threshold, _executor)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        _workers, _threshold, _executor = workers, threshold, executor
+        try:
+            yield executor
+        finally:
+            _workers, _threshold, _executor = previous
+
+
+def set_threshold(threshold: int) -> None:
+    """sets the global size threshold of the parallel multiplication
+
+    args:
+        threshold (int): products with fewer multiplications are computed serially
+    """
+    global _threshold
+    _threshold = threshold
+
+
+def choose_workers(workers: int | None, size: int) -> int:
+    """the quantity of processes for one product
+
+    args:
+        workers (int | None): workers of the call, None - from the parallel() block
+        size (int): quantity of multiplications (rows * inner * cols)
+    returns:
+        int: 1 for the serial computation
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("The quantity of workers must be positive")
+    count = _workers if workers is None else workers
+    return count if size >= _threshold else 1
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    """the bytes of a shared memory block"""
+    return cast(memoryview, shm.buf)
+
+
+def _to_shared(size: int, data: memoryview | None = None) -> shared_memory.SharedMemory:
+    """creates a shared memory block for 'size' doubles (and copies the data into it)"""
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1) * 8)
+    if data is not None:
+        _buffer(shm)[: size * 8] = data.cast("B")
+    return shm
+
+
+def _matmul_rows(
+    names: tuple[str, str, str],
+    start: int,
+    stop: int,
+    inner: int,
+    cols: int,
+    block: int,
+) -> None:
+    """worker: computes rows [start, stop) of the product in shared memory
+
+    args:
+        names (tuple[str, str, str]): shared blocks of the left matrix,
+            the transposed right matrix and the output
+        start (int): first row
+        stop (int): row after the last one
+        inner (int): columns of the left matrix
+        cols (int): columns of the right matrix
+        block (int): tile side of the kernel
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    views = [cast(memoryview, _buffer(shm).cast("d")) for shm in blocks]
+    try:
+        left, right_t, out = views
+        kernels.matmul_transposed(
+            left[start * inner : stop * inner],
+            right_t[: cols * inner],
+            out[start * cols : stop * cols],
+            stop - start,
+            inner,
+            cols,
+            block,
+        )
+    finally:
+        for view in views:
+            view.release()
+        for shm in blocks:
+            shm.close()
+
+
+def matmul(
+    left: memoryview,
+    right: memoryview,
+    rows: int,
+    inner: int,
+    cols: int,
+    workers: int,
+    block: int = kernels.BLOCK_SIZE,
+) -> array:
+    """parallel matrix multiplication of flat row-major buffers:
+    the rows of the product are split between worker processes,
+    the operands are passed through shared memory (without pickling)
+
+    args:
+        left (memoryview): flat buffer of the left matrix (rows x inner)
+        right (memoryview): flat buffer of the right matrix (inner x cols)
+        rows (int): rows of the left matrix
+        inner (int): columns of the left matrix (rows of the right matrix)
+        cols (int): columns of the right matrix
+        workers (int): quantity of worker processes
+        block (int): tile side of the kernel
+    returns:
+        array: flat row-major buffer of the product (rows x cols)
+    """
+    if block <= 0:
+        raise ValueError("The block size must be positive")
+
+    right_t = memoryview(kernels.transpose(right, inner, cols))
+    blocks = [
+        _to_shared(rows * inner, left),
+        _to_shared(cols * inner, right_t),
+        _to_shared(rows * cols),
+    ]
+    try:
+        names = (blocks[0].name, blocks[1].name, blocks[2].name)
+        step = -(-rows // workers)
+        tasks = [
+            (names, start, min(start + step, rows), inner, cols, block)
+            for start in range(0, rows, step)
+        ]
+        if _executor is not None and workers == _workers:
+            futures = [_executor.submit(_matmul_rows, *task) for task in tasks]
+            for future in futures:
+                future.result()
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_matmul_rows, *task) for task in tasks]
+                for future in futures:
+                    future.result()
+
+        out = array("d")
+        out.frombytes(_buffer(blocks[2])[: rows * cols * 8])
+        return out
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
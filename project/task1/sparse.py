@@ -0,0 +1,347 @@
+from __future__ import annotations
+from typing import Any, Iterable, Sequence
+from array import array
+from bisect import bisect_left
+from project.task1.matrices import Matrix
+from project.task1.vectors import Vector
+from project.task1 import kernels
+from project.task1.kernels import copy_buffer
+
+
+class SparseMatrix:
+    """
+    The sparse matrix in the CSR (compressed sparse row) format:
+    'indptr' - start of every row in 'indices' / 'data' (rows + 1 elements),
+    'indices' - column of every nonzero element, 'data' - values of nonzero elements.
+    Column indices inside a row are sorted, zeros aren't stored.
+
+    Supports the same operations as Matrix: addition, multiplication
+    (sparse x sparse, sparse x dense, dense x sparse), transpose, ==, access by the index.
+    """
+
+    def __init__(self, matrix: Matrix | Sequence[Sequence[int | float]]):
+        """constructor - compress a dense matrix (only nonzero elements are saved)
+
+        args:
+            matrix (Matrix | Sequence[Sequence[int | float]]): dense matrix or its rows
+        """
+        if not isinstance(matrix, Matrix):
+            matrix = Matrix(matrix)
+
+        indptr, indices, data = array("q", [0]), array("q"), array("d")
+        for i in range(len(matrix)):
+            for j, value in enumerate(matrix[i]):
+                if value != 0:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(indices))
+        self._init_storage(matrix.shape, indptr, indices, data)
+
+    def _init_storage(
+        self, shape: tuple[int, int], indptr: array, indices: array, data: array
+    ) -> None:
+        """saves the CSR arrays
+
+        args:
+            shape (tuple[int, int]): rows and columns
+            indptr (array): start of every row, rows + 1 elements
+            indices (array): column of every nonzero element
+            data (array): value of every nonzero element
+        """
+        self.shape = shape
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+
+    @classmethod
+    def _wrap(
+        cls, shape: tuple[int, int], indptr: array, indices: array, data: array
+    ) -> SparseMatrix:
+        """creates a sparse matrix over ready CSR arrays without validation"""
+        result = cls.__new__(cls)
+        result._init_storage(shape, indptr, indices, data)
+        return result
+
+    @classmethod
+    def from_coo(
+        cls,
+        rows: Iterable[int],
+        cols: Iterable[int],
+        values: Iterable[int | float],
+        shape: tuple[int, int],
+    ) -> SparseMatrix:
+        """creates a sparse matrix from the COO (coordinate) format,
+        values of repeated coordinates are summed
+
+        args:
+            rows (Iterable[int]): row of every element
+            cols (Iterable[int]): column of every element
+            values (Iterable[int | float]): value of every element
+            shape (tuple[int, int]): rows and columns
+        returns:
+            SparseMatrix: the matrix in the CSR format
+        """
+        n, m = shape
+        if n <= 0 or m <= 0:
+            raise ValueError("The incorrect dimension of the matrix")
+
+        merged: list[list[Any]] = []
+        for i, j, value in sorted(zip(rows, cols, values)):
+            if not (0 <= i < n and 0 <= j < m):
+                raise IndexError("The index is out of the matrix")
+            if merged and merged[-1][0] == i and merged[-1][1] == j:
+                merged[-1][2] += value
+            else:
+                merged.append([i, j, value])
+
+        indptr, indices, data = array("q", [0] * (n + 1)), array("q"), array("d")
+        for i, j, value in merged:
+            if value != 0:
+                indices.append(j)
+                data.append(value)
+                indptr[i + 1] += 1
+        for i in range(n):
+            indptr[i + 1] += indptr[i]
+        return cls._wrap(shape, indptr, indices, data)
+
+    def to_coo(self) -> tuple[list[int], list[int], list[float]]:
+        """the matrix in the COO (coordinate) format
+
+        returns:
+            tuple[list[int], list[int], list[float]]: rows, columns and values
+        """
+        rows = [i for i in range(len(self)) for _ in self._row_range(i)]
+        return rows, self.indices.tolist(), self.data.tolist()
+
+    def to_dense(self) -> Matrix:
+        """conversion to the dense matrix
+
+        returns:
+            Matrix: the dense matrix with the same values
+        """
+        rows, cols = self.shape
+        out = kernels.zeros(rows * cols)
+        for i in range(rows):
+            base = i * cols
+            for p in self._row_range(i):
+                out[base + self.indices[p]] = self.data[p]
+        return Matrix._wrap(out, self.shape)
+
+    @property
+    def nnz(self) -> int:
+        """quantity of the stored (nonzero) elements
+
+        returns:
+            int: quantity of nonzero elements
+        """
+        return len(self.data)
+
+    def _row_range(self, i: int) -> range:
+        """positions of the i-th row in 'indices' and 'data'"""
+        return range(self.indptr[i], self.indptr[i + 1])
+
+    def __len__(self) -> int:
+        """length function
+
+        returns:
+            int: quantity of rows
+        """
+        return self.shape[0]
+
+    def __getitem__(self, key: int | tuple[int, int]) -> Any:
+        """The operator for get row (dense Vector) or element (by (row, column)) from the matrix
+
+        args:
+            key (int | tuple[int, int]): row index or (row, column)
+        returns:
+            Vector | float: the row or the element
+        """
+        rows, cols = self.shape
+        i, j = key if isinstance(key, tuple) else (key, None)
+        if i < 0:
+            i += rows
+        if not 0 <= i < rows:
+            raise IndexError("matrix index out of range")
+
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        if j is None:
+            row = kernels.zeros(cols)
+            for p in range(start, stop):
+                row[self.indices[p]] = self.data[p]
+            return Vector(row)
+
+        if j < 0:
+            j += cols
+        if not 0 <= j < cols:
+            raise IndexError("matrix index out of range")
+        p = bisect_left(self.indices, j, start, stop)
+        if p < stop and self.indices[p] == j:
+            return self.data[p]
+        return 0.0
+
+    def __add__(self, matrix: SparseMatrix | Matrix) -> SparseMatrix | Matrix:
+        """Implementation of the matrix addition:
+        sparse + sparse -> sparse (merge of rows), sparse + dense -> dense
+
+        args:
+            matrix (SparseMatrix | Matrix): another matrix for addition with this
+        returns:
+            SparseMatrix | Matrix: the result of adding two matrices
+        """
+        if not isinstance(matrix, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self.shape != matrix.shape:
+            raise ValueError("Matrices must be the same dimension")
+
+        if isinstance(matrix, Matrix):
+            cols = self.shape[1]
+            out = copy_buffer(matrix._flat())
+            for i in range(len(self)):
+                for p in self._row_range(i):
+                    out[i * cols + self.indices[p]] += self.data[p]
+            return Matrix._wrap(out, self.shape)
+
+        indptr, indices, data = array("q", [0]), array("q"), array("d")
+        for i in range(len(self)):
+            p, stop_p = self.indptr[i], self.indptr[i + 1]
+            q, stop_q = matrix.indptr[i], matrix.indptr[i + 1]
+            while p < stop_p or q < stop_q:
+                j_p = self.indices[p] if p < stop_p else self.shape[1]
+                j_q = matrix.indices[q] if q < stop_q else self.shape[1]
+                if j_p < j_q:
+                    j, value = j_p, self.data[p]
+                    p += 1
+                elif j_q < j_p:
+                    j, value = j_q, matrix.data[q]
+                    q += 1
+                else:
+                    j, value = j_p, self.data[p] + matrix.data[q]
+                    p += 1
+                    q += 1
+                if value != 0:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(indices))
+        return SparseMatrix._wrap(self.shape, indptr, indices, data)
+
+    def __radd__(self, matrix: Matrix) -> SparseMatrix | Matrix:
+        """dense + sparse (the addition is commutative)"""
+        return self.__add__(matrix)
+
+    def __mul__(self, matrix: SparseMatrix | Matrix) -> SparseMatrix | Matrix:
+        """The matrix multiplication, the cost scales with nonzero elements:
+        sparse x sparse -> sparse (Gustavson's row-by-row algorithm),
+        sparse x dense -> dense (every nonzero element scales a row of the dense matrix)
+
+        args:
+            matrix (SparseMatrix | Matrix): another matrix for multiplication with current
+        returns:
+            SparseMatrix | Matrix: the result of multiplying two matrices
+        """
+        if not isinstance(matrix, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self.shape[1] != matrix.shape[0]:
+            raise ValueError("Dimension error, must be n*k and k*m")
+
+        rows, cols = self.shape[0], matrix.shape[1]
+        if isinstance(matrix, Matrix):
+            right = matrix._flat()
+            out = kernels.zeros(rows * cols)
+            for i in range(rows):
+                base = i * cols
+                for p in self._row_range(i):
+                    value, start = self.data[p], self.indices[p] * cols
+                    for k in range(cols):
+                        out[base + k] += value * right[start + k]
+            return Matrix._wrap(out, (rows, cols))
+
+        indptr, indices, data = array("q", [0]), array("q"), array("d")
+        for i in range(rows):
+            acc: dict[int, float] = {}
+            for p in self._row_range(i):
+                value = self.data[p]
+                for q in matrix._row_range(self.indices[p]):
+                    k = matrix.indices[q]
+                    acc[k] = acc.get(k, 0.0) + value * matrix.data[q]
+            for k in sorted(acc):
+                if acc[k] != 0:
+                    indices.append(k)
+                    data.append(acc[k])
+            indptr.append(len(indices))
+        return SparseMatrix._wrap((rows, cols), indptr, indices, data)
+
+    def __rmul__(self, matrix: Matrix) -> Matrix:
+        """dense x sparse -> dense (every nonzero element of the dense row
+        scales a sparse row of this matrix)
+
+        args:
+            matrix (Matrix): the left dense matrix
+        returns:
+            Matrix: the result of multiplying two matrices
+        """
+        if not isinstance(matrix, Matrix):
+            return NotImplemented
+        if matrix.shape[1] != self.shape[0]:
+            raise ValueError("Dimension error, must be n*k and k*m")
+
+        rows, inner = matrix.shape
+        cols = self.shape[1]
+        left = matrix._flat()
+        out = kernels.zeros(rows * cols)
+        for i in range(rows):
+            base = i * cols
+            for j in range(inner):
+                value = left[i * inner + j]
+                if value == 0:
+                    continue
+                for q in self._row_range(j):
+                    out[base + self.indices[q]] += value * self.data[q]
+        return Matrix._wrap(out, (rows, cols))
+
+    def transp(self) -> SparseMatrix:
+        """Matrix transposition (CSR -> CSR by counting sort of columns)
+
+        returns:
+            A matrix with columns replaced by rows
+        """
+        rows, cols = self.shape
+        indptr = array("q", [0] * (cols + 1))
+        for j in self.indices:
+            indptr[j + 1] += 1
+        for j in range(cols):
+            indptr[j + 1] += indptr[j]
+
+        position = indptr[:-1]
+        indices, data = array("q", [0] * self.nnz), array("d", [0.0]) * self.nnz
+        for i in range(rows):
+            for p in self._row_range(i):
+                j = self.indices[p]
+                indices[position[j]] = i
+                data[position[j]] = self.data[p]
+                position[j] += 1
+        return SparseMatrix._wrap((cols, rows), indptr, indices, data)
+
+    def __str__(self) -> str:
+        """The overload for the print function
+
+        returns:
+            str: The str-matrix, not the address of the object
+        """
+        return str(self.to_dense())
+
+    def __eq__(self, other: object) -> bool:
+        """The overload for the == or != (with sparse or dense matrices)
+
+        returns:
+            bool: True if equal, else False
+        """
+        if isinstance(other, Matrix):
+            return self.to_dense() == other
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        return (
+            self.shape == other.shape
+            and self.indptr == other.indptr
+            and self.indices == other.indices
+            and self.data == other.data
+        )
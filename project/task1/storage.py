@@ -0,0 +1,229 @@
+from __future__ import annotations
+from typing import Any, cast
+from array import array
+import mmap
+import operator
+import os
+import struct
+import sys
+from project.task1.matrices import Matrix
+
+# binary format: 32-byte header + raw little-endian doubles in the row-major order
+# header: magic, version, dtype, ndim, 1 pad byte, rows, cols, 8 pad bytes
+# (the data starts at an 8-byte aligned offset, so it can be mapped as doubles)
+HEADER = struct.Struct("<4sBcBxQQ8x")
+MAGIC = b"SPBM"
+VERSION = 1
+DTYPE = b"d"
+
+MEMORY_LIMIT = 64 * 2**20  # bytes of temporary memory for the streaming operations
+FLOAT_IN_LIST = 32  # bytes of a float object with its pointer in a Python list
+
+
+def pack_header(shape: tuple[int, ...]) -> bytes:
+    """the header for a vector (one dimension) or a matrix (two dimensions)
+
+    args:
+        shape (tuple[int, ...]): (size,) or (rows, cols)
+    returns:
+        bytes: the header
+    """
+    if len(shape) not in (1, 2) or any(x <= 0 for x in shape):
+        raise ValueError("The incorrect dimension of the matrix")
+    rows, cols = (1, shape[0]) if len(shape) == 1 else shape
+    return HEADER.pack(MAGIC, VERSION, DTYPE, len(shape), rows, cols)
+
+
+def unpack_header(header: Any) -> tuple[int, ...]:
+    """parses the header
+
+    args:
+        header (bytes | memoryview): first HEADER.size bytes of the data
+    returns:
+        tuple[int, ...]: (size,) for a vector, (rows, cols) for a matrix
+    raises:
+        ValueError: if the data isn't in the format
+    """
+    if len(header) < HEADER.size:
+        raise ValueError("The data is too short for the header")
+    magic, version, dtype, ndim, rows, cols = HEADER.unpack_from(header)
+    if magic != MAGIC or version != VERSION or dtype != DTYPE or ndim not in (1, 2):
+        raise ValueError("The data isn't in the matrix binary format")
+    return (cols,) if ndim == 1 else (rows, cols)
+
+
+def _little_endian(data: memoryview) -> Any:
+    """contiguous doubles in the little-endian byte order
+    (copied only for strided views and on big-endian machines)"""
+    if sys.byteorder == "little" and data.c_contiguous:
+        return data
+    values = array("d", data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def dumps(data: memoryview, shape: tuple[int, ...]) -> bytes:
+    """serialization of a flat buffer of doubles into the binary format
+
+    args:
+        data (memoryview): doubles in the row-major order
+        shape (tuple[int, ...]): (size,) or (rows, cols)
+    returns:
+        bytes: the header and the raw little-endian doubles
+    """
+    return pack_header(shape) + memoryview(_little_endian(data)).tobytes()
+
+
+def loads(data: Any) -> tuple[tuple[int, ...], memoryview]:
+    """parsing of the binary format without copying: the result is a view of 'data'
+    (read-only for bytes, writable for bytearray / mmap)
+
+    args:
+        data (bytes | bytearray | memoryview): the serialized vector or matrix
+    returns:
+        tuple[tuple[int, ...], memoryview]: the shape and the doubles
+    raises:
+        ValueError: if the data isn't in the format or is shorter than the header says
+    """
+    view = memoryview(data).cast("B")
+    shape = unpack_header(view[: HEADER.size])
+    size = shape[0] if len(shape) == 1 else shape[0] * shape[1]
+    payload = view[HEADER.size : HEADER.size + size * 8]
+    if len(payload) != size * 8:
+        raise ValueError("The data is shorter, than the header says")
+    if sys.byteorder != "little":
+        return shape, memoryview(_little_endian(cast(memoryview, payload.cast("d"))))
+    return shape, cast(memoryview, payload.cast("d"))
+
+
+def dump(path: str | os.PathLike, data: memoryview, shape: tuple[int, ...]) -> None:
+    """writes a flat buffer of doubles into a file of the binary format
+    (the buffer is written directly, without an intermediate bytes object)
+
+    args:
+        path (str | os.PathLike): the file
+        data (memoryview): doubles in the row-major order
+        shape (tuple[int, ...]): (size,) or (rows, cols)
+    """
+    with open(path, "wb") as file:
+        file.write(pack_header(shape))
+        file.write(_little_endian(data))
+
+
+def load(path: str | os.PathLike) -> tuple[tuple[int, ...], memoryview]:
+    """reads a file of the binary format by one read into one preallocated buffer
+
+    args:
+        path (str | os.PathLike): the file
+    returns:
+        tuple[tuple[int, ...], memoryview]: the shape and the (writable) doubles
+    """
+    with open(path, "rb") as file:
+        buffer = bytearray(os.fstat(file.fileno()).st_size)
+        file.readinto(buffer)
+    return loads(buffer)
+
+
+def memmap(path: str | os.PathLike, mode: str = "r", shape: Any = None) -> Matrix:
+    """the matrix over a memory-mapped file: the elements are read from the disk
+    lazily, by pages, when they are accessed
+
+    args:
+        path (str | os.PathLike): the file
+        mode (str): "r" - read-only, "r+" - the changes are written into the file,
+            "w+" - create (or overwrite) the file with zeros of the shape
+        shape (tuple[int, int] | None): the shape for the "w+" mode
+    returns:
+        Matrix: the matrix, which storage is the file
+    """
+    if mode not in ("r", "r+", "w+"):
+        raise ValueError(f"Unknown mode {mode!r}, expected 'r', 'r+' or 'w+'")
+    if sys.byteorder != "little":
+        raise NotImplementedError("memmap needs a little-endian machine")
+
+    if mode == "w+":
+        if shape is None:
+            raise ValueError("The shape is required to create the file")
+        if len(shape) != 2:
+            raise ValueError("The incorrect dimension of the matrix")
+        header = pack_header(tuple(shape))  # validates before the file is truncated
+        with open(path, "wb") as file:
+            file.write(header)
+            file.truncate(HEADER.size + shape[0] * shape[1] * 8)
+
+    with open(path, "rb" if mode == "r" else "r+b") as file:
+        access = mmap.ACCESS_READ if mode == "r" else mmap.ACCESS_WRITE
+        mapped = mmap.mmap(file.fileno(), 0, access=access)
+
+    shape, data = loads(mapped)
+    if len(shape) != 2:
+        raise ValueError("The file contains a vector, not a matrix")
+    return Matrix._wrap(data, (shape[0], shape[1]))
+
+
+def _rows_per_block(row_bytes: int, memory_limit: int) -> int:
+    """quantity of rows of 'row_bytes' bytes, which fit into the memory limit"""
+    return max(1, memory_limit // max(row_bytes, 1))
+
+
+def transp_stream(
+    matrix: Matrix, out: Matrix, memory_limit: int = MEMORY_LIMIT
+) -> Matrix:
+    """transposition into an existing (for example, memory-mapped) matrix
+    block of rows by block of rows, so only one block of pages is in use at once
+
+    args:
+        matrix (Matrix): the matrix (rows x cols)
+        out (Matrix): matrix for the result (cols x rows)
+        memory_limit (int): bytes of the source rows processed at once
+    returns:
+        Matrix: out
+    """
+    rows, cols = matrix.shape
+    if out.shape != (cols, rows):
+        raise ValueError("Dimension error, out must have the shape of the result")
+
+    step = _rows_per_block(cols * 8, memory_limit)
+    for i0 in range(0, rows, step):
+        i1 = min(i0 + step, rows)
+        source = matrix[i0:i1]._flat()
+        for j in range(cols):
+            out[j].value[i0:i1] = source[j::cols]
+    return out
+
+
+def matmul_stream(
+    left: Matrix, right: Matrix, out: Matrix, memory_limit: int = MEMORY_LIMIT
+) -> Matrix:
+    """multiplication into an existing (for example, memory-mapped) matrix with bounded
+    memory: the right matrix is read row by row (sequentially) into tiles of columns,
+    which fit into the memory limit, every tile is multiplied by all rows of the left matrix
+
+    args:
+        left (Matrix): the left matrix (rows x inner)
+        right (Matrix): the right matrix (inner x cols)
+        out (Matrix): matrix for the result (rows x cols)
+        memory_limit (int): bytes for the tile of the right matrix
+    returns:
+        Matrix: out
+    """
+    rows, inner = left.shape
+    cols = right.shape[1]
+    if inner != right.shape[0]:
+        raise ValueError("Dimension error, must be n*k and k*m")
+    if out.shape != (rows, cols):
+        raise ValueError("Dimension error, out must have the shape of the result")
+
+    mul = operator.mul
+    step = _rows_per_block(inner * FLOAT_IN_LIST, memory_limit)  # columns per tile
+    for k0 in range(0, cols, step):
+        k1 = min(k0 + step, cols)
+        tile: list[list[float]] = [[] for _ in range(k1 - k0)]
+        for j in range(inner):
+            for column, value in zip(tile, right[j].value[k0:k1].tolist()):
+                column.append(value)
+        for i in range(rows):
+            row = left[i].value.tolist()
+            out[i].value[k0:k1] = array("d", (sum(map(mul, row, c)) for c in tile))
+    return out
@@ -0,0 +1,222 @@
+from __future__ import annotations
+from typing import Any
+from array import array
+import json
+import operator
+import os
+import pathlib
+from project.task1 import kernels
+from project.task1.kernels import copy_buffer
+
+# square products of at least this side use the Strassen-Winograd recursion
+# in the "auto" mode, scripts/bench_strassen.py measures it on the host machine
+CROSSOVER = 512
+# blocks with this side or smaller are multiplied by the classical blocked kernel
+LEAF_SIZE = 128
+# the crossover, which is measured by the benchmark, is stored here
+CONFIG_PATH = pathlib.Path(
+    os.environ.get(
+        "TASK1_STRASSEN_CONFIG", pathlib.Path.home() / ".cache" / "task1_strassen.json"
+    )
+)
+
+_crossover = CROSSOVER
+_leaf_size = LEAF_SIZE
+
+
+def set_crossover(crossover: int, leaf_size: int | None = None) -> None:
+    """sets the global crossover (and leaf size) of the Strassen-Winograd mode
+
+    args:
+        crossover (int): square products of at least this side use the recursion
+        leaf_size (int | None): side of the classically multiplied blocks,
+            None - keep the current one
+    """
+    global _crossover, _leaf_size
+    if crossover <= 0 or (leaf_size is not None and leaf_size <= 0):
+        raise ValueError("The crossover and the leaf size must be positive")
+    _crossover = crossover
+    if leaf_size is not None:
+        _leaf_size = leaf_size
+
+
+def get_crossover() -> tuple[int, int]:
+    """the global crossover and leaf size
+
+    returns:
+        tuple[int, int]: crossover and leaf size
+    """
+    return _crossover, _leaf_size
+
+
+def save_config(path: Any = None) -> None:
+    """stores the current crossover and leaf size (the benchmark calls it)
+
+    args:
+        path (str | os.PathLike | None): the file, None - CONFIG_PATH
+    """
+    path = pathlib.Path(CONFIG_PATH if path is None else path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"crossover": _crossover, "leaf_size": _leaf_size}))
+
+
+def load_config(path: Any = None) -> bool:
+    """loads the stored crossover and leaf size (it's done once on import)
+
+    args:
+        path (str | os.PathLike | None): the file, None - CONFIG_PATH
+    returns:
+        bool: True if the configuration is loaded, False if there is no valid file
+    """
+    path = pathlib.Path(CONFIG_PATH if path is None else path)
+    try:
+        config = json.loads(path.read_text())
+        set_crossover(int(config["crossover"]), int(config["leaf_size"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    return True
+
+
+def use_strassen(rows: int, inner: int, cols: int) -> bool:
+    """check, that the "auto" mode multiplies these shapes by the recursion
+
+    args:
+        rows (int): rows of the left matrix
+        inner (int): columns of the left matrix
+        cols (int): columns of the right matrix
+    returns:
+        bool: True for square products of at least the crossover side
+    """
+    return rows == inner == cols and rows >= _crossover
+
+
+def padded_size(size: int, leaf_size: int) -> int:
+    """the smallest side, which is halved into blocks of at most leaf_size
+    (leaf * 2^depth, so the padding is less than 2^depth rows)
+
+    args:
+        size (int): side of the matrix
+        leaf_size (int): maximal side of the leaf blocks
+    returns:
+        int: side of the padded matrix
+    """
+    depth = 0
+    while -(-size // 2**depth) > leaf_size:
+        depth += 1
+    return -(-size // 2**depth) * 2**depth
+
+
+def _pad(data: memoryview, size: int, padded: int) -> array:
+    """the flat square matrix, padded by zero rows and columns"""
+    if size == padded:
+        return copy_buffer(data)
+    out = array("d")
+    tail = kernels.zeros(padded - size)
+    for i in range(size):
+        out += copy_buffer(data[i * size : (i + 1) * size])
+        out += tail
+    out += kernels.zeros((padded - size) * padded)
+    return out
+
+
+def _split(data: array, size: int) -> list[array]:
+    """four quadrants (11, 12, 21, 22) of the flat square matrix"""
+    half = size // 2
+    quadrants = [array("d") for _ in range(4)]
+    for i in range(half):
+        top, bottom = i * size, (i + half) * size
+        quadrants[0] += data[top : top + half]
+        quadrants[1] += data[top + half : top + size]
+        quadrants[2] += data[bottom : bottom + half]
+        quadrants[3] += data[bottom + half : bottom + size]
+    return quadrants
+
+
+def _join(c11: array, c12: array, c21: array, c22: array, half: int) -> array:
+    """the flat square matrix from its four quadrants"""
+    out = array("d")
+    for top, bottom in ((c11, c12), (c21, c22)):
+        for i in range(half):
+            out += top[i * half : (i + 1) * half]
+            out += bottom[i * half : (i + 1) * half]
+    return out
+
+
+def _add(left: array, right: array) -> array:
+    return array("d", map(operator.add, left, right))
+
+
+def _sub(left: array, right: array) -> array:
+    return array("d", map(operator.sub, left, right))
+
+
+def _recurse(left: array, right: array, size: int, leaf_size: int, block: int) -> array:
+    """Strassen-Winograd recursion: 7 multiplications and 15 additions of the halves"""
+    if size <= leaf_size:
+        return kernels.matmul(
+            memoryview(left), memoryview(right), size, size, size, block
+        )
+
+    half = size // 2
+    a11, a12, a21, a22 = _split(left, size)
+    b11, b12, b21, b22 = _split(right, size)
+
+    s1 = _add(a21, a22)
+    s2 = _sub(s1, a11)
+    s3 = _sub(a11, a21)
+    s4 = _sub(a12, s2)
+    t1 = _sub(b12, b11)
+    t2 = _sub(b22, t1)
+    t3 = _sub(b22, b12)
+    t4 = _sub(t2, b21)
+
+    p1 = _recurse(a11, b11, half, leaf_size, block)
+    p2 = _recurse(a12, b21, half, leaf_size, block)
+    p3 = _recurse(s4, b22, half, leaf_size, block)
+    p4 = _recurse(a22, t4, half, leaf_size, block)
+    p5 = _recurse(s1, t1, half, leaf_size, block)
+    p6 = _recurse(s2, t2, half, leaf_size, block)
+    p7 = _recurse(s3, t3, half, leaf_size, block)
+
+    u2 = _add(p1, p6)
+    u3 = _add(u2, p7)
+    u4 = _add(u2, p5)
+    return _join(_add(p1, p2), _add(u4, p3), _sub(u3, p4), _add(u3, p5), half)
+
+
+def matmul(
+    left: memoryview,
+    right: memoryview,
+    size: int,
+    leaf_size: int | None = None,
+    block: int = kernels.BLOCK_SIZE,
+) -> array:
+    """multiplication of flat square matrices by the Strassen-Winograd recursion
+    (O(n^2.81) multiplications), the matrices are padded by zeros up to
+    leaf * 2^depth, blocks of at most leaf_size are multiplied by the blocked kernel
+
+    args:
+        left (memoryview): flat row-major buffer of the left matrix (size x size)
+        right (memoryview): flat row-major buffer of the right matrix (size x size)
+        size (int): side of the matrices
+        leaf_size (int | None): maximal side of the leaf blocks, None - the global one
+        block (int): tile side of the leaf kernel
+    returns:
+        array: flat row-major buffer of the product (size x size)
+    """
+    leaf = _leaf_size if leaf_size is None else leaf_size
+    if leaf <= 0:
+        raise ValueError("The leaf size must be positive")
+    padded = padded_size(size, leaf)
+    out = _recurse(
+        _pad(left, size, padded), _pad(right, size, padded), padded, leaf, block
+    )
+    if padded == size:
+        return out
+    result = array("d")
+    for i in range(size):
+        result += out[i * padded : i * padded + size]
+    return result
+
+
+load_config()
@@ -1,22 +1,36 @@
 from __future__ import annotations
-from typing import Sequence
+from typing import Any, Iterator, Sequence, TYPE_CHECKING, cast
+from array import array
+import operator
 import math
+import heapq
+from project.task1 import backend as backends
+from project.task1 import kernels
+from project.task1.kernels import as_buffer, copy_buffer
+
+if TYPE_CHECKING:
+    from project.task1.matrices import Matrix
 
 
 class Vector:
     """
     The vector class has the following methods:
     scalar product, length calculation, finding the angle between vectors.
+
+    Values are stored in a contiguous buffer of doubles (array.array('d'));
+    buffers of doubles (for example, NumPy float64 arrays or matrix rows) are shared, not copied.
     """
 
+    __slots__ = ("value",)
+
     # constructor
-    def __init__(self, vec: Sequence[int | float]):
-        """constructor - save input value as a 'value' of matrix
+    def __init__(self, vec: Sequence[int | float] | memoryview | array):
+        """constructor - save input value as a 'value' of vector
 
         args:
-            vec (Sequence[int | float]): input vector values
+            vec (Sequence[int | float]): input vector values or a buffer of doubles
         """
-        self.value = vec
+        self.value: memoryview = as_buffer(vec)
         if len(self) == 0:
             raise ValueError("The incorrect value of the vector")
 
@@ -28,6 +42,14 @@ class Vector:
         """
         return len(self.value)
 
+    def __iter__(self) -> Iterator[float]:
+        """iteration over the vector values
+
+        returns:
+            Iterator[float]: iterator over values
+        """
+        return iter(self.value)
+
     def __mul__(self, vec1: Vector) -> float:
         """scalar product
 
@@ -36,29 +58,48 @@ class Vector:
         returns:
             int: scalar product of this and the another vector
         """
+        return self.dot(vec1)
+
+    def dot(self, vec1: Vector, backend: str | None = None) -> float:
+        """scalar product with the choice of the backend
 
+        args:
+            vec1 (Vector): another vector for the product
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+        returns:
+            float: scalar product of this and the another vector
+        """
         if len(self) != len(vec1):
             raise ValueError("vectors must be the same size")
 
-        return sum([self.value[i] * vec1.value[i] for i in range(len(self))])
+        if backends.resolve(backend, len(self)) == "numpy":
+            return backends.np_dot(self.value, vec1.value)
+        return sum(map(operator.mul, self.value, vec1.value))
 
-    def angle(self, vec1: Vector) -> float:
+    def angle(self, vec1: Vector, backend: str | None = None) -> float:
         """the angle between this and the another vector
 
         args:
             vec1 (Vector): another vector for the angle calculation
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
         returns:
             float: the angle between this and the another vector
         """
-        return math.acos(self * vec1 / (self.norm() * vec1.norm()))
+        return math.acos(
+            self.dot(vec1, backend) / (self.norm(backend) * vec1.norm(backend))
+        )
 
-    def norm(self) -> float:
+    def norm(self, backend: str | None = None) -> float:
         """the norm (length) of this vector
 
+        args:
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
         returns:
             float: the norm of this vector
         """
-        return sum([x**2 for x in self.value]) ** 0.5
+        if backends.resolve(backend, len(self)) == "numpy":
+            return backends.np_norm(self.value)
+        return sum(x * x for x in self.value) ** 0.5
 
     def __getitem__(self, key: int) -> float:
         """The operator for get value from the vector by the index (key)
@@ -79,10 +120,169 @@ class Vector:
         returns:
             Vector: result of addition
         """
+        return self.add(vec)
+
+    def add(self, vec: Vector, out: Vector | None = None) -> Vector:
+        """addition, the result can be written into an existing vector
+
+        args:
+            vec (Vector): another vector for the addition
+            out (Vector | None): vector for the result (None - a new vector)
+        returns:
+            Vector: result of addition
+        """
+        if len(self) != len(vec) or (out is not None and len(out) != len(self)):
+            raise ValueError("Dimension error")
+
+        data = array("d", map(operator.add, self.value, vec.value))
+        if out is None:
+            return Vector(data)
+        out.value[:] = data
+        return out
+
+    def add_scaled(self, alpha: float, vec: Vector) -> Vector:
+        """in-place self += alpha * vec (axpy) without new vectors
+
+        args:
+            alpha (float): the scale of the another vector
+            vec (Vector): another vector
+        returns:
+            Vector: this vector
+        """
         if len(self) != len(vec):
             raise ValueError("Dimension error")
 
-        return Vector([self[i] + vec[i] for i in range(len(self))])
+        if vec.value.obj is self.value.obj:  # overlapping views of one storage
+            vec = Vector(copy_buffer(vec.value))
+        data: Any = self.value
+        if alpha == 1:
+            for i, x in enumerate(vec.value):
+                data[i] += x
+        else:
+            for i, x in enumerate(vec.value):
+                data[i] += alpha * x
+        return self
+
+    def __iadd__(self, vec: Vector) -> Vector:
+        """in-place addition (+=), the storage is reused
+
+        args:
+            vec (Vector): another vector for the addition
+        returns:
+            Vector: this vector
+        """
+        if not isinstance(vec, Vector):
+            return NotImplemented
+        return self.add_scaled(1, vec)
+
+    def __isub__(self, vec: Vector) -> Vector:
+        """in-place subtraction (-=), the storage is reused
+
+        args:
+            vec (Vector): another vector for the subtraction
+        returns:
+            Vector: this vector
+        """
+        if not isinstance(vec, Vector):
+            return NotImplemented
+        return self.add_scaled(-1, vec)
+
+    def __imul__(self, alpha: float) -> Vector:  # type: ignore[misc]
+        """in-place multiplication by a scalar (*=), the storage is reused
+
+        args:
+            alpha (float): the scalar
+        returns:
+            Vector: this vector
+        """
+        if not isinstance(alpha, (int, float)):
+            return NotImplemented
+        data: Any = self.value
+        for i in range(len(data)):
+            data[i] *= alpha
+        return self
+
+    def tolist(self) -> list[float]:
+        """the vector values as a Python list
+
+        returns:
+            list[float]: copy of the values
+        """
+        return cast(list[float], self.value.tolist())
+
+    def copy(self) -> Vector:
+        """a vector with its own copy of the storage (views become independent)
+
+        returns:
+            Vector: copy of this vector
+        """
+        return Vector(copy_buffer(self.value))
+
+    def to_bytes(self) -> bytes:
+        """serialization into the binary format (project.task1.storage):
+        a fixed header and raw little-endian doubles
+
+        returns:
+            bytes: the serialized vector
+        """
+        from project.task1 import storage
+
+        return storage.dumps(self.value, (len(self),))
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> Vector:
+        """deserialization from the binary format without copying:
+        the vector shares the buffer (read-only for bytes)
+
+        args:
+            data (bytes | bytearray | memoryview): the serialized vector
+        returns:
+            Vector: the vector over the data
+        """
+        from project.task1 import storage
+
+        shape, values = storage.loads(data)
+        if len(shape) != 1:
+            raise ValueError("The data contains a matrix, not a vector")
+        return cls(values)
+
+    def save(self, path: Any) -> None:
+        """writes the vector into a file of the binary format
+
+        args:
+            path (str | os.PathLike): the file
+        """
+        from project.task1 import storage
+
+        storage.dump(path, self.value, (len(self),))
+
+    @classmethod
+    def load(cls, path: Any) -> Vector:
+        """reads the vector from a file of the binary format by one read
+
+        args:
+            path (str | os.PathLike): the file
+        returns:
+            Vector: the vector with the writable storage
+        """
+        from project.task1 import storage
+
+        shape, values = storage.load(path)
+        if len(shape) != 1:
+            raise ValueError("The file contains a matrix, not a vector")
+        return cls(values)
+
+    def freeze(self) -> FrozenVector:
+        """the immutable copy of this vector (with the cached norm and hash)
+
+        returns:
+            FrozenVector: the vector, which can't be changed
+        """
+        return self if isinstance(self, FrozenVector) else FrozenVector(self.value)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """pickle support (memoryview itself can't be pickled)"""
+        return (self.__class__, (copy_buffer(self.value),))
 
     def __str__(self) -> str:
         """The overload for the print function
@@ -90,7 +290,7 @@ class Vector:
         returns:
             str: The str-vector, not the address of the object
         """
-        return f"{self.value}"
+        return f"{self.value.tolist()}"
 
     def __eq__(self, other: object) -> bool:
         """The overload for the == or !=
@@ -101,3 +301,283 @@ class Vector:
         if not isinstance(other, Vector):
             return NotImplemented
         return self.value == other.value
+
+
+class FrozenVector(Vector):
+    """
+    The immutable vector: values are copied into its own read-only buffer,
+    so the norm and the hash are computed once and cached
+    (frozen vectors can be used as dict keys).
+    """
+
+    __slots__ = ("_norm", "_hash")
+    _norm: float | None
+    _hash: int | None
+
+    def __init__(self, vec: Sequence[int | float] | memoryview | array):
+        """constructor - save a read-only copy of input values
+
+        args:
+            vec (Sequence[int | float]): input vector values or a buffer of doubles
+        """
+        data = copy_buffer(as_buffer(vec))
+        if len(data) == 0:
+            raise ValueError("The incorrect value of the vector")
+        object.__setattr__(self, "value", memoryview(data).toreadonly())
+        object.__setattr__(self, "_norm", None)
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """the vector is immutable"""
+        raise AttributeError("FrozenVector is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """the vector is immutable"""
+        raise AttributeError("FrozenVector is immutable")
+
+    def add_scaled(self, alpha: float, vec: Vector) -> Vector:
+        """the vector is immutable"""
+        raise TypeError("FrozenVector is immutable")
+
+    def __imul__(self, alpha: float) -> Vector:  # type: ignore[misc, override]
+        """the vector is immutable"""
+        raise TypeError("FrozenVector is immutable")
+
+    def norm(self, backend: str | None = None) -> float:
+        """the norm (length) of this vector (computed once)
+
+        args:
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+        returns:
+            float: the norm of this vector
+        """
+        if self._norm is None:
+            norm = super().norm(backend)
+            object.__setattr__(self, "_norm", norm)
+            return norm
+        return self._norm
+
+    def __hash__(self) -> int:
+        """hash of the values (computed once)
+
+        returns:
+            int: hash of this vector
+        """
+        if self._hash is None:
+            value = hash(tuple(self.value.tolist()))
+            object.__setattr__(self, "_hash", value)
+            return value
+        return self._hash
+
+
+class VectorBatch:
+    """
+    N vectors of equal dimension in one contiguous row-major buffer of doubles
+    with batched operations: scalar products, norms, pairwise cosine and angle matrices,
+    top-k nearest neighbours.
+
+    The norms are computed once and cached, so the batch shouldn't be changed
+    through the vector views after the first call of norms().
+    """
+
+    def __init__(self, vectors: Sequence[Vector] | Sequence[Sequence[int | float]]):
+        """constructor - pack the vectors into one buffer
+
+        args:
+            vectors (Sequence[Vector] | Sequence[Sequence[int | float]]): vectors of equal dimension
+        """
+        if not vectors or len(vectors[0]) == 0:
+            raise ValueError("The incorrect value of the vector")
+
+        dim = len(vectors[0])
+        data = array("d")
+        for vec in vectors:
+            if len(vec) != dim:
+                raise ValueError("vectors must be the same size")
+            if isinstance(vec, Vector):
+                data.extend(copy_buffer(vec.value))
+            else:
+                data.extend(cast(Sequence[float], vec))
+        self._init_storage(memoryview(data), dim)
+
+    def _init_storage(self, data: memoryview, dim: int) -> None:
+        """saves the buffer and resets the cache of norms
+
+        args:
+            data (memoryview): flat buffer of doubles (len(data) == N * dim)
+            dim (int): dimension of the vectors
+        """
+        self.data = data
+        self.dim = dim
+        self._norms: array | None = None
+
+    @classmethod
+    def from_buffer(cls, buffer: Any, dim: int) -> VectorBatch:
+        """creates a batch over a flat buffer of doubles without copying
+
+        args:
+            buffer (Any): object with the buffer protocol or a flat sequence of numbers
+            dim (int): dimension of the vectors
+        returns:
+            VectorBatch: the batch, which shares the buffer
+        """
+        data = as_buffer(buffer)
+        if dim <= 0 or len(data) == 0 or len(data) % dim != 0:
+            raise ValueError("The incorrect value of the vector")
+        result = cls.__new__(cls)
+        result._init_storage(data, dim)
+        return result
+
+    def __len__(self) -> int:
+        """length function
+
+        returns:
+            int: quantity of vectors in the batch
+        """
+        return len(self.data) // self.dim
+
+    def __getitem__(self, key: int) -> Vector:
+        """The operator for get vector (view) from the batch by the index (key)
+
+        args:
+            key (int): key for vector
+        returns:
+            Vector: vector, which is in this batch by the key
+        """
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("batch index out of range")
+        return Vector(self.data[key * self.dim : (key + 1) * self.dim])
+
+    def norms(self, backend: str | None = None) -> array:
+        """norms of all vectors (computed by the first call and cached)
+
+        args:
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+        returns:
+            array: norm of every vector
+        """
+        if self._norms is None:
+            if backends.resolve(backend, len(self.data)) == "numpy":
+                self._norms = array("d", backends.np_norms(self.data, self.dim))
+            else:
+                self._norms = array(
+                    "d", (self[i].norm("python") for i in range(len(self)))
+                )
+        return self._norms
+
+    def dot(self, vec: Vector, backend: str | None = None) -> array:
+        """scalar products of every vector of the batch with the vector
+
+        args:
+            vec (Vector): another vector
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+        returns:
+            array: scalar product for every vector of the batch
+        """
+        if len(vec) != self.dim:
+            raise ValueError("vectors must be the same size")
+        return array("d", self._dots(self, vec.value, 1, backend))
+
+    def _dots(
+        self, batch: VectorBatch, other: memoryview, count: int, backend: str | None
+    ) -> memoryview:
+        """flat (len(batch) x count) matrix of scalar products of the batch vectors
+        with 'count' vectors from the flat buffer 'other'"""
+        rows, dim = len(batch), batch.dim
+        if backends.resolve(backend, rows * dim * count) == "numpy":
+            return as_buffer(
+                backends.np_matmul_transposed(batch.data, other, rows, dim, count)
+            )
+        out = memoryview(kernels.zeros(rows * count))
+        kernels.matmul_transposed(batch.data, other, out, rows, dim, count)
+        return out
+
+    def dots(
+        self, other: VectorBatch | None = None, backend: str | None = None
+    ) -> Matrix:
+        """pairwise scalar products (Gram matrix)
+
+        args:
+            other (VectorBatch | None): another batch (None - this batch)
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+        returns:
+            Matrix: element [i][j] - scalar product of the i-th vector and the j-th vector of other
+        """
+        from project.task1.matrices import Matrix
+
+        other = self if other is None else other
+        if other.dim != self.dim:
+            raise ValueError("vectors must be the same size")
+        data = self._dots(self, other.data, len(other), backend)
+        return Matrix._wrap(data, (len(self), len(other)))
+
+    def cosine(
+        self, other: VectorBatch | None = None, backend: str | None = None
+    ) -> Matrix:
+        """pairwise cosine similarities
+
+        args:
+            other (VectorBatch | None): another batch (None - this batch)
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+        returns:
+            Matrix: element [i][j] - cosine of the angle between the i-th vector and the j-th vector of other
+        """
+        from project.task1.matrices import Matrix
+
+        other = self if other is None else other
+        cols = len(other)
+        dots = self.dots(other, backend)._flat()
+        other_norms = other.norms(backend)
+        data = array("d")
+        for i, norm in enumerate(self.norms(backend)):
+            row = dots[i * cols : (i + 1) * cols]
+            data.extend(dot / (norm * n) for dot, n in zip(row, other_norms))
+        return Matrix._wrap(data, (len(self), cols))
+
+    def angles(
+        self, other: VectorBatch | None = None, backend: str | None = None
+    ) -> Matrix:
+        """pairwise angles
+
+        args:
+            other (VectorBatch | None): another batch (None - this batch)
+            backend (str | None): "auto", "python", "numpy" or None (the global backend)
+        returns:
+            Matrix: element [i][j] - angle between the i-th vector and the j-th vector of other
+        """
+        from project.task1.matrices import Matrix
+
+        cosine = self.cosine(other, backend)
+        data = array("d", (math.acos(min(1.0, max(-1.0, c))) for c in cosine._flat()))
+        return Matrix._wrap(data, cosine.shape)
+
+    def nearest(
+        self, query: Vector, k: int = 1, metric: str = "cosine"
+    ) -> list[tuple[int, float]]:
+        """top-k nearest neighbours of the query in the batch
+
+        args:
+            query (Vector): the query vector
+            k (int): quantity of neighbours
+            metric (str): "cosine" (by the biggest cosine similarity)
+                or "euclidean" (by the smallest distance)
+        returns:
+            list[tuple[int, float]]: (index in the batch, similarity or distance), best first
+        """
+        dots = self.dot(query)
+        norms = self.norms()
+        query_norm = query.norm()
+        if metric == "cosine":
+            scores = [dot / (norm * query_norm) for dot, norm in zip(dots, norms)]
+            best = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+        elif metric == "euclidean":
+            scores = [
+                max(0.0, norm * norm + query_norm * query_norm - 2 * dot) ** 0.5
+                for dot, norm in zip(dots, norms)
+            ]
+            best = heapq.nsmallest(k, range(len(scores)), key=scores.__getitem__)
+        else:
+            raise ValueError(f"Unknown metric {metric!r}")
+        return [(i, scores[i]) for i in best]
@@ -0,0 +1,174 @@
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+    Union,
+)
+import asyncio
+import inspect
+
+
+async def agenerator(data: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator:
+    """
+    an async generator, that lazy-sequentially outputs elements
+
+    args:
+        data (Iterable | AsyncIterable): any iterable object (list, range, generator...)
+            or async iterable object (async generator, socket reader, database cursor...)
+    returns:
+        async generator, that lazy-sequentially outputs elements
+    """
+    if isinstance(data, AsyncIterable):
+        async for i in data:
+            yield i
+    else:
+        for i in data:
+            yield i
+
+
+async def _call(func: Callable, item: Any) -> Any:
+    """
+    calls a sync function or a coroutine function
+    """
+    result = func(item)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _concurrent(
+    source: AsyncIterable[Any],
+    func: Callable[[Any], Awaitable[Any]],
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator:
+    """
+    runs func for the elements of the source in at most 'concurrency' tasks at once,
+    the next element is read only, when there is a free place (backpressure)
+    """
+    pending: deque = deque()
+    running: set = set()
+    try:
+        async for item in source:
+            task = asyncio.ensure_future(func(item))
+            if ordered:
+                pending.append(task)
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+            else:
+                running.add(task)
+                if len(running) >= concurrency:
+                    done, running = await asyncio.wait(
+                        running, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for finished in done:
+                        yield finished.result()
+
+        while pending:
+            yield await pending.popleft()
+        while running:
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for finished in done:
+                yield finished.result()
+    finally:
+        for task in list(pending) + list(running):
+            task.cancel()
+
+
+def amap(
+    func: Callable, concurrency: int = 1, ordered: bool = True
+) -> Callable[[AsyncIterable[Any]], AsyncIterator]:
+    """
+    a stage of apipeline, that applies a coroutine function (or a sync function)
+    to every element, up to 'concurrency' calls overlap
+
+    args:
+        func (Callable): async def func(item) or def func(item)
+        concurrency (int): quantity of calls, which run at once
+        ordered (bool): keep the order of the source (False - output the results,
+            when they are ready)
+    returns:
+        the stage (async iterable -> async iterator)
+    """
+    if concurrency <= 0:
+        raise ValueError("The concurrency must be positive")
+
+    def stage(source: AsyncIterable[Any]) -> AsyncIterator:
+        return _concurrent(source, lambda item: _call(func, item), concurrency, ordered)
+
+    return stage
+
+
+def afilter(
+    predicate: Callable, concurrency: int = 1, ordered: bool = True
+) -> Callable[[AsyncIterable[Any]], AsyncIterator]:
+    """
+    a stage of apipeline, that keeps the elements, for which the (async) predicate is true,
+    up to 'concurrency' checks overlap
+
+    args:
+        predicate (Callable): async def predicate(item) or def predicate(item)
+        concurrency (int): quantity of checks, which run at once
+        ordered (bool): keep the order of the source
+    returns:
+        the stage (async iterable -> async iterator)
+    """
+    if concurrency <= 0:
+        raise ValueError("The concurrency must be positive")
+
+    async def check(item: Any) -> tuple:
+        return item, await _call(predicate, item)
+
+    async def stage(source: AsyncIterable[Any]) -> AsyncIterator:
+        async for item, keep in _concurrent(source, check, concurrency, ordered):
+            if keep:
+                yield item
+
+    return stage
+
+
+def apipeline(
+    source: Union[Iterable[Any], AsyncIterable[Any]], *operations: Callable
+) -> Any:
+    """
+    an async pipeline, that sequentially applies passed operations to the input sequence
+
+    args:
+        source (Iterable | AsyncIterable): any (async) iterable object
+        *operations (Callable): operations for the sequential execution,
+            every stage gets the async iterable of the previous stage
+            (amap(...), afilter(...), async generator functions, acollect...),
+            per-element coroutine functions must be wrapped: amap(f)
+    returns:
+        any value
+        example:
+            - stages return a lazy async iterator
+            - acollect returns a coroutine of the collection
+    """
+    result: Any = agenerator(source)
+    for oper in operations:
+        result = oper(result)
+
+    return result
+
+
+async def acollect(
+    gen: Union[Iterable[Any], AsyncIterable[Any]], output_type: Callable = list
+) -> Sequence:
+    """
+    collects async generator's result into a collection (list default)
+
+    args:
+        gen (Iterable | AsyncIterable): async generator for processing
+        output_type (Callable): the callable object, that create the sequence
+    returns:
+        collection
+    """
+    return output_type([item async for item in agenerator(gen)])
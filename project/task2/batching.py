@@ -0,0 +1,106 @@
+from array import array
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, Union
+import time
+
+
+class BatchStream:
+    """
+    a stream of batches (lists or array chunks), which is produced by
+    generator(data, batch_size=...): pipeline() passes whole batches to batch-aware
+    stages, applies element-wise stages batch by batch and flattens the stream for
+    the other stages, collect() flattens the batches back
+    """
+
+    def __init__(self, batches: Iterable[Any]):
+        """
+        constructor - wraps an iterable of batches
+
+        args:
+            batches (Iterable): iterable of lists / arrays of elements
+        """
+        self.batches = batches
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.batches)
+
+    def flatten(self) -> Iterator[Any]:
+        """
+        the elements of all batches
+
+        returns:
+            lazy iterator over the elements
+        """
+        return chain.from_iterable(self.batches)
+
+
+def batch_aware(stage: Callable) -> Callable:
+    """
+    marks a stage as batch-aware: on a BatchStream it gets the iterable of batches
+    and must return an iterable of batches (for example, vectorized NumPy work)
+
+    args:
+        stage (Callable): the stage (iterable of batches -> iterable of batches)
+    returns:
+        the same stage
+    """
+    stage.batch_aware = True  # type: ignore[attr-defined]
+    return stage
+
+
+def batches(
+    data: Iterable[Any],
+    batch_size: int,
+    max_delay: Union[float, None] = None,
+    typecode: Union[str, None] = None,
+) -> Iterator[Any]:
+    """
+    groups the elements into batches of batch_size elements, a batch is closed earlier,
+    when max_delay seconds passed since its first element (it's checked, when
+    the next element arrives, so slow sources don't hold elements for long)
+
+    args:
+        data (Iterable): any iterable object
+        batch_size (int): maximal quantity of elements in a batch
+        max_delay (float | None): maximal age of a batch in seconds, None - no limit
+        typecode (str | None): array typecode of the batches ("d", "q"...), None - lists
+    returns:
+        generator of batches
+    """
+    if batch_size <= 0:
+        raise ValueError("The batch size must be positive")
+    if max_delay is not None and max_delay <= 0:
+        raise ValueError("The delay must be positive")
+    return _batches(iter(data), batch_size, max_delay, typecode)
+
+
+def _batches(
+    iterator: Iterator[Any],
+    batch_size: int,
+    max_delay: Union[float, None],
+    typecode: Union[str, None],
+) -> Iterator[Any]:
+    """
+    the generator of batches() (the arguments are already checked)
+    """
+    new: Callable[[], Any] = list if typecode is None else lambda: array(typecode)
+
+    if max_delay is None:
+        while True:
+            batch = new()
+            batch.extend(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    batch = new()
+    started = 0.0
+    for item in iterator:
+        if not batch:
+            started = time.monotonic()
+        batch.append(item)
+        if len(batch) >= batch_size or time.monotonic() - started >= max_delay:
+            yield batch
+            batch = new()
+    if batch:
+        yield batch
@@ -0,0 +1,290 @@
+from heapq import merge
+from itertools import chain, islice
+from typing import IO, Any, Callable, Iterable, Iterator, List, Sequence, Tuple, Union
+import math
+import pickle
+import sys
+import tempfile
+from project.task2.operators import Operator
+
+MEMORY_LIMIT = 64 * 2**20  # bytes of the elements, which are kept in memory
+POINTER = 8  # bytes of a reference in a Python list or set
+CHUNK = 1024  # elements in one pickle record of a temporary file
+MERGE_FAN_IN = 64  # maximal quantity of runs (open files), which are merged at once
+PARTITIONS = 16  # temporary files of one spill of DistinctStage
+MAX_DEPTH = 8  # maximal nesting of the spills of DistinctStage
+
+
+def _size(item: Any) -> int:
+    """
+    shallow estimate of the memory of an element in a container
+    """
+    return sys.getsizeof(item) + POINTER
+
+
+def _write(file: IO[bytes], items: Iterable[Any]) -> None:
+    """
+    writes the elements into a temporary file as pickled chunks
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, CHUNK))
+        if not chunk:
+            break
+        pickle.dump(chunk, file, pickle.HIGHEST_PROTOCOL)
+    file.flush()
+
+
+def _read(file: IO[bytes]) -> Iterator[Any]:
+    """
+    reads the elements of a temporary file from the beginning
+    """
+    file.seek(0)
+    while True:
+        try:
+            chunk = pickle.load(file)
+        except EOFError:
+            return
+        yield from chunk
+
+
+class SortStage(Operator):
+    """
+    external merge sort: the elements are collected, while their estimated size
+    is below memory_limit, then the sorted run is spilled to a temporary file,
+    at the end the runs are merged (heapq.merge), so the memory is bounded
+    by memory_limit and the chunks of the open runs
+
+    the sort is stable, as sorted(), the first element is output, when the whole
+    input is read, the temporary files are deleted, when the output is exhausted
+    or closed, the elements must be picklable
+    """
+
+    def __init__(
+        self,
+        key: Union[Callable[[Any], Any], None] = None,
+        memory_limit: int = MEMORY_LIMIT,
+        reverse: bool = False,
+        tmpdir: Union[str, None] = None,
+    ):
+        """
+        args:
+            key (Callable | None): the key of the comparison, as in sorted()
+            memory_limit (int): bytes of the elements in memory (shallow estimate)
+            reverse (bool): descending order
+            tmpdir (str | None): directory of the temporary files, None - the default one
+        """
+        if memory_limit <= 0:
+            raise ValueError("The memory limit must be positive")
+        self.key = key
+        self.memory_limit = memory_limit
+        self.reverse = reverse
+        self.tmpdir = tmpdir
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        return self._sort(iter(iterable))
+
+    def _spill(
+        self, items: Iterable[Any], runs: List[IO[bytes]], files: List[IO[bytes]]
+    ) -> None:
+        """
+        writes a sorted run into a new temporary file
+        """
+        run = tempfile.TemporaryFile(dir=self.tmpdir)
+        files.append(run)
+        runs.append(run)
+        _write(run, items)
+
+    def _merge(self, iterables: Sequence[Iterable[Any]]) -> Iterator[Any]:
+        return merge(*iterables, key=self.key, reverse=self.reverse)
+
+    def _sort(self, iterator: Iterator[Any]) -> Iterator[Any]:
+        runs: List[IO[bytes]] = []
+        files: List[IO[bytes]] = []  # all temporary files, they are closed at the end
+        try:
+            buffer: List[Any] = []
+            used = 0
+            for item in iterator:
+                buffer.append(item)
+                used += _size(item)
+                if used > self.memory_limit:
+                    buffer.sort(key=self.key, reverse=self.reverse)
+                    self._spill(buffer, runs, files)
+                    buffer, used = [], 0
+            buffer.sort(key=self.key, reverse=self.reverse)
+
+            # the runs are merged in groups, while there are too many open files,
+            # the groups are consecutive, so the order of equal elements is kept
+            while len(runs) >= MERGE_FAN_IN:
+                merged: List[IO[bytes]] = []
+                for i in range(0, len(runs), MERGE_FAN_IN):
+                    group = runs[i : i + MERGE_FAN_IN]
+                    group_runs = [_read(run) for run in group]
+                    self._spill(self._merge(group_runs), merged, files)
+                    for run in group:
+                        run.close()
+                runs = merged
+
+            # the last run stays in memory, it is the last one in the input
+            yield from self._merge([_read(run) for run in runs] + [buffer])
+        finally:
+            for file in files:
+                file.close()
+
+
+class BloomFilter:
+    """
+    approximate set of hashable objects with a fixed memory: the membership test
+    has no false negatives and about 'error_rate' false positives,
+    when at most 'capacity' objects were added
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        args:
+            capacity (int): expected quantity of the objects
+            error_rate (float): expected rate of the false positives
+        """
+        if capacity <= 0:
+            raise ValueError("The capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("The error rate must be between 0 and 1")
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: Any) -> Iterator[int]:
+        """
+        positions of the bits of an object (double hashing)
+        """
+        first = hash(value)
+        second = hash((value, 0x5BD1E995)) | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def add(self, value: Any) -> bool:
+        """
+        adds an object
+
+        returns:
+            True, if the object was (probably) already in the filter
+        """
+        present = True
+        for position in self._positions(value):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] >> bit & 1:
+                present = False
+                self.bits[byte] |= 1 << bit
+        return present
+
+    def __contains__(self, value: Any) -> bool:
+        return all(
+            self.bits[position // 8] >> position % 8 & 1
+            for position in self._positions(value)
+        )
+
+
+class DistinctStage(Operator):
+    """
+    outputs the first occurrence of every element (or key), incrementally
+
+    exact mode: the keys are kept in a set, while their estimated size is below
+    memory_limit, then the rest of the stream (with the keys, which were seen)
+    is spilled to temporary files by the hash of the key and every file is
+    deduplicated separately, so after a spill the elements are output at the end
+    of the stream and not in the order of the input
+
+    approximate mode: a BloomFilter of 'capacity' keys, the memory is fixed,
+    the order of the input is kept, but about 'error_rate' of the new elements
+    are lost as false duplicates
+
+    the keys must be hashable (and picklable in the exact mode, as the elements)
+    """
+
+    def __init__(
+        self,
+        key: Union[Callable[[Any], Any], None] = None,
+        memory_limit: int = MEMORY_LIMIT,
+        approximate: bool = False,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        tmpdir: Union[str, None] = None,
+    ):
+        """
+        args:
+            key (Callable | None): the key of an element, None - the element itself
+            memory_limit (int): bytes of the keys in memory (exact mode, shallow estimate)
+            approximate (bool): use a Bloom filter instead of the exact set
+            capacity (int): expected quantity of distinct keys (approximate mode)
+            error_rate (float): rate of the false duplicates (approximate mode)
+            tmpdir (str | None): directory of the temporary files, None - the default one
+        """
+        if memory_limit <= 0:
+            raise ValueError("The memory limit must be positive")
+        if approximate:
+            BloomFilter(capacity, error_rate)  # checks the arguments
+        self.key = key
+        self.memory_limit = memory_limit
+        self.approximate = approximate
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.tmpdir = tmpdir
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        if self.approximate:
+            return self._approximate(iter(iterable))
+        key = (lambda item: item) if self.key is None else self.key
+        records = ((key(item), True, item) for item in iterable)
+        return self._exact(records, 0)
+
+    def _approximate(self, iterator: Iterator[Any]) -> Iterator[Any]:
+        seen = BloomFilter(self.capacity, self.error_rate)
+        for item in iterator:
+            if not seen.add(item if self.key is None else self.key(item)):
+                yield item
+
+    def _exact(
+        self, records: Iterator[Tuple[Any, bool, Any]], depth: int
+    ) -> Iterator[Any]:
+        """
+        deduplication of (key, output, element) records: the records with
+        output=False only mark the keys, which were already output
+        """
+        seen: set = set()
+        used = 0
+        for record in records:
+            key, output, item = record
+            if key in seen:
+                continue
+            used += _size(key)
+            if used > self.memory_limit and depth < MAX_DEPTH:
+                yield from self._spill(chain([record], records), seen, depth)
+                return
+            seen.add(key)
+            if output:
+                yield item
+
+    def _spill(
+        self, records: Iterator[Tuple[Any, bool, Any]], seen: set, depth: int
+    ) -> Iterator[Any]:
+        """
+        partitions the seen keys and the rest of the records by the hash of the key
+        """
+        files = [tempfile.TemporaryFile(dir=self.tmpdir) for _ in range(PARTITIONS)]
+        try:
+            partitions: List[List[Any]] = [[] for _ in files]
+            for record in chain(((key, False, None) for key in seen), records):
+                index = hash((depth, record[0])) % PARTITIONS
+                partitions[index].append(record)
+                if len(partitions[index]) >= CHUNK:
+                    _write(files[index], partitions[index])
+                    partitions[index] = []
+            seen.clear()
+            for file, part in zip(files, partitions):
+                _write(file, part)
+            for file in files:
+                yield from self._exact(_read(file), depth + 1)
+                file.close()
+        finally:
+            for file in files:
+                file.close()
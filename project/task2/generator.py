@@ -1,43 +1,90 @@
 from functools import reduce
-from typing import Callable, Iterable, Generator, Any, Sequence
+from itertools import repeat
+from typing import Callable, Iterable, Generator, Any, Sequence, Union
+from project.task2.batching import BatchStream, batches
+from project.task2.operators import fuse
 
 
-def generator(data: Iterable[Any]) -> Generator:
+def generator(
+    data: Iterable[Any],
+    batch_size: Union[int, None] = None,
+    max_delay: Union[float, None] = None,
+    typecode: Union[str, None] = None,
+) -> Union[Generator, BatchStream]:
     """
     a generator, that lazy-sequentially outputs elements
+    or batches of elements (the micro-batching mode)
 
     args:
         data (Iterable): any iterable object (list, range, generator...)
+        batch_size (int | None): output batches of this size, None - single elements
+        max_delay (float | None): close a batch, when it is older than max_delay seconds
+        typecode (str | None): array typecode of the batches, None - lists
     returns:
-        generator, that lazy-sequentially outputs elements
+        generator, that lazy-sequentially outputs elements,
+        or BatchStream of batches for pipeline() and collect()
     """
+    if batch_size is None:
+        return _generate(data)
+    return BatchStream(batches(data, batch_size, max_delay, typecode))
+
+
+def _generate(data: Iterable[Any]) -> Generator:
     for i in data:
         yield i
 
 
+def _per_batch(oper: Callable, batch: Any) -> list:
+    """
+    applies an element-wise stage to one batch
+    """
+    return list(oper(batch))
+
+
 def pipeline(source: Iterable[Any], *operations: Callable) -> Any:
     """
     a pipeline, that sequentially applies passed operations to the input sequence
 
     args:
         source (Iterable)": any iterable object (list, range, generator...)
-        *operations (Callable): operations for the sequential execution (* convert to the tuple)
+        *operations (Callable): operations for the sequential execution (* convert to the tuple),
+            consecutive Map / Filter operator objects are fused into one loop
+            for a BatchStream source (generator(data, batch_size=...)):
+            - batch-aware stages (batch_aware, MapBatches) get the iterable of batches,
+            - element-wise operators (Map, Filter, FlatMap) are applied batch by batch,
+            - other stages get the flattened stream, the next stages work with elements
     returns:
         any value
         example:
             - map, filter returns lazy-iterator
             - reduce returns one finally value
     """
-    result = source
-    for oper in operations:
-        result = oper(result)
+    result: Any = source
+    for oper in fuse(operations):
+        result = _apply(oper, result)
 
     return result
 
 
+def _apply(oper: Callable, result: Any) -> Any:
+    """
+    applies one stage to the result of the previous one
+    (with the rules of a BatchStream, see pipeline())
+    """
+    if not isinstance(result, BatchStream):
+        return oper(result)
+    if getattr(oper, "batch_aware", False):
+        return BatchStream(oper(result))
+    if getattr(oper, "elementwise", False):
+        per_batch = map(_per_batch, repeat(oper), result)
+        return BatchStream(filter(None, per_batch))  # without empty batches
+    return oper(result.flatten())
+
+
 def collect(gen: Iterable[Any], output_type: Callable = list) -> Sequence:
     """
-    collects generator's result into a collection (list default)
+    collects generator's result into a collection (list default),
+    the batches of a BatchStream are flattened back into elements
 
     args:
         gen (Iterable): generator for processing
@@ -45,4 +92,6 @@ def collect(gen: Iterable[Any], output_type: Callable = list) -> Sequence:
     returns:
         collection
     """
+    if isinstance(gen, BatchStream):
+        return output_type(gen.flatten())
     return output_type(gen)
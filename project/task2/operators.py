@@ -0,0 +1,210 @@
+import abc
+from functools import lru_cache, reduce
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, Union
+
+_MISSING = object()
+
+
+class Operator(abc.ABC):
+    """
+    a stage of the pipeline, that pipeline() can inspect:
+    it is called with the iterable of the previous stage, as any other stage,
+    subclasses must implement __call__
+
+    'elementwise' operators process every element independently, so they are applied
+    batch by batch to a BatchStream, 'batch_aware' operators get whole batches
+    """
+
+    elementwise = False
+    batch_aware = False
+
+    @abc.abstractmethod
+    def __call__(self, iterable: Iterable[Any]) -> Any:
+        """
+        applies the stage to the output of the previous one
+        """
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+class Map(Operator):
+    """
+    applies the function to every element (fusable with neighbouring Map and Filter)
+    """
+
+    elementwise = True
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        return map(self.func, iterable)
+
+
+class Filter(Operator):
+    """
+    keeps the elements, for which the predicate is true
+    (fusable with neighbouring Map and Filter)
+    """
+
+    elementwise = True
+
+    def __init__(self, predicate: Callable[[Any], Any]):
+        self.func = predicate
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        return filter(self.func, iterable)
+
+
+class FlatMap(Operator):
+    """
+    applies the function, that returns an iterable, to every element
+    and outputs the elements of the results
+    """
+
+    elementwise = True
+
+    def __init__(self, func: Callable[[Any], Iterable[Any]]):
+        self.func = func
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        return chain.from_iterable(map(self.func, iterable))
+
+
+class Take(Operator):
+    """
+    outputs the first n elements (the rest of the source isn't read)
+    """
+
+    def __init__(self, n: int):
+        if n < 0:
+            raise ValueError("The quantity of elements must be non-negative")
+        self.n = n
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        return islice(iterable, self.n)
+
+
+class Reduce(Operator):
+    """
+    folds the elements into one value (the last stage of the pipeline)
+    """
+
+    def __init__(self, func: Callable[[Any, Any], Any], initial: Any = _MISSING):
+        self.func = func
+        self.initial = initial
+
+    def __call__(self, iterable: Iterable[Any]) -> Any:
+        if self.initial is _MISSING:
+            return reduce(self.func, iterable)
+        return reduce(self.func, iterable, self.initial)
+
+    def __repr__(self) -> str:
+        if self.initial is _MISSING:
+            return f"Reduce(func={self.func!r})"
+        return f"Reduce(func={self.func!r}, initial={self.initial!r})"
+
+
+class Batch(Operator):
+    """
+    groups the elements into lists of 'size' elements (the last one can be shorter)
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("The batch size must be positive")
+        self.size = size
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[list]:
+        iterator = iter(iterable)
+        while True:
+            batch = list(islice(iterator, self.size))
+            if not batch:
+                return
+            yield batch
+
+
+class MapBatches(Operator):
+    """
+    applies the function to every batch of a BatchStream
+    (generator(data, batch_size=...)), for example, vectorized NumPy work:
+    the function gets a list / array of elements and returns a sequence of elements
+    """
+
+    batch_aware = True
+
+    def __init__(self, func: Callable[[Any], Sequence[Any]]):
+        self.func = func
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        return map(self.func, iterable)
+
+
+@lru_cache(maxsize=None)
+def _compile(kinds: str) -> Callable:
+    """
+    the generator function of a fused chain, one for every sequence of kinds
+    ("m" - map, "f" - filter): every element passes all steps in one loop,
+    without a generator or an iterator object per stage
+
+    args:
+        kinds (str): kinds of the steps, for example "mfm"
+    returns:
+        generator function fused(source, f0, f1, ...)
+    """
+    names = [f"f{i}" for i in range(len(kinds))]
+    lines = [f"def fused(source, {', '.join(names)}):", "    for item in source:"]
+    for kind, name in zip(kinds, names):
+        if kind == "m":
+            lines.append(f"        item = {name}(item)")
+        else:
+            lines.append(f"        if not {name}(item):")
+            lines.append("            continue")
+    lines.append("        yield item")
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace["fused"]
+
+
+class Fused(Operator):
+    """
+    consecutive Map and Filter stages, which are executed in one loop over the data
+    """
+
+    elementwise = True
+
+    def __init__(self, steps: Sequence[Union[Map, Filter]]):
+        self.steps = list(steps)
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        kinds = "".join("m" if isinstance(step, Map) else "f" for step in self.steps)
+        return _compile(kinds)(iterable, *(step.func for step in self.steps))
+
+
+def fuse(operations: Sequence[Callable]) -> List[Callable]:
+    """
+    replaces every run of two or more consecutive Map / Filter stages by one Fused stage,
+    other stages (Operator objects and plain callables) are kept as they are
+
+    args:
+        operations (Sequence[Callable]): stages of the pipeline
+    returns:
+        list of the stages after the fusion
+    """
+    fused: List[Callable] = []
+    run: List[Union[Map, Filter]] = []
+    for oper in list(operations) + [None]:  # None flushes the last run
+        if isinstance(oper, (Map, Filter)):
+            run.append(oper)
+            continue
+        if len(run) > 1:
+            fused.append(Fused(run))
+        else:
+            fused.extend(run)
+        run = []
+        if oper is not None:
+            fused.append(oper)
+    return fused
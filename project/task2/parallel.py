@@ -0,0 +1,130 @@
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Union
+import os
+from project.task2.generator import pipeline
+
+EXECUTORS = ("process", "thread")
+CHUNK_SIZE = 1000
+
+
+def _run_chunk(chunk: list, operations: tuple) -> list:
+    """
+    worker: applies all operations to one chunk
+
+    args:
+        chunk (list): elements of the source
+        operations (tuple): stateless stages of the pipeline
+    returns:
+        list of the output elements of the chunk
+    """
+    return list(pipeline(chunk, *operations))
+
+
+def _chunks(source: Iterable[Any], chunk_size: int) -> Iterator[list]:
+    """
+    splits the iterable into lists of chunk_size elements (the last one can be shorter)
+    """
+    iterator = iter(source)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parallel_pipeline(
+    source: Iterable[Any],
+    *operations: Callable,
+    workers: Union[int, None] = None,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Union[str, Executor] = "process",
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    a pipeline, that splits the source into chunks and applies the operations
+    to the chunks in a pool of processes (CPU-bound stages) or threads (I/O-bound stages)
+
+    the operations must be stateless and work chunk by chunk (map, filter,
+    generator functions...), aggregations over the whole stream (reduce, sorted)
+    must be applied to the result; the process pool needs picklable operations
+    (functools.partial(map, module_function) instead of lambdas)
+
+    args:
+        source (Iterable): any iterable object (list, range, generator...)
+        *operations (Callable): stages of the pipeline (iterable -> iterable)
+        workers (int | None): quantity of workers, None - quantity of CPUs
+        chunk_size (int): quantity of the source elements in one task
+        executor (str | Executor): "process", "thread" or a running pool
+            (it isn't shut down after the pipeline)
+        ordered (bool): keep the order of the source (False - the chunks are output,
+            when they are ready, that doesn't wait for slow chunks)
+    returns:
+        lazy iterator over the output elements, at most 2 * workers chunks
+        are processed or waiting at once
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("The quantity of workers must be positive")
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be positive")
+    if isinstance(executor, str) and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}, expected one of {EXECUTORS}")
+
+    count = workers if workers is not None else os.cpu_count() or 1
+    return _evaluate(source, operations, count, chunk_size, executor, ordered)
+
+
+def _evaluate(
+    source: Iterable[Any],
+    operations: tuple,
+    workers: int,
+    chunk_size: int,
+    executor: Union[str, Executor],
+    ordered: bool,
+) -> Iterator[Any]:
+    """
+    the generator of parallel_pipeline: keeps a window of 2 * workers submitted chunks
+    """
+    if isinstance(executor, Executor):
+        pool, owned = executor, False
+    elif executor == "process":
+        pool, owned = ProcessPoolExecutor(max_workers=workers), True
+    else:
+        pool, owned = ThreadPoolExecutor(max_workers=workers), True
+
+    window = 2 * workers
+    in_order: deque = deque()
+    running: set = set()
+    try:
+        for chunk in _chunks(source, chunk_size):
+            future: Future = pool.submit(_run_chunk, chunk, operations)
+            if ordered:
+                in_order.append(future)
+                if len(in_order) >= window:
+                    yield from in_order.popleft().result()
+            else:
+                running.add(future)
+                if len(running) >= window:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for finished in done:
+                        yield from finished.result()
+
+        while in_order:
+            yield from in_order.popleft().result()
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for finished in done:
+                yield from finished.result()
+    finally:
+        for pending in list(in_order) + list(running):
+            pending.cancel()
+        if owned:
+            pool.shutdown(wait=True)
@@ -0,0 +1,115 @@
+from typing import Any, Iterable, Iterator
+import queue
+import threading
+from project.task2.operators import Operator
+
+_DONE = object()
+JOIN_TIMEOUT = 0.1  # seconds, which the consumer waits for the producer on close
+
+
+class _Failure:
+    """
+    an exception of the producer thread, which is passed to the consumer
+    """
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def buffered(iterable: Iterable[Any], size: int) -> Iterator[Any]:
+    """
+    reads the iterable in a background thread into a bounded queue:
+    the upstream stages (I/O, decompression...) work, while the consumer processes
+    the previous elements, at most 'size' elements wait in the queue
+
+    exceptions of the upstream stages are raised in the consumer, when the consumer
+    stops early (close(), Take, an exception downstream), it doesn't wait for
+    a blocked upstream (longer than JOIN_TIMEOUT): the producer thread stops
+    and closes the upstream generator, when its current element is read
+
+    args:
+        iterable (Iterable): the upstream part of the pipeline
+        size (int): capacity of the queue
+    returns:
+        lazy iterator over the elements
+    """
+    if size <= 0:
+        raise ValueError("The prefetch size must be positive")
+    return _consume(iter(iterable), size)
+
+
+def _produce(
+    iterator: Iterator[Any], items: queue.Queue, stop: threading.Event
+) -> None:
+    """
+    the producer thread: puts the elements, then _DONE or _Failure into the queue
+    """
+    try:
+        for item in iterator:
+            items.put(item)
+            if stop.is_set():
+                return
+        items.put(_DONE)
+    except BaseException as error:
+        items.put(_Failure(error))
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def _consume(iterator: Iterator[Any], size: int) -> Iterator[Any]:
+    """
+    the consumer side of buffered()
+    """
+    items: queue.Queue = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce, args=(iterator, items, stop), name="prefetch", daemon=True
+    )
+    producer.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        try:  # free the queue, so a blocked put() returns and the producer sees stop
+            while True:
+                items.get_nowait()
+        except queue.Empty:
+            pass
+        producer.join(JOIN_TIMEOUT)  # the daemon thread finishes by itself
+
+
+class Prefetch(Operator):
+    """
+    a stage, that runs the upstream part of the pipeline in a background thread
+    with a bounded queue (see buffered()), on a BatchStream whole batches are prefetched
+    """
+
+    batch_aware = True
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("The prefetch size must be positive")
+        self.size = size
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        return buffered(iterable, self.size)
+
+
+def prefetch(size: int) -> Prefetch:
+    """
+    the prefetching stage for pipeline()
+
+    args:
+        size (int): capacity of the queue (elements or batches)
+    returns:
+        Prefetch stage
+    """
+    return Prefetch(size)
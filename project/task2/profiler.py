@@ -0,0 +1,323 @@
+from collections.abc import Iterator
+from typing import Any, Callable, Iterable, List, Tuple, Union
+import time
+import tracemalloc
+from project.task2.batching import BatchStream
+from project.task2.generator import _apply
+
+
+class StageStats:
+    """
+    measurements of one stage of an instrumented pipeline:
+    items_in / items_out - elements, which the stage read and output,
+    wall_time - seconds of the own work of the stage (without the upstream stages),
+    blocked_time - seconds, which the stage waited for the upstream stages,
+    peak_memory - peak of the memory (bytes), which was allocated during one call
+    of the stage (with the upstream stages, which were called from it),
+    only with tracemalloc
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.wall_time = 0.0
+        self.blocked_time = 0.0
+        self.peak_memory = 0
+
+    def as_dict(self) -> dict:
+        """
+        the measurements as a dictionary
+        """
+        return dict(vars(self))
+
+
+class PipelineReport:
+    """
+    the report of an instrumented pipeline: StageStats of every stage in the order
+    of the pipeline, it is updated, while the data flows, 'finished' is True,
+    when the output is exhausted
+    """
+
+    def __init__(self, names: List[str]):
+        self.stages = [StageStats(name) for name in names]
+        self.total_time = 0.0
+        self.finished = False
+
+    def slowest(self) -> StageStats:
+        """
+        the stage with the biggest own wall time
+
+        returns:
+            StageStats of the stage
+        """
+        return max(self.stages, key=lambda stage: stage.wall_time)
+
+    def as_dict(self) -> dict:
+        """
+        the report as a dictionary (for JSON)
+        """
+        return {
+            "total_time": self.total_time,
+            "finished": self.finished,
+            "stages": [stage.as_dict() for stage in self.stages],
+        }
+
+    def __str__(self) -> str:
+        """
+        the report as a table
+        """
+        lines = [
+            f"{'stage':<30} {'in':>10} {'out':>10} {'wall, s':>9}"
+            f" {'blocked, s':>11} {'peak, KB':>9}"
+        ]
+        for stage in self.stages:
+            lines.append(
+                f"{stage.name[:30]:<30} {stage.items_in:>10} {stage.items_out:>10}"
+                f" {stage.wall_time:>9.4f} {stage.blocked_time:>11.4f}"
+                f" {stage.peak_memory / 1024:>9.1f}"
+            )
+        lines.append(f"total: {self.total_time:.4f} s")
+        return "\n".join(lines)
+
+
+class _Memory:
+    """
+    peak memory of nested calls: every open call gets the peak,
+    which is reached before an inner call resets the tracemalloc peak
+    """
+
+    def __init__(self) -> None:
+        self.frames: List[List[int]] = []  # [base memory, max peak]
+        self.owned = not tracemalloc.is_tracing()  # stop tracing at the end
+        if self.owned:
+            tracemalloc.start()
+
+    def enter(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self.frames:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+        self.frames.append([current, current])
+
+    def exit(self) -> int:
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self.frames:
+            frame[1] = max(frame[1], peak)
+        base, top = self.frames.pop()
+        return top - base
+
+
+class _Probe:
+    """
+    iterator between two stages: counts the elements and measures the time
+    (and the memory), which the downstream stage waits for the upstream one,
+    a 'batched' probe passes whole batches and counts their elements
+    """
+
+    def __init__(
+        self,
+        upstream: Iterable[Any],
+        memory: Union[_Memory, None],
+        batched: bool = False,
+    ):
+        self.upstream = iter(upstream)
+        self.memory = memory
+        self.batched = batched
+        self.count = 0
+        self.time = 0.0
+        self.peak = 0
+
+    def __iter__(self) -> "_Probe":
+        return self
+
+    def __next__(self) -> Any:
+        if self.memory is not None:
+            self.memory.enter()
+        start = time.perf_counter()
+        try:
+            item = next(self.upstream)
+        finally:
+            self.time += time.perf_counter() - start
+            if self.memory is not None:
+                self.peak = max(self.peak, self.memory.exit())
+        self.count += len(item) if self.batched else 1
+        return item
+
+
+def _name(oper: Callable) -> str:
+    """
+    readable name of a stage
+    """
+    name = getattr(oper, "__qualname__", None)
+    return name if isinstance(name, str) else repr(oper)
+
+
+class _Output:
+    """
+    the output of an instrumented pipeline: updates the report after every element,
+    calls the hook periodically and when the output is exhausted,
+    the memory tracing is stopped, when the output is exhausted, closed
+    or garbage-collected
+    """
+
+    def __init__(self, run: "_Run", probe: _Probe):
+        self.run = run
+        self.probe = probe
+
+    def __iter__(self) -> "_Output":
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            item = next(self.probe)
+        except StopIteration:
+            self.run.finish()
+            raise
+        self.run.tick()
+        return item
+
+    def close(self) -> None:
+        """
+        stops the memory tracing, when the consumer stops early
+        """
+        self.run.stop_tracing()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class _Run:
+    """
+    the state of one instrumented pipeline
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        hook: Union[Callable[[PipelineReport], Any], None],
+        interval: Union[float, None],
+        memory: Union[_Memory, None],
+    ):
+        self.report = PipelineReport(names)
+        self.hook = hook
+        self.interval = interval
+        self.memory = memory
+        self.probes: List[_Probe] = []
+        self.setup_time = [0.0] * len(names)
+        self.setup_peak = [0] * len(names)
+        self.start = time.perf_counter()
+        self.last_hook = self.start
+
+    def update(self) -> None:
+        """
+        recomputes the report from the probes
+        """
+        for i, stage in enumerate(self.report.stages):
+            upstream, downstream = self.probes[i], self.probes[i + 1]
+            stage.items_in = upstream.count
+            stage.items_out = downstream.count
+            stage.blocked_time = upstream.time
+            inclusive = downstream.time + self.setup_time[i]
+            stage.wall_time = max(inclusive - upstream.time, 0.0)
+            stage.peak_memory = max(downstream.peak, self.setup_peak[i])
+        self.report.total_time = time.perf_counter() - self.start
+
+    def tick(self) -> None:
+        if self.interval is not None and self.hook is not None:
+            now = time.perf_counter()
+            if now - self.last_hook >= self.interval:
+                self.last_hook = now
+                self.update()
+                self.hook(self.report)
+
+    def stop_tracing(self) -> None:
+        """
+        stops tracemalloc, if the run started it
+        """
+        if self.memory is not None and self.memory.owned:
+            self.memory.owned = False
+            tracemalloc.stop()
+
+    def finish(self) -> None:
+        if self.report.finished:
+            return
+        self.update()
+        self.report.finished = True
+        self.stop_tracing()
+        if self.hook is not None:
+            self.hook(self.report)
+
+
+def instrumented_pipeline(
+    source: Iterable[Any],
+    *operations: Callable,
+    hook: Union[Callable[[PipelineReport], Any], None] = None,
+    interval: Union[float, None] = None,
+    trace_memory: bool = False,
+) -> Tuple[Any, PipelineReport]:
+    """
+    the pipeline, which measures every stage: elements in and out, own wall time,
+    time blocked by the upstream stages and peak memory (tracemalloc),
+    pipeline() itself isn't changed, so there is no cost, when it isn't used
+
+    the stages are measured as they are written (without the fusion of operators),
+    a BatchStream source is processed by the rules of pipeline(), the elements
+    of the batches are counted,
+    the report is complete, when the output is exhausted (or at once, if the last
+    stage returns a value, like reduce)
+
+    args:
+        source (Iterable): any iterable object (list, range, generator...)
+        *operations (Callable): operations for the sequential execution
+        hook (Callable | None): hook(report) at the end and every 'interval' seconds
+        interval (float | None): period of the hook calls in seconds, None - only at the end
+        trace_memory (bool): measure the peak memory (tracemalloc, slower),
+            tracing is stopped, when the output is exhausted, closed or collected
+    returns:
+        tuple of the result of the pipeline (a lazy iterator or the value
+        of the last stage) and the report
+    """
+    if interval is not None and interval <= 0:
+        raise ValueError("The interval must be positive")
+    memory = _Memory() if trace_memory else None
+    run = _Run([_name(oper) for oper in operations], hook, interval, memory)
+
+    result: Any = source
+    for i, oper in enumerate(operations):
+        batched = isinstance(result, BatchStream)
+        probe = _Probe(result, memory, batched)
+        run.probes.append(probe)
+        if memory is not None:
+            memory.enter()
+        start = time.perf_counter()
+        try:
+            result = _apply(oper, BatchStream(probe) if batched else probe)
+        except BaseException:
+            run.stop_tracing()
+            raise
+        finally:
+            run.setup_time[i] = time.perf_counter() - start
+            if memory is not None:
+                run.setup_peak[i] = memory.exit()
+
+    if isinstance(result, BatchStream):
+        probe = _Probe(result, memory, batched=True)
+        run.probes.append(probe)
+        return BatchStream(_Output(run, probe)), run.report
+    if isinstance(result, Iterator):
+        probe = _Probe(result, memory)
+        run.probes.append(probe)
+        return _Output(run, probe), run.report
+    return _finish_value(run, result)
+
+
+def _finish_value(run: _Run, result: Any) -> Tuple[Any, PipelineReport]:
+    """
+    finishes the report, when the last stage returned a value (not an iterator)
+    """
+    probe = _Probe((), None)
+    probe.count = 1
+    run.probes.append(probe)
+    run.finish()
+    return result, run.report
@@ -0,0 +1,427 @@
+import abc
+from bisect import insort, bisect_left
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Union
+import math
+import random
+from project.task2.operators import Operator
+
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+SAMPLE_SIZE = 1024  # elements of the reservoir sample for the approximate quantiles
+
+
+def _check(aggregates: Sequence[str]) -> List[str]:
+    """
+    validation of the names of the aggregates: count, sum, mean, min, max
+    and quantiles p<percent> (p50 - median, p99...)
+    """
+    for name in aggregates:
+        if name in AGGREGATES:
+            continue
+        try:
+            percent = float(name[1:]) if name.startswith("p") else -1.0
+        except ValueError:
+            percent = -1.0
+        if not 0 <= percent <= 100:
+            raise ValueError(
+                f"Unknown aggregate {name!r}, expected one of {AGGREGATES} or p<percent>"
+            )
+    return list(aggregates)
+
+
+def _quantile(ordered: Sequence[float], q: float) -> float:
+    """
+    the quantile of sorted values with the linear interpolation
+    """
+    position = (len(ordered) - 1) * q
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _summary(
+    names: Sequence[str],
+    count: int,
+    total: float,
+    minimum: float,
+    maximum: float,
+    ordered: Callable[[], Sequence[float]],
+) -> Dict[str, Any]:
+    """
+    the values of the requested aggregates
+    """
+    result: Dict[str, Any] = {}
+    for name in names:
+        if name == "count":
+            result[name] = count
+        elif name == "sum":
+            result[name] = total
+        elif name == "mean":
+            result[name] = total / count
+        elif name == "min":
+            result[name] = minimum
+        elif name == "max":
+            result[name] = maximum
+        else:
+            result[name] = _quantile(ordered(), float(name[1:]) / 100)
+    return result
+
+
+class Accumulator:
+    """
+    add-only aggregation: count, sum, min and max are exact with O(1) memory,
+    quantiles are approximate (computed from a reservoir sample of the elements),
+    the sample (O(sample_size) memory) is kept only, if a quantile is requested
+    """
+
+    __slots__ = (
+        "aggregates",
+        "sample_size",
+        "count",
+        "total",
+        "minimum",
+        "maximum",
+        "sample",
+        "_random",
+    )
+
+    def __init__(self, aggregates: Sequence[str], sample_size: int = SAMPLE_SIZE):
+        self.aggregates = aggregates
+        quantiles = any(name not in AGGREGATES for name in aggregates)
+        self.sample_size = sample_size if quantiles else 0
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.sample: List[float] = []
+        self._random: Union[random.Random, None] = None  # when the sample is full
+
+    def add(self, value: float) -> None:
+        """
+        adds one element
+        """
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if len(self.sample) < self.sample_size:
+            self.sample.append(value)
+        elif self.sample_size:
+            # reservoir sampling: every element is in the sample with equal chance
+            if self._random is None:
+                self._random = random.Random(0)
+            j = self._random.randrange(self.count)
+            if j < self.sample_size:
+                self.sample[j] = value
+
+    def result(self) -> Dict[str, Any]:
+        """
+        the values of the aggregates
+        """
+        return _summary(
+            self.aggregates,
+            self.count,
+            self.total,
+            self.minimum,
+            self.maximum,
+            lambda: sorted(self.sample),
+        )
+
+
+class SlidingAccumulator:
+    """
+    aggregation over the last elements with removal: the window is kept sorted,
+    so min, max and quantiles are exact, O(window) memory
+    """
+
+    def __init__(self, aggregates: Sequence[str]):
+        self.aggregates = aggregates
+        self.ordered: List[float] = []
+        self.total = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        adds the newest element
+        """
+        insort(self.ordered, value)
+        self.total += value
+
+    def remove(self, value: float) -> None:
+        """
+        removes the oldest element (it must be in the window)
+        """
+        del self.ordered[bisect_left(self.ordered, value)]
+        self.total -= value
+
+    def result(self) -> Dict[str, Any]:
+        """
+        the values of the aggregates
+        """
+        return _summary(
+            self.aggregates,
+            len(self.ordered),
+            self.total,
+            self.ordered[0],
+            self.ordered[-1],
+            lambda: self.ordered,
+        )
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class Window(Operator):
+    """
+    a streaming aggregation stage: the results (dictionaries with the bounds
+    of the window and the aggregates) are output, when the windows are closed,
+    the implementations define _start (the state), _push (an element, returns
+    the closed windows) and _flush (the end of the stream), Operator is
+    an abstract base class, so an incomplete window can't be instantiated
+    """
+
+    def __init__(
+        self,
+        aggregates: Sequence[str] = AGGREGATES,
+        value: Union[Callable[[Any], float], None] = None,
+    ):
+        self.aggregates = _check(aggregates)
+        self.value = _identity if value is None else value
+
+    @abc.abstractmethod
+    def _start(self) -> Any:
+        """
+        the state of a new stream
+        """
+
+    @abc.abstractmethod
+    def _push(self, state: Any, item: Any) -> List[Dict[str, Any]]:
+        """
+        adds an element, returns the results of the windows, which are closed
+        """
+
+    @abc.abstractmethod
+    def _flush(self, state: Any) -> List[Dict[str, Any]]:
+        """
+        the results of the windows, which are open at the end of the stream
+        """
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        state = self._start()
+        for item in iterable:
+            yield from self._push(state, item)
+        yield from self._flush(state)
+
+
+class TumblingWindow(Window):
+    """
+    consecutive non-overlapping windows of 'size' elements
+    or, with 'timestamp', of 'size' time units ([k * size, (k + 1) * size),
+    the timestamps must not decrease)
+    """
+
+    def __init__(
+        self,
+        size: float,
+        aggregates: Sequence[str] = AGGREGATES,
+        value: Union[Callable[[Any], float], None] = None,
+        timestamp: Union[Callable[[Any], float], None] = None,
+    ):
+        """
+        args:
+            size (float): elements (or time units) in a window
+            aggregates (Sequence[str]): count, sum, mean, min, max, p<percent>
+            value (Callable | None): the aggregated value of an element, None - itself
+            timestamp (Callable | None): the time of an element, None - count windows
+        """
+        super().__init__(aggregates, value)
+        if size <= 0:
+            raise ValueError("The window size must be positive")
+        self.size = size
+        self.timestamp = timestamp
+
+    def _start(self) -> Any:
+        return {"window": None, "start": 0, "index": 0}
+
+    def _close(self, state: Dict[str, Any], end: Any) -> List[Dict[str, Any]]:
+        window = state["window"]
+        state["window"] = None
+        if window is None:
+            return []
+        return [{"start": state["start"], "end": end, **window.result()}]
+
+    def _push(self, state: Dict[str, Any], item: Any) -> List[Dict[str, Any]]:
+        closed: List[Dict[str, Any]] = []
+        if self.timestamp is None:
+            position = state["index"]
+            state["index"] += 1
+        else:
+            position = self.timestamp(item)
+        start = math.floor(position / self.size) * self.size
+        if state["window"] is not None and start != state["start"]:
+            closed = self._close(state, state["start"] + self.size)
+        if state["window"] is None:
+            state["window"] = Accumulator(self.aggregates)
+            state["start"] = start
+        state["window"].add(self.value(item))
+        return closed
+
+    def _flush(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if self.timestamp is None:
+            return self._close(state, state["index"])
+        return self._close(state, state["start"] + self.size)
+
+
+class SlidingWindow(Window):
+    """
+    windows of the last 'size' elements, a result every 'step' elements
+    (when the window is full), O(size) memory
+    """
+
+    def __init__(
+        self,
+        size: int,
+        step: int = 1,
+        aggregates: Sequence[str] = AGGREGATES,
+        value: Union[Callable[[Any], float], None] = None,
+    ):
+        """
+        args:
+            size (int): elements in a window
+            step (int): elements between the starts of consecutive windows
+            aggregates (Sequence[str]): count, sum, mean, min, max, p<percent>
+            value (Callable | None): the aggregated value of an element, None - itself
+        """
+        super().__init__(aggregates, value)
+        if size <= 0 or step <= 0:
+            raise ValueError("The window size and the step must be positive")
+        self.size = size
+        self.step = step
+
+    def _start(self) -> Any:
+        return {
+            "values": deque(),
+            "window": SlidingAccumulator(self.aggregates),
+            "index": 0,
+        }
+
+    def _push(self, state: Dict[str, Any], item: Any) -> List[Dict[str, Any]]:
+        value = self.value(item)
+        values, window = state["values"], state["window"]
+        values.append(value)
+        window.add(value)
+        if len(values) > self.size:
+            window.remove(values.popleft())
+        state["index"] += 1
+        end = state["index"]
+        if end >= self.size and (end - self.size) % self.step == 0:
+            return [{"start": end - self.size, "end": end, **window.result()}]
+        return []
+
+    def _flush(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return []
+
+
+class SessionWindow(Window):
+    """
+    windows of activity: a session is closed, when the next element is more
+    than 'gap' time units after the previous one (the timestamps must not decrease)
+    """
+
+    def __init__(
+        self,
+        gap: float,
+        timestamp: Callable[[Any], float],
+        aggregates: Sequence[str] = AGGREGATES,
+        value: Union[Callable[[Any], float], None] = None,
+    ):
+        """
+        args:
+            gap (float): maximal pause inside a session
+            timestamp (Callable): the time of an element
+            aggregates (Sequence[str]): count, sum, mean, min, max, p<percent>
+            value (Callable | None): the aggregated value of an element, None - itself
+        """
+        super().__init__(aggregates, value)
+        if gap < 0:
+            raise ValueError("The gap must be non-negative")
+        self.gap = gap
+        self.timestamp = timestamp
+
+    def _start(self) -> Any:
+        return {"window": None, "start": None, "last": None}
+
+    def _close(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if state["window"] is None:
+            return []
+        result = {"start": state["start"], "end": state["last"]}
+        result.update(state["window"].result())
+        state["window"] = None
+        return [result]
+
+    def _push(self, state: Dict[str, Any], item: Any) -> List[Dict[str, Any]]:
+        moment = self.timestamp(item)
+        closed: List[Dict[str, Any]] = []
+        if state["window"] is not None and moment - state["last"] > self.gap:
+            closed = self._close(state)
+        if state["window"] is None:
+            state["window"] = Accumulator(self.aggregates)
+            state["start"] = moment
+        state["window"].add(self.value(item))
+        state["last"] = moment
+        return closed
+
+    def _flush(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return self._close(state)
+
+
+class GroupBy(Operator):
+    """
+    keyed aggregation: without a window, one result for every key at the end
+    of the stream (O(keys) memory), with a window, every key has its own windows
+    and their results are output, when they are closed
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Any], Any],
+        aggregates: Sequence[str] = AGGREGATES,
+        value: Union[Callable[[Any], float], None] = None,
+        window: Union[Window, None] = None,
+    ):
+        """
+        args:
+            key (Callable): the key of an element
+            aggregates (Sequence[str]): count, sum, mean, min, max, p<percent>
+                (without a window)
+            value (Callable | None): the aggregated value of an element, None - itself
+            window (Window | None): the window of every key
+        """
+        self.key = key
+        self.aggregates = _check(aggregates)
+        self.value = _identity if value is None else value
+        self.window = window
+
+    def __call__(self, iterable: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        if self.window is None:
+            groups: Dict[Any, Accumulator] = {}
+            for item in iterable:
+                key = self.key(item)
+                if key not in groups:
+                    groups[key] = Accumulator(self.aggregates)
+                groups[key].add(self.value(item))
+            for key, group in groups.items():
+                yield {"key": key, **group.result()}
+            return
+
+        window = self.window
+        states: Dict[Any, Any] = {}
+        for item in iterable:
+            key = self.key(item)
+            if key not in states:
+                states[key] = window._start()
+            for result in window._push(states[key], item):
+                yield {"key": key, **result}
+        for key, state in states.items():
+            for result in window._flush(state):
+                yield {"key": key, **result}
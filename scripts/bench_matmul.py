@@ -0,0 +1,62 @@
+import argparse
+import random
+import sys
+import time
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.task1.matrices import Matrix  # noqa: E402
+
+
+def reference_mul(left: list[list[float]], right: list[list[float]]) -> list:
+    """the previous Matrix.__mul__: two indexations per scalar,
+    column-wise walk over the right matrix and a temporary list for every cell"""
+    return [
+        [
+            sum([left[i][j] * right[j][k] for j in range(len(left[0]))])
+            for k in range(len(right[0]))
+        ]
+        for i in range(len(left))
+    ]
+
+
+def timeit(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Matrix.__mul__ benchmark: blocked kernel vs the previous implementation"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 512])
+    parser.add_argument("--block", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    print(f"{'size':>6} {'previous, s':>12} {'blocked, s':>12} {'speedup':>8}")
+    for n in args.sizes:
+        left = [[rnd.random() for _ in range(n)] for _ in range(n)]
+        right = [[rnd.random() for _ in range(n)] for _ in range(n)]
+        m_left, m_right = Matrix(left), Matrix(right)
+
+        previous = timeit(lambda: reference_mul(left, right), args.repeat)
+        blocked = timeit(
+            lambda: m_left.matmul(
+                m_right, block=args.block, backend="python", algorithm="classical"
+            ),
+            args.repeat,
+        )
+        print(f"{n:>6} {previous:>12.3f} {blocked:>12.3f} {previous / blocked:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import random
+import sys
+import time
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.task1 import strassen  # noqa: E402
+from project.task1.matrices import Matrix  # noqa: E402
+
+
+def timeit(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="finds the crossover of the Strassen-Winograd multiplication "
+        "on this machine and stores it for the 'auto' mode of Matrix.__mul__"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[128, 192, 256, 384, 512, 768, 1024]
+    )
+    parser.add_argument("--leaf-sizes", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="default: strassen.CONFIG_PATH")
+    parser.add_argument("--dry-run", action="store_true", help="don't store the result")
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    best = None  # (crossover, leaf size)
+    print(
+        f"{'size':>6} {'leaf':>6} {'classical, s':>13} {'strassen, s':>12} {'speedup':>8}"
+    )
+    for n in sorted(args.sizes):
+        left = Matrix.from_buffer([rnd.random() for _ in range(n * n)], (n, n))
+        right = Matrix.from_buffer([rnd.random() for _ in range(n * n)], (n, n))
+        classical = timeit(
+            lambda: left.matmul(right, backend="python", algorithm="classical"),
+            args.repeat,
+        )
+        for leaf in sorted(args.leaf_sizes):
+            if leaf >= n:
+                continue
+            strassen.set_crossover(1, leaf)
+            recursive = timeit(
+                lambda: left.matmul(right, backend="python", algorithm="strassen"),
+                args.repeat,
+            )
+            print(
+                f"{n:>6} {leaf:>6} {classical:>13.3f} {recursive:>12.3f}"
+                f" {classical / recursive:>7.2f}x"
+            )
+            if best is None and recursive < classical:
+                best = (n, leaf)
+
+    if best is None:  # the recursion never won: keep it off for the measured sizes
+        best = (2 * max(args.sizes), strassen.LEAF_SIZE)
+        print(f"no crossover up to {max(args.sizes)}")
+    print(f"crossover: {best[0]}, leaf size: {best[1]}")
+    strassen.set_crossover(*best)
+    if not args.dry_run:
+        strassen.save_config(args.output)
+        print(f"stored into {args.output or strassen.CONFIG_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import sys
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.task1 import benchmarks  # noqa: E402
+
+BASELINE = shared.ROOT / ".benchmarks" / "task1_baseline.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="task1 benchmarks: ops/sec, peak memory and allocations "
+        "with the comparison against the stored baseline"
+    )
+    parser.add_argument("--cases", nargs="+", choices=sorted(benchmarks.CASES))
+    parser.add_argument("--vector-sizes", type=int, nargs="+")
+    parser.add_argument("--matrix-sizes", type=int, nargs="+")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["python", "numpy"],
+        help="backends of the cases (default: python, and numpy if installed)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--threshold", type=float, default=benchmarks.THRESHOLD)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as the baseline"
+    )
+    args = parser.parse_args()
+
+    sizes = {
+        "vector": args.vector_sizes or benchmarks.SIZES["vector"],
+        "matrix": args.matrix_sizes or benchmarks.SIZES["matrix"],
+    }
+    results = {}
+    print(f"{'case':<32} {'ops/sec':>12} {'peak, KB':>10} {'allocations':>12}")
+    cases = benchmarks.run(sizes, args.cases, args.repeat, args.backends)
+    for name, result in cases:
+        results[name] = result
+        print(
+            f"{name:<32} {result['ops_per_sec']:>12.1f}"
+            f" {result['peak_bytes'] / 1024:>10.1f} {result['allocations']:>12}"
+        )
+    document = benchmarks.report(results)
+
+    if args.output:
+        benchmarks.save(document, args.output)
+    if args.save_baseline:
+        benchmarks.save(document, args.baseline)
+        print(f"baseline is stored into {args.baseline}")
+        return 0
+
+    try:
+        baseline = benchmarks.load(args.baseline)
+    except FileNotFoundError:
+        print(f"no baseline in {args.baseline}, run with --save-baseline first")
+        return 0
+    if baseline.get("numpy") != document["numpy"]:
+        print("the baseline was measured with a different NumPy availability")
+    regressions = benchmarks.compare(document, baseline, args.threshold)
+    for name, base, current in regressions:
+        print(
+            f"REGRESSION {name}: {current:.1f} ops/sec, "
+            f"baseline {base:.1f} ({current / base - 1:+.0%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
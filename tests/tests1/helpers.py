@@ -0,0 +1,16 @@
+import random
+from project.task1.matrices import Matrix
+
+
+def random_matrix(rows, cols, seed, bound=9, integer=True):
+    """
+    a reproducible random matrix: integers from [-bound, bound]
+    or floats from [-bound, bound) (integer=False)
+    """
+    rnd = random.Random(seed)
+    value = (
+        (lambda: rnd.randint(-bound, bound))
+        if integer
+        else (lambda: rnd.uniform(-bound, bound))
+    )
+    return Matrix([[value() for _ in range(cols)] for _ in range(rows)])
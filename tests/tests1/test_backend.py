@@ -0,0 +1,70 @@
+import pytest
+from functools import partial
+from project.task1 import backend
+from project.task1.matrices import Matrix
+from project.task1.vectors import Vector
+import helpers
+
+
+random_matrix = partial(helpers.random_matrix, bound=1, integer=False)
+
+
+def close(m1, m2):
+    return m1.shape == m2.shape and all(
+        abs(x - y) < 1e-9 for x, y in zip(m1._flat(), m2._flat())
+    )
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown backend"):
+        backend.set_backend("fortran")
+    with pytest.raises(ValueError, match="Unknown backend"):
+        Vector([1, 2]).norm(backend="fortran")
+
+
+def test_use_backend_restores():
+    assert backend.get_backend() == "auto"
+    with backend.use_backend("python"):
+        assert backend.get_backend() == "python"
+        assert backend.resolve(None, 10**6) == "python"
+    assert backend.get_backend() == "auto"
+
+
+def test_auto_small_is_python():
+    assert backend.resolve("auto", backend.AUTO_MIN_SIZE - 1) == "python"
+
+
+def test_numpy_missing(monkeypatch):
+    monkeypatch.setattr(backend, "np", None)
+    assert backend.resolve("auto", 10**6) == "python"
+    with pytest.raises(ImportError):
+        Matrix([[1]]).matmul(Matrix([[1]]), backend="numpy")
+
+
+@pytest.mark.parametrize("rows, inner, cols", [(1, 1, 1), (3, 5, 2), (20, 30, 10)])
+def test_numpy_matches_python(rows, inner, cols):
+    pytest.importorskip("numpy")
+    a, b = random_matrix(rows, inner, 1), random_matrix(inner, cols, 2)
+    c = random_matrix(rows, inner, 3)
+    assert close(a.matmul(b, backend="numpy"), a.matmul(b, backend="python"))
+    assert close(a.add(c, backend="numpy"), a.add(c, backend="python"))
+    assert close(
+        a.transp().materialize(backend="numpy"),
+        a.transp().materialize(backend="python"),
+    )
+
+    v1, v2 = a[0], c[0]
+    for name in ("dot", "angle"):
+        assert getattr(v1, name)(v2, backend="numpy") == pytest.approx(
+            getattr(v1, name)(v2, backend="python")
+        )
+    assert v1.norm(backend="numpy") == pytest.approx(v1.norm(backend="python"))
+
+
+def test_numpy_global_backend():
+    pytest.importorskip("numpy")
+    with backend.use_backend("numpy"):
+        assert Matrix([[1, 2], [3, 4]]) * Matrix([[5, 6], [7, 8]]) == Matrix(
+            [[19, 22], [43, 50]]
+        )
+        assert Vector([3, 4]).norm() == 5
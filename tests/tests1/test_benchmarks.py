@@ -0,0 +1,63 @@
+import pytest
+from project.task1 import backend, benchmarks
+
+
+@pytest.fixture(autouse=True)
+def short_rounds(monkeypatch):
+    monkeypatch.setattr(benchmarks, "MIN_TIME", 0.001)
+
+
+def test_measure():
+    result = benchmarks.measure(lambda: [0.0] * 10_000, repeat=1)
+    assert result["ops_per_sec"] > 0
+    assert result["peak_bytes"] >= 10_000 * 8
+    assert set(result) == {"ops_per_sec", "peak_bytes", "allocations"}
+
+
+def test_run_all_cases():
+    sizes = {"vector": [10], "matrix": [4]}
+    results = dict(benchmarks.run(sizes, repeat=1))
+    assert set(results) == {
+        f"{name}[{10 if kind == 'vector' else 4}]@{pinned}"
+        for name, (kind, _) in benchmarks.CASES.items()
+        for pinned in benchmarks.default_backends()
+    }
+    assert "matrix.mul[4]@python" in results
+
+
+def test_backend_is_pinned(monkeypatch):
+    seen = []
+    monkeypatch.setitem(
+        benchmarks.CASES,
+        "probe",
+        ("vector", lambda n: lambda: seen.append(backend.get_backend())),
+    )
+    names = [name for name, _ in benchmarks.run({"vector": [1]}, ["probe"], 1)]
+    assert names == [f"probe[1]@{pinned}" for pinned in benchmarks.default_backends()]
+    assert set(seen) == set(benchmarks.default_backends())
+    assert backend.get_backend() == "auto"
+    document = benchmarks.report({})
+    assert document["backend"] == "auto"
+    assert document["numpy"] == backend.numpy_available()
+
+
+def test_save_load_compare(tmp_path):
+    baseline = benchmarks.report(
+        {"a[1]": {"ops_per_sec": 100.0}, "b[1]": {"ops_per_sec": 100.0}}
+    )
+    benchmarks.save(baseline, tmp_path / "baseline.json")
+    loaded = benchmarks.load(tmp_path / "baseline.json")
+    assert loaded == baseline
+
+    current = benchmarks.report(
+        {
+            "a[1]": {"ops_per_sec": 85.0},
+            "b[1]": {"ops_per_sec": 70.0},
+            "new[1]": {"ops_per_sec": 1.0},
+        }
+    )
+    assert benchmarks.compare(current, loaded) == [("b[1]", 100.0, 70.0)]
+    assert benchmarks.compare(current, loaded, threshold=0.1) == [
+        ("a[1]", 100.0, 85.0),
+        ("b[1]", 100.0, 70.0),
+    ]
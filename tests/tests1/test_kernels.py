@@ -0,0 +1,37 @@
+import pytest
+import random
+from project.task1 import kernels
+from project.task1.matrices import Matrix
+
+
+def naive(left, right):
+    return [
+        [
+            sum(left[i][j] * right[j][k] for j in range(len(right)))
+            for k in range(len(right[0]))
+        ]
+        for i in range(len(left))
+    ]
+
+
+def test_transpose():
+    data = memoryview(kernels.zeros(0) + kernels.zeros(6))
+    data[1], data[5] = 1, 5
+    assert kernels.transpose(data, 2, 3).tolist() == [0, 0, 1, 0, 0, 5]
+
+
+@pytest.mark.parametrize("n, p, m, block", [(5, 7, 3, 2), (8, 8, 8, 3), (4, 1, 6, 64)])
+def test_blocked_matmul(n, p, m, block):
+    rnd = random.Random(n * p * m)
+    left = [[rnd.randint(-5, 5) for _ in range(p)] for _ in range(n)]
+    right = [[rnd.randint(-5, 5) for _ in range(m)] for _ in range(p)]
+    result = Matrix(left).matmul(
+        Matrix(right), block=block, backend="python", algorithm="classical"
+    )
+    assert result == Matrix(naive(left, right))
+
+
+def test_block_size():
+    m = Matrix([[1]])
+    with pytest.raises(ValueError, match="The block size must be positive"):
+        m.matmul(m, block=0, backend="python")
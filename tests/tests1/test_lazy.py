@@ -0,0 +1,60 @@
+import pytest
+from functools import partial
+from project.task1.lazy import LazyMatrix, lazy
+from project.task1.matrices import Matrix, chain_order
+import helpers
+
+
+random_matrix = partial(helpers.random_matrix, bound=5)
+
+
+def test_nothing_is_computed_before_evaluate():
+    a, b = random_matrix(2, 3, 1), random_matrix(2, 3, 2)
+    expr = a.lazy() + b
+    assert isinstance(expr, LazyMatrix)
+    assert expr._value is None
+    assert expr.shape == (2, 3)
+    assert expr == a + b
+    assert expr._value is not None
+
+
+def test_expression():
+    a, b, c = random_matrix(3, 4, 1), random_matrix(3, 4, 2), random_matrix(5, 4, 3)
+    expr = (a.lazy() + b) * c.transp()
+    assert expr.evaluate() == (a + b) * c.transp()
+    assert expr[1] == ((a + b) * c.transp())[1]
+
+
+def test_fused_sum_and_matrix_on_the_left():
+    ms = [random_matrix(4, 4, seed) for seed in range(4)]
+    expr = ms[0] + lazy(ms[1]) + (ms[2] + ms[3].lazy())
+    assert expr == ms[0] + ms[1] + ms[2] + ms[3]
+
+
+def test_transpositions_are_views():
+    a, b = random_matrix(3, 2, 1), random_matrix(3, 2, 2)
+    result = (lazy(a) + b).transp().evaluate()
+    assert result == (a + b).transp()
+    assert lazy(a).transp().transp().evaluate() is a
+    assert lazy(a).transp().evaluate()._data.obj is a._data.obj
+
+
+def test_transposed_product():
+    a, b, c = random_matrix(2, 3, 1), random_matrix(3, 4, 2), random_matrix(4, 5, 3)
+    expr = (lazy(a) * b * c).transp()
+    assert expr == c.transp() * b.transp() * a.transp()
+    assert expr.evaluate().shape == (5, 2)
+
+
+def test_chain_order():
+    cost, split = chain_order([10, 100, 5, 50])
+    assert cost[0][2] == 10 * 100 * 5 + 10 * 5 * 50
+    assert split[0][2] == 1
+
+
+def test_dimension_errors():
+    a = random_matrix(2, 3, 1)
+    with pytest.raises(ValueError, match="Matrices must be the same dimension"):
+        a.lazy() + a.transp()
+    with pytest.raises(ValueError, match="Dimension error"):
+        a.lazy() * a
@@ -0,0 +1,94 @@
+import pytest
+from functools import partial
+from project.task1 import linalg
+from project.task1.matrices import Matrix
+from project.task1.vectors import Vector
+import helpers
+
+
+random_matrix = partial(helpers.random_matrix, bound=5, integer=False)
+
+
+def assert_close(result, expected):
+    for got, want in zip(result._flat(), expected._flat()):
+        assert got == pytest.approx(want, abs=1e-9)
+
+
+def identity(n):
+    return Matrix([[float(i == j) for j in range(n)] for i in range(n)])
+
+
+def test_lu_factors():
+    a = random_matrix(6, 6, 1)
+    factorization = linalg.lu(a)
+    permuted = Matrix([a[p].tolist() for p in factorization.perm])
+    assert_close(factorization.lower * factorization.upper, permuted)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 12])
+def test_solve_lu(n):
+    a, x = random_matrix(n, n, n), Vector([float(i + 1) for i in range(n)])
+    b = (a * Matrix([[v] for v in x]))[:, 0]
+    assert linalg.solve(a, b).tolist() == pytest.approx(x.tolist())
+
+
+def test_solve_needs_pivoting():
+    a = Matrix([[0, 1], [1, 0]])
+    assert linalg.solve(a, Vector([2, 3])) == Vector([3, 2])
+    assert linalg.det(a) == -1
+
+
+def test_cholesky():
+    m = random_matrix(5, 5, 7)
+    spd = m * m.transp() + identity(5)
+    factorization = linalg.cholesky(spd)
+    lower = Matrix.from_buffer(factorization.lower, (5, 5))
+    assert_close(lower * lower.transp(), spd)
+    b = Vector([1, 2, 3, 4, 5])
+    assert linalg.solve(spd, b, method="cholesky").tolist() == pytest.approx(
+        linalg.solve(spd, b).tolist()
+    )
+    assert factorization.det() == pytest.approx(linalg.det(spd))
+    with pytest.raises(ValueError, match="positive definite"):
+        linalg.cholesky(Matrix([[1, 2], [2, 1]]))
+
+
+def test_substitutions():
+    lower = Matrix([[2, 0], [1, 4]])
+    assert linalg.forward_substitution(lower, Vector([4, 10])) == Vector([2, 2])
+    assert linalg.forward_substitution(
+        lower, Vector([4, 10]), unit_diagonal=True
+    ) == Vector([4, 6])
+    upper = Matrix([[2, 1], [0, 4]])
+    assert linalg.back_substitution(upper, Vector([4, 8])) == Vector([1, 2])
+
+
+def test_inverse_and_det():
+    a = random_matrix(4, 4, 3)
+    assert_close(a * linalg.inverse(a), identity(4))
+    assert linalg.det(Matrix([[1, 2], [3, 4]])) == pytest.approx(-2)
+    assert linalg.det(Matrix([[1, 2], [2, 4]])) == 0
+    with pytest.raises(ValueError, match="singular"):
+        linalg.solve(Matrix([[1, 2], [2, 4]]), Vector([1, 1]))
+    with pytest.raises(ValueError, match="square"):
+        linalg.det(Matrix([[1, 2]]))
+
+
+def test_factorization_is_cached():
+    a = random_matrix(4, 4, 5)
+    first = linalg.lu(a)
+    assert linalg.lu(a) is first
+    linalg.solve(a, Vector([1, 2, 3, 4]))
+    assert linalg.lu(a) is first
+    a *= 2  # the values changed: factorize again
+    second = linalg.lu(a)
+    assert second is not first
+    assert linalg.det(a) == pytest.approx(16 * first.det())
+
+
+def test_solve_many_right_sides():
+    a = random_matrix(3, 3, 9)
+    b = random_matrix(3, 2, 10)
+    assert_close(a * linalg.solve(a, b), b)
+    with pytest.raises(ValueError, match="Unknown method"):
+        linalg.solve(a, b, method="qr")
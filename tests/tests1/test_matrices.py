@@ -1,5 +1,8 @@
 import pytest
-from project.task1.matrices import Matrix
+from array import array
+import pickle
+from project.task1.matrices import Matrix, chain_plan, matmul_chain
+from project.task1.vectors import Vector
 
 
 @pytest.mark.parametrize(
@@ -80,3 +83,216 @@ def test_irregular_matrix():
 
     with pytest.raises(ValueError, match="The incorrect dimension of the matrix"):
         Matrix([[1, 2], [3, 4, 5]])
+
+
+def test_packed_storage():
+    m = Matrix([[1, 2, 3], [4, 5, 6]])
+    assert m.shape == (2, 3)
+    assert m.strides == (3, 1)
+    assert m._data.format == "d"
+    assert m._data.tolist() == [1, 2, 3, 4, 5, 6]
+
+
+def test_row_is_view():
+    m = Matrix([[1, 2], [3, 4]])
+    row = m[1]
+    row.value[0] = 10
+    assert m[1][0] == 10
+    assert m[-1][1] == 4
+    with pytest.raises(IndexError):
+        m[2]
+
+
+def test_from_buffer_shares_memory():
+    data = array("d", [1, 2, 3, 4, 5, 6])
+    m = Matrix.from_buffer(data, (3, 2))
+    data[5] = 60
+    assert m[2][1] == 60
+    assert m == Matrix([[1, 2], [3, 4], [5, 60]])
+    with pytest.raises(ValueError, match="The incorrect dimension of the matrix"):
+        Matrix.from_buffer(data, (4, 2))
+
+
+def test_pickle_and_copy():
+    m = Matrix([[1, 2], [3, 4]])
+    assert pickle.loads(pickle.dumps(m)) == m
+    c = m.copy()
+    c[0].value[0] = 100
+    assert m[0][0] == 1
+
+
+def test_matmul_chain():
+    shapes = [(10, 100), (100, 5), (5, 50), (50, 1)]
+    ms = [
+        Matrix([[(i + j) % 3 for j in range(c)] for i in range(r)]) for r, c in shapes
+    ]
+    result, report = matmul_chain(*ms, report=True)
+    assert result == ms[0] * ms[1] * ms[2] * ms[3]
+    assert report["order"] == "(M0 (M1 (M2 M3)))"
+    assert (
+        report["estimated_flops"]
+        == report["actual_flops"]
+        == 5 * 50 + 100 * 5 + 10 * 100
+    )
+    assert report["left_to_right_flops"] == 10 * 100 * 5 + 10 * 5 * 50 + 10 * 50
+    assert matmul_chain(ms[0]) is ms[0]
+
+
+def test_matmul_chain_plan_cache():
+    chain_plan.cache_clear()
+    m = Matrix([[1, 2], [3, 4]])
+    matmul_chain(m, m, m)
+    matmul_chain(m, m, m)
+    assert chain_plan.cache_info().hits == 1
+
+
+def test_matmul_chain_errors():
+    with pytest.raises(ValueError, match="at least one matrix"):
+        matmul_chain()
+    with pytest.raises(ValueError, match="Dimension error"):
+        matmul_chain(Matrix([[1, 2]]), Matrix([[1, 2]]))
+
+
+def test_inplace_operations():
+    m = Matrix([[1, 2], [3, 4]])
+    storage = m._data
+    m += Matrix([[1, 1], [1, 1]])
+    m -= Matrix([[0, 1], [0, 1]])
+    m *= 2
+    assert m == Matrix([[4, 4], [8, 8]])
+    assert m._data is storage
+    m.add_scaled(0.5, Matrix([[2, 2], [2, 2]]))
+    assert m == Matrix([[5, 5], [9, 9]])
+    with pytest.raises(ValueError, match="Matrices must be the same dimension"):
+        m += Matrix([[1, 2, 3]])
+
+
+def test_inplace_on_transposed_view():
+    m = Matrix([[1, 2, 3], [4, 5, 6]])
+    view = m._transposed_view()
+    view += Matrix([[10, 0], [0, 0], [0, 20]])
+    assert m == Matrix([[11, 2, 3], [4, 5, 26]])
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_out_parameter(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    a, b = Matrix([[1, 2], [3, 4]]), Matrix([[5, 6], [7, 8]])
+    out = Matrix([[0, 0], [0, 0]])
+    storage = out._data
+    assert a.add(b, backend=backend, out=out) is out
+    assert out == a + b
+    assert a.matmul(b, backend=backend, out=out) is out
+    assert out == a * b
+    assert out._data is storage
+
+    view = Matrix([[0, 0], [0, 0]])._transposed_view()
+    assert a.matmul(b, backend=backend, out=view) == a * b
+
+
+def test_out_parameter_errors():
+    a = Matrix([[1, 2], [3, 4]])
+    with pytest.raises(ValueError, match="out must have the shape"):
+        a.matmul(a, out=Matrix([[0, 0]]))
+    with pytest.raises(ValueError, match="must not share the storage"):
+        a.matmul(a, out=a)
+
+
+def test_inplace_overlapping_views():
+    m = Matrix([[1.0], [1.0], [1.0]])
+    v = m[1:]
+    v += m[:-1]
+    assert m == Matrix([[1], [2], [2]])
+    m = Matrix([[1, 2], [3, 4]])
+    m += m.transp()
+    assert m == Matrix([[2, 5], [5, 8]])
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_add_out_overlapping_views(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    a = Matrix([[1, 2], [3, 4]])
+    a.add(Matrix([[0, 0], [0, 0]]), backend=backend, out=a.transp())
+    assert a == Matrix([[1, 3], [2, 4]])
+    b = Matrix([[1, 2], [3, 4]])
+    Matrix([[0, 0], [0, 0]]).add(b, backend=backend, out=b.transp())
+    assert b == Matrix([[1, 3], [2, 4]])
+
+
+def test_out_equal_values_separate_storage():
+    a = Matrix([[1, 2], [3, 4]])
+    out = Matrix([[1, 2], [3, 4]])
+    assert a.matmul(a, out=out) is out
+    assert out == Matrix([[7, 10], [15, 22]])
+
+
+def test_out_numpy_backed_operand():
+    pytest.importorskip("numpy")
+    a = Matrix([[i + j for j in range(8)] for i in range(8)])
+    product = a.matmul(a, backend="numpy")  # the storage is a NumPy array
+    out = Matrix([[0] * 8 for _ in range(8)])
+    assert product.matmul(a, out=out) is out
+    assert out == product * a
+    with pytest.raises(ValueError, match="must not share the storage"):
+        product.matmul(a, out=product)
+
+
+def test_transp_is_view():
+    m = Matrix([[1, 2, 3], [4, 5, 6]])
+    t = m.transp()
+    assert t._data.obj is m._data.obj
+    assert t.shape == (3, 2) and not t.is_packed
+    t[0].value[1] = 40  # writes through to the parent
+    assert m[1][0] == 40
+    assert t.transp().is_packed
+
+    packed = t.materialize()
+    assert packed.is_packed and packed._data.obj is not m._data.obj
+    assert packed == t
+    assert m.materialize() is m
+
+
+def test_slices_and_submatrix_views():
+    m = Matrix([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])
+    assert m[1:] == Matrix([[5, 6, 7, 8], [9, 10, 11, 12]])
+    assert m[1:].is_packed
+    assert m[:, 2] == Vector([3, 7, 11])
+    assert m[1, 1:3] == Vector([6, 7])
+    assert m[2, -1] == 12
+    sub = m[0:3:2, 1:4:2]
+    assert sub == Matrix([[2, 4], [10, 12]])
+    assert sub.transp() == Matrix([[2, 10], [4, 12]])
+    assert m[::-1, ::-1] == Matrix([[12, 11, 10, 9], [8, 7, 6, 5], [4, 3, 2, 1]])
+    assert m[::-1, 0] == Vector([9, 5, 1])
+
+    sub *= 0  # views share the storage
+    assert m == Matrix([[1, 0, 3, 0], [5, 6, 7, 8], [9, 0, 11, 0]])
+    assert m.transp()[1:3, :2] == Matrix([[0, 6], [3, 7]])
+
+    with pytest.raises(IndexError):
+        m[3, 0]
+    with pytest.raises(ValueError, match="dimension"):
+        m[2:1]
+
+
+def test_from_rows_stream():
+    from project.task2.generator import pipeline
+
+    lines = (f"{i},{i + 1},{i + 2}" for i in range(100))
+    rows = pipeline(lines, lambda it: map(lambda line: line.split(","), it))
+    m = Matrix.from_rows(map(lambda row: map(float, row), rows), cols=3)
+    assert m.shape == (100, 3)
+    assert len(m._data.obj) == 300  # the spare capacity is released
+    assert m[99] == Vector([99, 100, 101])
+    assert Matrix.from_rows([Vector([1, 2]), (3, 4)]) == Matrix([[1, 2], [3, 4]])
+
+
+def test_from_rows_errors():
+    with pytest.raises(ValueError, match="row 2 has 1 elements, expected 2"):
+        Matrix.from_rows(iter([[1, 2], [3, 4], [5]]))
+    with pytest.raises(ValueError, match="incorrect dimension"):
+        Matrix.from_rows(iter([]))
+    with pytest.raises(ValueError, match="incorrect dimension"):
+        Matrix([[]])
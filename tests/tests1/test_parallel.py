@@ -0,0 +1,50 @@
+import pytest
+from project.task1 import parallel
+from project.task1.matrices import Matrix
+from helpers import random_matrix
+
+
+@pytest.mark.parametrize("rows, inner, cols, workers", [(7, 5, 3, 2), (3, 4, 5, 4)])
+def test_workers_argument(rows, inner, cols, workers, monkeypatch):
+    monkeypatch.setattr(parallel, "_threshold", 0)
+    a, b = random_matrix(rows, inner, 1), random_matrix(inner, cols, 2)
+    expected = a.matmul(b, backend="python")
+    assert a.matmul(b, backend="python", workers=workers) == expected
+
+
+def test_workers_win_over_auto_backend(monkeypatch):
+    calls = []
+    split = parallel.matmul
+    monkeypatch.setattr(
+        parallel, "matmul", lambda *args, **kw: calls.append(1) or split(*args, **kw)
+    )
+    monkeypatch.setattr(parallel, "_threshold", 0)
+    a, b = random_matrix(8, 8, 1), random_matrix(8, 8, 2)  # "auto" -> NumPy size
+    assert a.matmul(b, workers=2) == a.matmul(b, backend="python")
+    assert calls == [1]
+
+
+def test_context_manager():
+    a, b = random_matrix(6, 6, 3), random_matrix(6, 6, 4)
+    expected = a.matmul(b, backend="python")
+    with parallel.parallel(2, threshold=0) as executor:
+        assert parallel.choose_workers(None, 1) == 2
+        assert a.matmul(b, backend="python") == expected
+        assert a.matmul(b, backend="python") == expected
+    assert executor is not None
+    assert parallel.choose_workers(None, 10**9) == 1
+
+
+def test_serial_below_threshold():
+    with parallel.parallel(2, threshold=1000):
+        assert parallel.choose_workers(None, 999) == 1
+        assert parallel.choose_workers(None, 1000) == 2
+        assert parallel.choose_workers(3, 999) == 1
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError, match="The quantity of workers must be positive"):
+        Matrix([[1]]).matmul(Matrix([[1]]), workers=0)
+    with pytest.raises(ValueError, match="The quantity of workers must be positive"):
+        with parallel.parallel(0):
+            pass
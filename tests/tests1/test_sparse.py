@@ -0,0 +1,93 @@
+import pytest
+import random
+from project.task1.matrices import Matrix
+from project.task1.sparse import SparseMatrix
+
+
+def random_rows(rows, cols, seed, density=0.3):
+    rnd = random.Random(seed)
+    return [
+        [rnd.randint(-5, 5) if rnd.random() < density else 0 for _ in range(cols)]
+        for _ in range(rows)
+    ]
+
+
+def test_csr_storage():
+    s = SparseMatrix([[0, 2, 0], [0, 0, 0], [1, 0, 3]])
+    assert s.shape == (3, 3)
+    assert s.indptr.tolist() == [0, 1, 1, 3]
+    assert s.indices.tolist() == [1, 0, 2]
+    assert s.data.tolist() == [2, 1, 3]
+    assert s.nnz == 3
+
+
+def test_from_coo():
+    s = SparseMatrix.from_coo(
+        [2, 0, 2, 1, 1], [0, 1, 0, 2, 2], [1, 2, 3, 4, -4], (3, 3)
+    )
+    assert s == SparseMatrix([[0, 2, 0], [0, 0, 0], [4, 0, 0]])
+    assert s.to_coo() == ([0, 2], [1, 0], [2, 4])
+    with pytest.raises(IndexError):
+        SparseMatrix.from_coo([3], [0], [1], (3, 3))
+    with pytest.raises(ValueError, match="The incorrect dimension of the matrix"):
+        SparseMatrix.from_coo([], [], [], (0, 3))
+
+
+def test_dense_conversion():
+    rows = random_rows(5, 4, 1)
+    assert SparseMatrix(Matrix(rows)).to_dense() == Matrix(rows)
+    assert SparseMatrix(rows) == Matrix(rows)
+    assert Matrix(rows) == SparseMatrix(rows)
+
+
+def test_getitem():
+    s = SparseMatrix([[0, 2, 0], [1, 0, 3]])
+    assert s[0][1] == 2
+    assert s[-1].tolist() == [1, 0, 3]
+    assert s[1, 2] == 3
+    assert s[1, 1] == 0
+    with pytest.raises(IndexError):
+        s[2]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_addition(seed):
+    a, b = random_rows(4, 6, seed), random_rows(4, 6, seed + 10)
+    expected = Matrix(a) + Matrix(b)
+    result = SparseMatrix(a) + SparseMatrix(b)
+    assert isinstance(result, SparseMatrix)
+    assert result == expected
+    assert SparseMatrix(a) + Matrix(b) == expected
+    assert Matrix(a) + SparseMatrix(b) == expected
+
+
+def test_addition_cancels_to_zero():
+    s = SparseMatrix([[1, 0], [0, 2]]) + SparseMatrix([[-1, 0], [0, 1]])
+    assert s.nnz == 1
+
+
+@pytest.mark.parametrize("n, p, m, seed", [(3, 4, 5, 1), (6, 6, 6, 2), (1, 7, 2, 3)])
+def test_multiplication(n, p, m, seed):
+    a, b = random_rows(n, p, seed), random_rows(p, m, seed + 10)
+    expected = Matrix(a) * Matrix(b)
+    result = SparseMatrix(a) * SparseMatrix(b)
+    assert isinstance(result, SparseMatrix)
+    assert result == expected
+    assert SparseMatrix(a) * Matrix(b) == expected
+    assert Matrix(a) * SparseMatrix(b) == expected
+
+
+def test_dimension_errors():
+    s = SparseMatrix([[1, 2], [3, 4]])
+    with pytest.raises(ValueError, match="Dimension error"):
+        s * SparseMatrix([[1, 2, 3]])
+    with pytest.raises(ValueError, match="Matrices must be the same dimension"):
+        s + Matrix([[1, 2, 3], [4, 5, 6]])
+
+
+def test_transp():
+    rows = random_rows(4, 7, 5)
+    s = SparseMatrix(rows).transp()
+    assert s.shape == (7, 4)
+    assert s == Matrix(rows).transp()
+    assert s.transp() == SparseMatrix(rows)
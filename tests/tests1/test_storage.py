@@ -0,0 +1,120 @@
+import pytest
+from project.task1 import storage
+from project.task1.matrices import Matrix
+from project.task1.vectors import Vector
+from helpers import random_matrix
+
+
+def file_matrix(path, matrix):
+    mapped = Matrix.memmap(path, "w+", shape=matrix.shape)
+    mapped += matrix
+    return mapped
+
+
+def test_header():
+    assert storage.unpack_header(storage.pack_header((3, 4))) == (3, 4)
+    assert storage.unpack_header(storage.pack_header((5,))) == (5,)
+    assert storage.HEADER.size == 32
+    with pytest.raises(ValueError, match="binary format"):
+        storage.unpack_header(b"x" * 32)
+    with pytest.raises(ValueError, match="too short"):
+        storage.unpack_header(b"SPBM")
+
+
+def test_memmap_roundtrip(tmp_path):
+    path = tmp_path / "m.bin"
+    m = random_matrix(4, 3, 1)
+    mapped = file_matrix(path, m)
+    mapped[0].value[0] = 100
+    del mapped
+
+    assert path.stat().st_size == storage.HEADER.size + 4 * 3 * 8
+    loaded = Matrix.from_file(path)
+    assert loaded[0][0] == 100
+    assert loaded[1] == m[1]
+    with pytest.raises(TypeError):
+        loaded[0].value[0] = 1
+
+    writable = Matrix.memmap(path, "r+")
+    writable *= 2
+    del writable
+    assert Matrix.from_file(path)[3] == Matrix([[2 * x for x in m[3]]])[0]
+
+
+def test_memmap_errors(tmp_path):
+    with pytest.raises(ValueError, match="Unknown mode"):
+        Matrix.memmap(tmp_path / "m.bin", "a")
+    with pytest.raises(ValueError, match="shape is required"):
+        Matrix.memmap(tmp_path / "m.bin", "w+")
+
+
+@pytest.mark.parametrize("shape", [(0, 3), (4,), (2, -1)])
+def test_memmap_bad_shape_keeps_file(tmp_path, shape):
+    path = tmp_path / "m.bin"
+    Matrix([[1, 2], [3, 4]]).save(path)
+    size = path.stat().st_size
+    with pytest.raises(ValueError, match="incorrect dimension"):
+        Matrix.memmap(path, "w+", shape=shape)
+    assert path.stat().st_size == size
+    assert Matrix.load(path) == Matrix([[1, 2], [3, 4]])
+
+
+def test_transp_stream(tmp_path):
+    m = random_matrix(7, 5, 2)
+    source = file_matrix(tmp_path / "a.bin", m)
+    out = Matrix.memmap(tmp_path / "t.bin", "w+", shape=(5, 7))
+    assert storage.transp_stream(source, out, memory_limit=16) is out
+    assert out == m.transp()
+
+
+@pytest.mark.parametrize("memory_limit", [1, 100, storage.MEMORY_LIMIT])
+def test_matmul_stream(tmp_path, memory_limit):
+    a, b = random_matrix(6, 4, 3), random_matrix(4, 5, 4)
+    left = file_matrix(tmp_path / "a.bin", a)
+    right = file_matrix(tmp_path / "b.bin", b)
+    out = Matrix.memmap(tmp_path / "c.bin", "w+", shape=(6, 5))
+    storage.matmul_stream(left, right, out, memory_limit=memory_limit)
+    assert out == a * b
+    with pytest.raises(ValueError, match="Dimension error"):
+        storage.matmul_stream(right, right, out)
+
+
+def test_matrix_bytes_roundtrip():
+    m = random_matrix(3, 4, 5)
+    data = m.to_bytes()
+    assert len(data) == storage.HEADER.size + 3 * 4 * 8
+    loaded = Matrix.from_bytes(data)
+    assert loaded == m
+    assert loaded._data.obj is data  # zero-copy view of the bytes
+    assert Matrix.from_bytes(m.transp().to_bytes()) == m.transp()
+    with pytest.raises(ValueError, match="vector"):
+        Matrix.from_bytes(m[0].to_bytes())
+    with pytest.raises(ValueError, match="shorter"):
+        Matrix.from_bytes(data[:-8])
+
+
+def test_vector_bytes_roundtrip():
+    v = Vector([1.5, -2, 3])
+    loaded = Vector.from_bytes(bytearray(v.to_bytes()))
+    assert loaded == v
+    loaded.value[0] = 7  # bytearray gives a writable view
+    assert loaded[0] == 7
+    column = Matrix([[1, 2], [3, 4]]).transp()[0]  # strided view
+    assert Vector.from_bytes(column.to_bytes()) == Vector([1, 3])
+    with pytest.raises(ValueError, match="matrix"):
+        Vector.from_bytes(Matrix([[1]]).to_bytes())
+
+
+def test_save_load(tmp_path):
+    m = random_matrix(5, 2, 6)
+    m.save(tmp_path / "m.bin")
+    loaded = Matrix.load(tmp_path / "m.bin")
+    assert loaded == m
+    loaded *= 2  # the loaded storage is writable
+    assert Matrix.from_file(tmp_path / "m.bin") == m
+
+    v = Vector([1, 2, 3])
+    v.save(tmp_path / "v.bin")
+    assert Vector.load(tmp_path / "v.bin") == v
+    with pytest.raises(ValueError, match="vector"):
+        Matrix.load(tmp_path / "v.bin")
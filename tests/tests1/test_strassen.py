@@ -0,0 +1,69 @@
+import pytest
+from project.task1 import strassen
+from project.task1.matrices import Matrix
+from helpers import random_matrix
+
+
+@pytest.fixture
+def crossover():
+    previous = strassen.get_crossover()
+    yield
+    strassen.set_crossover(*previous)
+
+
+@pytest.mark.parametrize(
+    "size, leaf, expected",
+    [(8, 8, 8), (8, 2, 8), (9, 4, 12), (100, 16, 104), (5, 1, 8)],
+)
+def test_padded_size(size, leaf, expected):
+    assert strassen.padded_size(size, leaf) == expected
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 8, 13, 16])
+@pytest.mark.parametrize("leaf", [1, 2, 3])
+def test_strassen_matmul(size, leaf):
+    a, b = random_matrix(size, size, size), random_matrix(size, size, size + 1)
+    data = strassen.matmul(a._flat(), b._flat(), size, leaf_size=leaf)
+    assert Matrix.from_buffer(data, (size, size)) == a.matmul(b, algorithm="classical")
+
+
+def test_matmul_algorithm(crossover):
+    a, b = random_matrix(10, 10, 1), random_matrix(10, 10, 2)
+    expected = a.matmul(b, algorithm="classical")
+    strassen.set_crossover(1000, leaf_size=2)
+    assert a.matmul(b, backend="python", algorithm="strassen") == expected
+    transposed = a.transp().matmul(b.transp(), backend="python", algorithm="strassen")
+    assert transposed == (b * a).transp()
+    out = Matrix([[0] * 10 for _ in range(10)])
+    assert a.matmul(b, backend="python", algorithm="strassen", out=out) is out
+    assert out == expected
+
+    strassen.set_crossover(8)  # "auto" switches to the recursion
+    assert a.matmul(b, backend="python") == expected
+    with pytest.raises(ValueError, match="square"):
+        random_matrix(2, 3, 3).matmul(random_matrix(3, 2, 4), algorithm="strassen")
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        a.matmul(b, algorithm="fast")
+
+
+def test_explicit_strassen_wins_over_auto_backend(monkeypatch):
+    calls = []
+    recurse = strassen.matmul
+    monkeypatch.setattr(
+        strassen, "matmul", lambda *args, **kw: calls.append(1) or recurse(*args, **kw)
+    )
+    a, b = random_matrix(10, 10, 1), random_matrix(10, 10, 2)  # "auto" -> NumPy size
+    assert a.matmul(b, algorithm="strassen") == a.matmul(b, algorithm="classical")
+    assert calls == [1]
+
+
+def test_config(tmp_path, crossover):
+    path = tmp_path / "strassen.json"
+    assert not strassen.load_config(path)
+    strassen.set_crossover(300, 50)
+    strassen.save_config(path)
+    strassen.set_crossover(10, 10)
+    assert strassen.load_config(path)
+    assert strassen.get_crossover() == (300, 50)
+    with pytest.raises(ValueError, match="positive"):
+        strassen.set_crossover(0)
@@ -1,5 +1,7 @@
 import pytest
-from project.task1.vectors import Vector
+from array import array
+import pickle
+from project.task1.vectors import FrozenVector, Vector, VectorBatch
 import math
 
 
@@ -60,3 +62,130 @@ def test_empty_vector():
 
     with pytest.raises(ValueError, match="The incorrect value of the vector"):
         Vector([])
+
+
+def test_packed_storage():
+    v = Vector([1, 2, 3])
+    assert v.value.format == "d"
+    assert v.tolist() == [1, 2, 3]
+    assert str(v) == "[1.0, 2.0, 3.0]"
+
+
+def test_buffer_is_shared():
+    data = array("d", [1, 2, 3])
+    v = Vector(data)
+    data[0] = 5
+    assert v[0] == 5
+    c = v.copy()
+    data[0] = 7
+    assert c[0] == 5
+    assert pickle.loads(pickle.dumps(v)) == v
+
+
+BATCH = [[1, 0, 0], [0, 2, 0], [1, 1, 0], [-3, 0, 4]]
+
+
+def test_batch_storage():
+    batch = VectorBatch(BATCH)
+    assert len(batch) == 4
+    assert batch.dim == 3
+    assert batch.data.tolist() == [x for vec in BATCH for x in vec]
+    assert batch[-1] == Vector(BATCH[-1])
+    with pytest.raises(ValueError, match="vectors must be the same size"):
+        VectorBatch([[1, 2], [1]])
+    with pytest.raises(ValueError, match="The incorrect value of the vector"):
+        VectorBatch.from_buffer(array("d", [1, 2, 3]), 2)
+
+
+def test_batch_norms_are_cached():
+    batch = VectorBatch([Vector(vec) for vec in BATCH])
+    norms = batch.norms()
+    assert norms.tolist() == pytest.approx([1, 2, 2**0.5, 5])
+    assert batch.norms() is norms
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_batch_pairwise(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    batch = VectorBatch(BATCH)
+    vectors = [Vector(vec) for vec in BATCH]
+    dots, angles = batch.dots(backend=backend), batch.angles(backend=backend)
+    cosine = batch.cosine(backend=backend)
+    assert batch.dot(vectors[2], backend=backend).tolist() == [1, 2, 2, -3]
+    for i, v1 in enumerate(vectors):
+        for j, v2 in enumerate(vectors):
+            assert dots[i][j] == pytest.approx(v1 * v2)
+            assert cosine[i][j] == pytest.approx(v1 * v2 / (v1.norm() * v2.norm()))
+            assert angles[i][j] == pytest.approx(v1.angle(v2), abs=1e-7)
+
+
+def test_batch_nearest():
+    batch = VectorBatch(BATCH)
+    assert [i for i, _ in batch.nearest(Vector([1, 0.9, 0]), k=2)] == [2, 0]
+    result = batch.nearest(Vector([1, 0.1, 0]), k=1, metric="euclidean")
+    assert result[0][0] == 0
+    assert result[0][1] == pytest.approx(0.1)
+    with pytest.raises(ValueError, match="Unknown metric"):
+        batch.nearest(Vector([1, 0, 0]), metric="manhattan")
+
+
+def test_frozen_vector():
+    data = array("d", [3, 4])
+    v = FrozenVector(data)
+    data[0] = 100
+    assert v.tolist() == [3, 4]
+    assert v.norm() == 5
+    assert v.norm() is v.norm()
+    assert v == Vector([3, 4])
+    assert {v: "key"}[FrozenVector([3, 4])] == "key"
+    assert v.angle(Vector([3, 4])) == 0
+
+
+def test_frozen_vector_is_immutable():
+    v = Vector([1, 2]).freeze()
+    assert isinstance(v, FrozenVector)
+    assert v.freeze() is v
+    with pytest.raises(TypeError):
+        v.value[0] = 5
+    with pytest.raises(AttributeError, match="FrozenVector is immutable"):
+        v.value = memoryview(array("d", [5, 6]))
+    with pytest.raises(AttributeError):
+        v.extra = 1
+    assert pickle.loads(pickle.dumps(v)) == v
+    assert isinstance(v.copy(), Vector) and not isinstance(v.copy(), FrozenVector)
+
+
+def test_vector_inplace_operations():
+    v = Vector([1, 2])
+    storage = v.value
+    v += Vector([1, 1])
+    v -= Vector([0, 2])
+    v *= 3
+    assert v == Vector([6, 3])
+    v.add_scaled(2, Vector([1, 1]))
+    assert v == Vector([8, 5])
+    assert v.value is storage
+    out = Vector([0, 0])
+    assert Vector([1, 2]).add(Vector([3, 4]), out=out) is out
+    assert out == Vector([4, 6])
+    with pytest.raises(ValueError, match="Dimension error"):
+        v += Vector([1, 2, 3])
+
+
+def test_inplace_overlapping_views():
+    data = Vector([1, 1, 1]).value
+    v = Vector(data[1:])
+    v += Vector(data[:-1])
+    assert list(data) == [1, 2, 2]
+    v = Vector(data[:-1])
+    v.add_scaled(10, Vector(data[1:]))
+    assert list(data) == [21, 22, 2]
+
+
+def test_frozen_vector_inplace():
+    v = FrozenVector([1, 2])
+    with pytest.raises(TypeError, match="FrozenVector is immutable"):
+        v += Vector([1, 1])
+    with pytest.raises(TypeError, match="FrozenVector is immutable"):
+        v *= 2
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from project.task2.aio import agenerator, apipeline, acollect, amap, afilter
+
+
+async def arange(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def double(value):
+    await asyncio.sleep(0)
+    return value * 2
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.parametrize(
+    "data, expect", [([1, 2, 3], [1, 2, 3]), (range(2), [0, 1]), (arange(3), [0, 1, 2])]
+)
+def test_agenerator(data, expect):
+    assert run(acollect(agenerator(data))) == expect
+
+
+@pytest.mark.parametrize(
+    "source, operations, expect",
+    [
+        (arange(5), [amap(double)], [0, 2, 4, 6, 8]),
+        ([1, 2, 3], [lambda g: (x + 1 async for x in g)], [2, 3, 4]),
+        (arange(6), [afilter(lambda v: v % 2 == 0), amap(double)], [0, 4, 8]),
+        (arange(3), [amap(lambda v: -v)], [0, -1, -2]),
+    ],
+)
+def test_apipeline(source, operations, expect):
+    assert run(acollect(apipeline(source, *operations))) == expect
+
+
+def test_acollect_inside_pipeline():
+    assert run(apipeline(arange(3), amap(double), acollect)) == [0, 2, 4]
+    assert run(apipeline(arange(3), lambda g: acollect(g, set))) == {0, 1, 2}
+
+
+def test_concurrency_overlaps_and_keeps_order():
+    active, peak = 0, 0
+
+    async def lookup(value):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01 * (5 - value % 5))
+        active -= 1
+        return value
+
+    async def main():
+        return await acollect(apipeline(arange(20), amap(lookup, concurrency=4)))
+
+    assert run(main()) == list(range(20))
+    assert peak == 4
+
+
+def test_backpressure_and_unordered():
+    read = []
+
+    async def source():
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    async def slow(value):
+        await asyncio.sleep(0.05 if value == 0 else 0)
+        return value
+
+    async def main():
+        stage = apipeline(source(), amap(slow, concurrency=3, ordered=False))
+        first = await stage.__anext__()
+        reads = len(read)
+        await stage.aclose()
+        return first, reads
+
+    first, reads = run(main())
+    assert first != 0
+    assert reads <= 4  # only the window of the stage is read ahead
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="concurrency"):
+        amap(double, concurrency=0)
+
+    async def fail(value):
+        raise RuntimeError("lookup failed")
+
+    with pytest.raises(RuntimeError, match="lookup failed"):
+        run(acollect(apipeline([1, 2], amap(fail, concurrency=2))))
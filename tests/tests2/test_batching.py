@@ -0,0 +1,88 @@
+import pytest
+import time
+from array import array
+from functools import reduce
+from project.task2.batching import BatchStream, batch_aware, batches
+from project.task2.generator import generator, pipeline, collect
+from project.task2.operators import Map, Filter, FlatMap, Take, MapBatches
+
+
+@pytest.mark.parametrize(
+    "batch_size, typecode, expect",
+    [
+        (2, None, [[0, 1], [2, 3], [4]]),
+        (5, None, [[0, 1, 2, 3, 4]]),
+        (3, "q", [array("q", [0, 1, 2]), array("q", [3, 4])]),
+    ],
+)
+def test_generator_batches(batch_size, typecode, expect):
+    stream = generator(range(5), batch_size=batch_size, typecode=typecode)
+    assert isinstance(stream, BatchStream)
+    assert list(stream) == expect
+
+
+def test_time_bounded_batches():
+    def slow():
+        for i in range(4):
+            time.sleep(0.03)
+            yield i
+
+    result = list(batches(slow(), batch_size=100, max_delay=0.05))
+    assert [x for batch in result for x in batch] == [0, 1, 2, 3]
+    assert len(result) > 1
+
+
+@pytest.mark.parametrize(
+    "operations, expect",
+    [
+        ([], list(range(10))),
+        ([Map(lambda x: x * 2), Filter(lambda x: x > 10)], [12, 14, 16, 18]),
+        ([FlatMap(lambda x: [x, x] if x < 2 else [])], [0, 0, 1, 1]),
+        (
+            [MapBatches(lambda batch: [sum(batch)] * len(batch))],
+            [3] * 3 + [12] * 3 + [21] * 3 + [9],
+        ),
+        # not batch-aware stages get the flattened stream
+        ([Take(3)], [0, 1, 2]),
+        (
+            [lambda g: (x + 1 for x in g), Map(lambda x: -x)],
+            [-x - 1 for x in range(10)],
+        ),
+    ],
+)
+def test_pipeline_on_batches(operations, expect):
+    result = pipeline(generator(range(10), batch_size=3), *operations)
+    assert collect(result) == expect
+
+
+def test_batch_aware_decorator():
+    seen = []
+
+    @batch_aware
+    def record(stream):
+        for batch in stream:
+            seen.append(len(batch))
+            yield batch
+
+    result = pipeline(
+        generator(range(7), batch_size=3), Filter(lambda x: x != 1), record
+    )
+    assert isinstance(result, BatchStream)
+    assert collect(result, tuple) == (0, 2, 3, 4, 5, 6)
+    assert seen == [2, 3, 1]
+
+
+def test_reduce_on_batches():
+    total = pipeline(
+        generator(range(10), batch_size=4),
+        Map(lambda x: x + 1),
+        lambda g: reduce(lambda a, b: a + b, g, 0),
+    )
+    assert total == 55
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="batch size"):
+        generator([1], batch_size=0)
+    with pytest.raises(ValueError, match="delay"):
+        batches([1], 1, max_delay=0)
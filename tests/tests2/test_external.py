@@ -0,0 +1,92 @@
+import pytest
+import random
+from project.task2 import external
+from project.task2.generator import generator, pipeline, collect
+from project.task2.operators import Map, Take
+from project.task2.external import SortStage, DistinctStage, BloomFilter
+
+
+def test_sort_in_memory():
+    data = [5, 3, 9, 1, 3]
+    assert collect(pipeline(generator(data), SortStage())) == sorted(data)
+    assert list(SortStage(reverse=True)(data)) == sorted(data, reverse=True)
+    assert list(SortStage()([])) == []
+
+
+@pytest.mark.parametrize("fan_in", [64, 3])
+def test_sort_spilled(monkeypatch, fan_in, tmp_path):
+    monkeypatch.setattr(external, "MERGE_FAN_IN", fan_in)
+    data = [random.Random(0).randint(0, 1000) for _ in range(5000)]
+    stage = SortStage(memory_limit=4096, tmpdir=str(tmp_path))
+    assert list(stage(data)) == sorted(data)
+
+
+def test_sort_stable_key():
+    data = [(random.Random(1).randint(0, 10), i) for i in range(3000)]
+    stage = SortStage(key=lambda pair: pair[0], memory_limit=2048)
+    assert list(stage(data)) == sorted(data, key=lambda pair: pair[0])
+    reverse = SortStage(key=lambda pair: pair[0], memory_limit=2048, reverse=True)
+    assert list(reverse(data)) == sorted(data, key=lambda pair: pair[0], reverse=True)
+
+
+def test_sort_in_pipeline():
+    result = pipeline(
+        generator(range(1000), batch_size=64),
+        Map(lambda x: -x),
+        SortStage(memory_limit=1024),
+        Take(3),
+    )
+    assert collect(result) == [-999, -998, -997]
+
+
+def test_distinct_exact():
+    data = [3, 1, 3, 2, 1, 4]
+    assert collect(pipeline(generator(data), DistinctStage())) == [3, 1, 2, 4]
+    words = ["a", "B", "b", "A", "c"]
+    assert list(DistinctStage(key=str.lower)(words)) == ["a", "B", "c"]
+
+
+def test_distinct_incremental():
+    results = DistinctStage()(iter([1, 1, 2]))
+    assert next(results) == 1
+    assert next(results) == 2
+
+
+def test_distinct_spilled(tmp_path):
+    rng = random.Random(2)
+    data = [rng.randint(0, 3000) for _ in range(10_000)]
+    stage = DistinctStage(memory_limit=2048, tmpdir=str(tmp_path))
+    result = list(stage(data))
+    assert len(result) == len(set(result))
+    assert set(result) == set(data)
+
+
+def test_distinct_approximate():
+    data = list(range(2000)) * 2
+    result = list(DistinctStage(approximate=True, capacity=2000)(data))
+    assert result == sorted(set(result))  # the order of the input is kept
+    assert 0.95 * 2000 <= len(result) <= 2000
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(1000, 0.01)
+    for i in range(1000):
+        bloom.add(i)
+    assert all(i in bloom for i in range(1000))
+    false = sum(i in bloom for i in range(1000, 11000))
+    assert false < 300
+    assert bloom.add(5)
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: SortStage(memory_limit=0),
+        lambda: DistinctStage(memory_limit=-1),
+        lambda: DistinctStage(approximate=True, capacity=0),
+        lambda: BloomFilter(10, 1.5),
+    ],
+)
+def test_errors(factory):
+    with pytest.raises(ValueError):
+        factory()
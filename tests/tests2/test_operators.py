@@ -0,0 +1,82 @@
+import pytest
+from functools import partial
+from project.task2.generator import generator, pipeline, collect
+from project.task2.operators import (
+    Operator,
+    Map,
+    Filter,
+    FlatMap,
+    Take,
+    Reduce,
+    Batch,
+    Fused,
+    fuse,
+)
+from project.task2.parallel import parallel_pipeline
+
+
+def inc(value):
+    return value + 1
+
+
+def is_odd(value):
+    return value % 2 == 1
+
+
+@pytest.mark.parametrize(
+    "operations, expect",
+    [
+        ([Map(lambda x: x * 2)], [0, 2, 4, 6, 8, 10]),
+        ([Filter(lambda x: x > 3)], [4, 5]),
+        ([FlatMap(lambda x: [x] * (x % 3))], [1, 2, 2, 4, 5, 5]),
+        ([Take(2)], [0, 1]),
+        ([Batch(4)], [[0, 1, 2, 3], [4, 5]]),
+        ([Map(inc), Filter(is_odd), Map(lambda x: -x)], [-1, -3, -5]),
+        ([Filter(is_odd), Filter(lambda x: x > 1), Take(1)], [3]),
+        # the callable-stage form works together with the operators
+        ([Map(inc), lambda g: (x * 10 for x in g), Map(inc)], [11, 21, 31, 41, 51, 61]),
+    ],
+)
+def test_operators(operations, expect):
+    assert collect(pipeline(generator(range(6)), *operations)) == expect
+
+
+def test_reduce():
+    assert pipeline(range(5), Map(inc), Reduce(lambda a, b: a + b)) == 15
+    assert pipeline([], Reduce(lambda a, b: a + b, 100)) == 100
+    assert "initial=100" in repr(Reduce(max, 100))
+
+
+def test_fusion():
+    stages = fuse([Map(inc), Filter(is_odd), Map(inc), Take(3), Map(inc), len])
+    assert [type(stage) for stage in stages] == [Fused, Take, Map, type(len)]
+    assert len(stages[0].steps) == 3
+    assert fuse([Map(inc)])[0].__class__ is Map
+    assert collect(stages[0](range(6))) == [2, 4, 6]
+
+
+def test_operators_in_parallel_pipeline():
+    result = parallel_pipeline(
+        range(20), Map(inc), Filter(is_odd), workers=2, chunk_size=3, executor="process"
+    )
+    assert collect(result) == [i for i in range(1, 21) if i % 2]
+    assert collect(
+        parallel_pipeline(range(3), partial(map, inc), Take(5), executor="thread")
+    ) == [1, 2, 3]
+
+
+def test_operator_is_abstract():
+    class Incomplete(Operator):
+        pass
+
+    with pytest.raises(TypeError):
+        Operator()
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="batch size"):
+        Batch(0)
+    with pytest.raises(ValueError, match="non-negative"):
+        Take(-1)
@@ -0,0 +1,88 @@
+import pytest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, reduce
+from project.task2.generator import generator, collect
+from project.task2.parallel import parallel_pipeline
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_same_as_pipeline(executor, chunk_size):
+    result = parallel_pipeline(
+        generator(range(100)),
+        partial(map, abs),
+        partial(filter, is_even),
+        workers=2,
+        chunk_size=chunk_size,
+        executor=executor,
+    )
+    assert collect(result) == list(range(0, 100, 2))
+
+
+def test_lambdas_and_generator_stages():
+    result = parallel_pipeline(
+        range(20),
+        lambda x: map(lambda y: y * 3, x),
+        lambda g: (v + 1 for v in g),
+        workers=3,
+        chunk_size=4,
+        executor="thread",
+    )
+    assert reduce(lambda a, b: a + b, result, 0) == sum(3 * y + 1 for y in range(20))
+
+
+def slow_first(values):
+    for value in values:
+        if value == 0:
+            time.sleep(0.2)
+        yield value
+
+
+def test_unordered():
+    result = parallel_pipeline(
+        range(8), slow_first, workers=4, chunk_size=1, executor="thread", ordered=False
+    )
+    output = collect(result)
+    assert sorted(output) == list(range(8))
+    assert output[0] != 0  # the slow chunk doesn't block the others
+
+    ordered = parallel_pipeline(
+        range(8), slow_first, workers=4, chunk_size=1, executor="thread"
+    )
+    assert collect(ordered) == list(range(8))
+
+
+def test_external_executor_and_laziness():
+    consumed = []
+
+    def source():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        result = parallel_pipeline(source(), workers=2, chunk_size=10, executor=pool)
+        assert next(result) == 0
+        assert len(consumed) <= 2 * 2 * 10 + 10  # only a window of chunks is read
+        result.close()
+        assert collect(parallel_pipeline([1, 2], executor=pool)) == [1, 2]
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="workers must be positive"):
+        parallel_pipeline([1], workers=0)
+    with pytest.raises(ValueError, match="chunk size"):
+        parallel_pipeline([1], chunk_size=0)
+    with pytest.raises(ValueError, match="Unknown executor"):
+        parallel_pipeline([1], executor="gpu")
+
+    def fail(values):
+        raise RuntimeError("stage failed")
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        collect(parallel_pipeline([1, 2, 3], fail, executor="thread"))
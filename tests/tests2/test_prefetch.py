@@ -0,0 +1,105 @@
+import pytest
+import threading
+import time
+from project.task2.generator import generator, pipeline, collect
+from project.task2.operators import Map, Take
+from project.task2.prefetch import buffered, prefetch
+
+
+def test_same_output():
+    result = pipeline(generator(range(100)), Map(lambda x: x + 1), prefetch(4))
+    assert collect(result) == list(range(1, 101))
+    batched = pipeline(generator(range(10), batch_size=3), prefetch(2), Map(abs))
+    assert collect(batched) == list(range(10))
+
+
+def test_stages_overlap():
+    events = []
+
+    def source():
+        for i in range(5):
+            time.sleep(0.002)
+            events.append(("produced", i))
+            yield i
+
+    def slow_stage(values):
+        for value in values:
+            events.append(("start", value))
+            time.sleep(0.03)
+            events.append(("end", value))
+            yield value
+
+    assert collect(pipeline(source(), prefetch(2), slow_stage)) == list(range(5))
+    # the producer ran ahead: the next element was read, while the stage was busy
+    start, end = events.index(("start", 0)), events.index(("end", 0))
+    assert ("produced", 1) in events[start:end]
+
+
+def wait_producers():
+    deadline = time.monotonic() + 1
+    while [t for t in threading.enumerate() if t.name == "prefetch"]:
+        assert time.monotonic() < deadline, "the producer thread is still alive"
+        time.sleep(0.01)
+
+
+def test_bounded_queue():
+    produced = []
+
+    def source():
+        for i in range(1000):
+            produced.append(i)
+            yield i
+
+    stream = buffered(source(), 3)
+    assert next(stream) == 0
+    time.sleep(0.05)
+    assert len(produced) <= 3 + 2  # the queue, the consumed one and one in put()
+    stream.close()
+
+
+def test_early_termination_closes_producer():
+    closed = threading.Event()
+
+    def source():
+        try:
+            for i in range(10**9):
+                yield i
+        finally:
+            closed.set()
+
+    assert collect(pipeline(source(), prefetch(8), Take(3))) == [0, 1, 2]
+    assert closed.wait(1)
+    wait_producers()
+
+
+def test_stalled_source_doesnt_block_take():
+    release, closed = threading.Event(), threading.Event()
+
+    def source():
+        try:
+            yield from range(3)
+            release.wait(10)  # a read, which blocks (a socket, a pipe...)
+            yield from range(3, 100)
+        finally:
+            closed.set()
+
+    start = time.perf_counter()
+    assert collect(pipeline(source(), prefetch(8), Take(3))) == [0, 1, 2]
+    assert time.perf_counter() - start < 2
+    assert not closed.is_set()  # the producer is still blocked in the source
+    release.set()
+    assert closed.wait(1)  # it closes the source, when the read returns
+    wait_producers()
+
+
+def test_exception_propagates():
+    def failing():
+        yield 1
+        raise OSError("read failed")
+
+    stream = buffered(failing(), 2)
+    assert next(stream) == 1
+    with pytest.raises(OSError, match="read failed"):
+        next(stream)
+    with pytest.raises(ValueError, match="prefetch size"):
+        prefetch(0)
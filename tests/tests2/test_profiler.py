@@ -0,0 +1,111 @@
+import pytest
+import time
+import tracemalloc
+from functools import reduce
+from project.task2.generator import generator, pipeline, collect
+from project.task2.operators import Map, Filter
+from project.task2.profiler import instrumented_pipeline, PipelineReport
+
+
+def slow_stage(values):
+    for value in values:
+        time.sleep(0.002)
+        yield value
+
+
+def big_stage(values):
+    for value in values:
+        yield [value] * 100_000
+
+
+def test_counts_and_times():
+    result, report = instrumented_pipeline(
+        generator(range(20)),
+        Filter(lambda x: x % 2 == 0),
+        slow_stage,
+        Map(lambda x: x * 10),
+    )
+    assert not report.finished
+    assert collect(result) == [x * 10 for x in range(0, 20, 2)]
+    assert report.finished
+    filter_stats, slow, mapped = report.stages
+    assert (filter_stats.items_in, filter_stats.items_out) == (20, 10)
+    assert (slow.items_in, slow.items_out) == (10, 10)
+    assert slow.name == "slow_stage"
+    assert report.slowest() is slow
+    assert slow.wall_time >= 0.02
+    assert mapped.blocked_time >= slow.wall_time
+    assert slow.blocked_time < slow.wall_time
+    assert "slow_stage" in str(report)
+    assert report.as_dict()["stages"][1]["items_out"] == 10
+
+
+def test_value_result_and_eager_stage():
+    result, report = instrumented_pipeline(
+        range(10), sorted, lambda x: reduce(lambda a, b: a + b, x, 0)
+    )
+    assert result == 45
+    assert report.finished
+    assert [stage.items_in for stage in report.stages] == [10, 10]
+    assert [stage.items_out for stage in report.stages] == [10, 1]
+
+
+def test_memory_and_hook():
+    reports = []
+    result, report = instrumented_pipeline(
+        range(3),
+        big_stage,
+        Map(len),
+        hook=reports.append,
+        interval=1e-9,
+        trace_memory=True,
+    )
+    assert collect(result) == [100_000] * 3
+    assert report.stages[0].peak_memory >= 100_000 * 8
+    assert reports[-1] is report and len(reports) >= 2
+
+
+def test_early_stop_stops_tracing():
+    result, report = instrumented_pipeline(range(10), Map(abs), trace_memory=True)
+    assert tracemalloc.is_tracing()
+    assert next(result) == 0
+    result.close()
+    assert not tracemalloc.is_tracing()
+
+    result, report = instrumented_pipeline(range(10), Map(abs), trace_memory=True)
+    next(result)
+    del result  # dropped without exhausting
+    assert not tracemalloc.is_tracing()
+    assert not report.finished
+
+    tracemalloc.start()  # tracing of the caller is kept
+    try:
+        result, report = instrumented_pipeline(iter(range(10)), trace_memory=True)
+        result.close()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_batched_source():
+    operations = (Map(lambda x: x * 2), Filter(lambda x: x > 2), sorted)
+    expect = collect(pipeline(generator(range(5), batch_size=2), *operations))
+    result, report = instrumented_pipeline(
+        generator(range(5), batch_size=2), *operations
+    )
+    assert collect(result) == expect == [4, 6, 8]
+    assert [stage.items_in for stage in report.stages] == [5, 5, 3]
+    assert [stage.items_out for stage in report.stages] == [5, 3, 1]  # a list value
+
+    result, report = instrumented_pipeline(
+        generator(range(5), batch_size=2), Map(lambda x: x * 2)
+    )
+    assert collect(result) == [0, 2, 4, 6, 8]
+    assert report.stages[0].items_out == 5
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="interval"):
+        instrumented_pipeline([], interval=0)
+    result, report = instrumented_pipeline(iter([1, 2]))
+    assert list(result) == [1, 2] and isinstance(report, PipelineReport)
@@ -0,0 +1,169 @@
+import pytest
+import random
+import statistics
+from project.task2.generator import generator, pipeline, collect
+from project.task2.operators import Map
+from project.task2.windows import (
+    Window,
+    TumblingWindow,
+    SlidingWindow,
+    SessionWindow,
+    GroupBy,
+    Accumulator,
+)
+
+
+def test_tumbling_count():
+    result = collect(pipeline(generator(range(7)), TumblingWindow(3)))
+    assert result == [
+        {"start": 0, "end": 3, "count": 3, "sum": 3, "mean": 1, "min": 0, "max": 2},
+        {"start": 3, "end": 6, "count": 3, "sum": 12, "mean": 4, "min": 3, "max": 5},
+        {"start": 6, "end": 7, "count": 1, "sum": 6, "mean": 6, "min": 6, "max": 6},
+    ]
+
+
+def test_tumbling_time():
+    events = [(0.5, 1), (1.0, 2), (2.5, 3), (7.0, 4)]
+    window = TumblingWindow(
+        2, ("count", "sum"), value=lambda e: e[1], timestamp=lambda e: e[0]
+    )
+    assert list(window(events)) == [
+        {"start": 0, "end": 2, "count": 2, "sum": 3},
+        {"start": 2, "end": 4, "count": 1, "sum": 3},
+        {"start": 6, "end": 8, "count": 1, "sum": 4},
+    ]
+
+
+def test_tumbling_incremental():
+    def source():
+        for i in range(4):
+            yield i
+        raise RuntimeError("the source is broken")
+
+    results = pipeline(generator(source()), TumblingWindow(2, ("sum",)))
+    assert next(results) == {"start": 0, "end": 2, "sum": 1}  # closed by element 2
+    with pytest.raises(RuntimeError):
+        next(results)
+
+
+@pytest.mark.parametrize("size, step", [(3, 1), (4, 2), (2, 3), (1, 1)])
+def test_sliding(size, step):
+    data = [random.Random(size).randint(-50, 50) for _ in range(30)]
+    aggregates = ("count", "sum", "min", "max", "p50")
+    result = list(SlidingWindow(size, step, aggregates)(data))
+    expect = [
+        {
+            "start": start,
+            "end": start + size,
+            "count": size,
+            "sum": sum(data[start : start + size]),
+            "min": min(data[start : start + size]),
+            "max": max(data[start : start + size]),
+            "p50": statistics.median(data[start : start + size]),
+        }
+        for start in range(0, len(data) - size + 1, step)
+    ]
+    assert result == expect
+
+
+def test_session():
+    clicks = [1, 2, 3, 10, 11, 30]
+    window = SessionWindow(gap=5, timestamp=lambda t: t, aggregates=("count",))
+    assert list(window(clicks)) == [
+        {"start": 1, "end": 3, "count": 3},
+        {"start": 10, "end": 11, "count": 2},
+        {"start": 30, "end": 30, "count": 1},
+    ]
+    assert list(window([])) == []
+
+
+def test_quantiles_approximate():
+    data = list(range(100_000))
+    random.Random(1).shuffle(data)
+    (result,) = TumblingWindow(len(data), ("p50", "p99", "min", "max"))(data)
+    assert result["min"] == 0 and result["max"] == 99_999
+    assert result["p50"] == pytest.approx(50_000, rel=0.05)
+    assert result["p99"] == pytest.approx(99_000, rel=0.01)
+
+
+def test_bounded_memory():
+    accumulator = Accumulator(("p50",), sample_size=64)
+    for i in range(10_000):
+        accumulator.add(i)
+    assert len(accumulator.sample) == 64
+    assert accumulator.count == 10_000
+
+
+def test_no_sample_without_quantiles():
+    accumulator = Accumulator(("count", "sum", "min", "max", "mean"))
+    for i in range(5000):
+        accumulator.add(i)
+    assert accumulator.sample == [] and accumulator._random is None
+    assert accumulator.result()["max"] == 4999
+
+    accumulator = Accumulator(("p50",), sample_size=8)
+    for i in range(8):
+        accumulator.add(i)
+    assert accumulator._random is None  # the sample isn't full yet
+    accumulator.add(8)
+    assert accumulator._random is not None and len(accumulator.sample) == 8
+
+
+def test_group_by():
+    words = ["apple", "bob", "avocado", "banana", "cherry"]
+    result = collect(
+        pipeline(generator(words), GroupBy(lambda w: w[0], ("count", "max"), value=len))
+    )
+    assert result == [
+        {"key": "a", "count": 2, "max": 7},
+        {"key": "b", "count": 2, "max": 6},
+        {"key": "c", "count": 1, "max": 6},
+    ]
+
+
+def test_group_by_window():
+    events = [("x", 1), ("y", 10), ("x", 2), ("x", 3), ("y", 20)]
+    stage = GroupBy(
+        lambda e: e[0], window=TumblingWindow(2, ("sum",), value=lambda e: e[1])
+    )
+    assert list(stage(events)) == [
+        {"key": "x", "start": 0, "end": 2, "sum": 3},
+        {"key": "x", "start": 2, "end": 3, "sum": 3},
+        {"key": "y", "start": 0, "end": 2, "sum": 30},
+    ]
+
+
+def test_batched_source():
+    result = pipeline(
+        generator(range(10), batch_size=4), Map(abs), TumblingWindow(5, ("sum",))
+    )
+    assert collect(result) == [
+        {"start": 0, "end": 5, "sum": 10},
+        {"start": 5, "end": 10, "sum": 35},
+    ]
+
+
+def test_incomplete_window_fails_on_creation():
+    class Incomplete(Window):
+        def _start(self):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+    with pytest.raises(TypeError):
+        Window()
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: TumblingWindow(0),
+        lambda: SlidingWindow(3, 0),
+        lambda: SessionWindow(-1, abs),
+        lambda: TumblingWindow(3, ("median",)),
+        lambda: GroupBy(abs, ("p101",)),
+    ],
+)
+def test_errors(factory):
+    with pytest.raises(ValueError):
+        factory()